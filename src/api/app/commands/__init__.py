@@ -0,0 +1,4 @@
+"""
+    Management commands.
+    Run from API root directory as modules, e.g: `python -m app.commands.compress_lecture_contents`.
+"""
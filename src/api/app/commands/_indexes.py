@@ -0,0 +1,33 @@
+"""
+    Indexes utils for management commands.
+"""
+
+from sqlalchemy import Connection, text
+
+
+def create_index_concurrently(
+    connection: Connection, name: str, definition: str, unique: bool = False
+) -> bool:
+    """
+    Creates index concurrently (without locking writes), returns false if it already exists.
+    Index left invalid by failed concurrent build is dropped and built again.
+    Connection should be in autocommit mode, as concurrent build can not run in transaction.
+    :param definition: Index definition after it`s name, e.g. `ON users (email)`.
+    """
+    is_valid = connection.execute(
+        text(
+            "SELECT pg_index.indisvalid FROM pg_index "
+            "JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+            "WHERE pg_class.relname = :name"
+        ),
+        {"name": name},
+    ).scalar()
+    if is_valid:
+        return False
+    if is_valid is not None:
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+    unique_ = "UNIQUE " if unique else ""
+    connection.execute(
+        text(f"CREATE {unique_}INDEX CONCURRENTLY IF NOT EXISTS {name} {definition}")
+    )
+    return True
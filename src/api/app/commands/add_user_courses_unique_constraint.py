@@ -0,0 +1,70 @@
+"""
+    Adds unique constraint of user purchased courses (user and course) to existing database,
+    as purchase relies on it (`INSERT ... ON CONFLICT ON CONSTRAINT`), and it is created
+    only with new tables. Removes duplicate purchases (keeps first one), builds unique index
+    concurrently (without locking writes), and adds constraint using that index.
+    Safe to run again.
+"""
+
+import argparse
+
+from sqlalchemy import Connection, text
+
+from app.commands._indexes import create_index_concurrently
+from app.database.core import engine
+
+_CONSTRAINT_NAME = "uq_user_courses_user_id_course_id"
+
+
+def remove_duplicates(connection: Connection) -> int:
+    """Removes duplicate purchases of the course by the user (keeps first one)."""
+    return connection.execute(
+        text(
+            "DELETE FROM user_courses duplicate USING user_courses first "
+            "WHERE duplicate.user_id = first.user_id "
+            "AND duplicate.course_id = first.course_id "
+            "AND (duplicate.time_created, duplicate.id) > (first.time_created, first.id)"
+        )
+    ).rowcount
+
+
+def add_unique_constraint(connection: Connection) -> bool:
+    """Adds unique constraint, returns false if it already exists."""
+    exists = connection.execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = :name"),
+        {"name": _CONSTRAINT_NAME},
+    ).scalar()
+    if exists:
+        return False
+    create_index_concurrently(
+        connection,
+        _CONSTRAINT_NAME,
+        "ON user_courses (user_id, course_id)",
+        unique=True,
+    )
+    connection.execute(
+        text(
+            f"ALTER TABLE user_courses ADD CONSTRAINT {_CONSTRAINT_NAME} "
+            f"UNIQUE USING INDEX {_CONSTRAINT_NAME}"
+        )
+    )
+    return True
+
+
+def main() -> None:
+    """Runs migration."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    # Concurrent index build can not run in transaction.
+    with engine.execution_options(isolation_level="AUTOCOMMIT").connect() as connection:
+        removed = remove_duplicates(connection)
+        added = add_unique_constraint(connection)
+    print(
+        f"Done, removed {removed} duplicate purchases, "
+        f"constraint was {'added' if added else 'already added'}."
+    )
+
+
+if __name__ == "__main__":
+    main()
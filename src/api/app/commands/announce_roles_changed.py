@@ -0,0 +1,29 @@
+"""
+    Announces roles change to all workers (Redis pub/sub).
+    Should be run after roles (or roles of users) are changed in the database,
+    so workers reload roles permissions snapshot and users immediately instead of after TTL.
+"""
+
+import argparse
+import asyncio
+
+from app.services import permissions, users_cache
+
+
+async def _announce() -> None:
+    """Clears shared users cache, and announces roles change (workers clears local caches)."""
+    await users_cache.invalidate_all()
+    await permissions.publish_roles_changed()
+
+
+def main() -> None:
+    """Runs announcement."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    asyncio.run(_announce())
+    print("Done, announced roles change.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+    Makes `courses.published_at` not null (backfill).
+    Sets publication date of courses without it to their creation date,
+    and adds NOT NULL constraint, as listing keyset pagination can not compare NULLs.
+    Safe to run again.
+"""
+
+import argparse
+
+from sqlalchemy import text
+
+from app.database.core import engine
+
+
+def main() -> None:
+    """Runs backfill."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    with engine.begin() as connection:
+        updated = connection.execute(
+            text(
+                "UPDATE courses SET published_at = time_created "
+                "WHERE published_at IS NULL"
+            )
+        ).rowcount
+        connection.execute(
+            text("ALTER TABLE courses ALTER COLUMN published_at SET NOT NULL")
+        )
+    print(f"Done, set publication date of {updated} courses.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+    Converts lectures content to compressed storage (backfill).
+    Converts text column to `bytea` (if it is not yet converted),
+    and compresses existing rows in batches with configured format.
+    Safe to run again (already compressed rows are skipped).
+"""
+
+import argparse
+
+from sqlalchemy import Connection, LargeBinary, String, bindparam, column, table, text
+
+from app.config import get_settings
+from app.database.compression import compress, is_compression_enabled, is_compressed
+from app.database.core import engine
+
+# Raw table, to read and write stored values without column type processing.
+_course_lectures = table(
+    "course_lectures",
+    column("id", String),
+    column("content", LargeBinary),
+)
+
+
+def convert_column_to_binary(connection: Connection) -> bool:
+    """Converts content text column to `bytea`, returns false if it is already converted."""
+    data_type = connection.execute(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'course_lectures' AND column_name = 'content'"
+        )
+    ).scalar_one()
+    if data_type == "bytea":
+        return False
+    connection.execute(
+        text(
+            "ALTER TABLE course_lectures "
+            "ALTER COLUMN content TYPE bytea USING convert_to(content, 'UTF8')"
+        )
+    )
+    return True
+
+
+def compress_batch(
+    connection: Connection, after_id: str | None, batch_size: int
+) -> tuple[str | None, int]:
+    """
+    Compresses batch of rows after given ID (ordered by ID).
+    Returns last processed ID (None if there is no more rows) and count of compressed rows.
+    """
+    query = _course_lectures.select().order_by(_course_lectures.c.id).limit(batch_size)
+    if after_id is not None:
+        query = query.where(_course_lectures.c.id > after_id)
+    rows = connection.execute(query).all()
+    if not rows:
+        return None, 0
+
+    compressed = [
+        {"row_id": row.id, "row_content": compress(bytes(row.content).decode("utf-8"))}
+        for row in rows
+        if not is_compressed(bytes(row.content))
+    ]
+    if compressed:
+        connection.execute(
+            _course_lectures.update()
+            .where(_course_lectures.c.id == bindparam("row_id"))
+            .values(content=bindparam("row_content")),
+            compressed,
+        )
+    return rows[-1].id, len(compressed)
+
+
+def main() -> None:
+    """Runs backfill."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    if not is_compression_enabled():
+        parser.error(
+            "Compression is disabled, set `DATABASE_LECTURE_CONTENT_COMPRESSION` first!"
+        )
+
+    with engine.begin() as connection:
+        if convert_column_to_binary(connection):
+            print("Converted `course_lectures.content` column to `bytea`.")
+
+    after_id, total = None, 0
+    while True:
+        with engine.begin() as connection:
+            after_id, compressed = compress_batch(connection, after_id, args.batch_size)
+        if after_id is None:
+            break
+        total += compressed
+        print(f"Compressed {total} lectures content (last ID {after_id}).")
+    print(
+        f"Done, compressed {total} lectures content "
+        f"with {get_settings().database_lecture_content_compression}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+    Creates indexes of hot lookup columns on existing database (they are created only with new tables):
+    courses listings indexes, lectures by course, unique users by SSO user ID,
+    and unique user purchased courses.
+    Removes duplicates before creating unique indexes: duplicate users (by SSO user ID) are merged
+    into first one (courses and purchases are moved to it), duplicate purchases are removed.
+    Indexes are built concurrently (without locking writes). Safe to run again
+    (also to rebuild index left invalid, if it is failed on concurrent write of duplicate).
+"""
+
+import argparse
+
+from sqlalchemy import Connection, text
+
+from app.commands._indexes import create_index_concurrently
+from app.commands.add_user_courses_unique_constraint import (
+    add_unique_constraint as add_user_courses_unique_constraint,
+    remove_duplicates as remove_user_courses_duplicates,
+)
+from app.database.core import engine
+
+# Index name -> (definition, is unique), same as in the models.
+_INDEXES = {
+    "ix_courses_published_at_id": ("ON courses (published_at, id)", False),
+    "ix_courses_price_id": ("ON courses (price, id)", False),
+    "ix_courses_title_id": ("ON courses (title, id)", False),
+    "ix_courses_active_public_published_at_id": (
+        "ON courses (published_at, id) WHERE is_active AND is_public",
+        False,
+    ),
+    "ix_courses_active_public_price_id": (
+        "ON courses (price, id) WHERE is_active AND is_public",
+        False,
+    ),
+    "ix_courses_active_public_title_id": (
+        "ON courses (title, id) WHERE is_active AND is_public",
+        False,
+    ),
+    "ix_course_lectures_course_id": ("ON course_lectures (course_id)", False),
+    "ix_users_sso_oauth_user_id": ("ON users (sso_oauth_user_id)", True),
+}
+
+# Duplicate users (by SSO user ID), with first user that they are merged into.
+_DUPLICATE_USERS = (
+    "WITH duplicates AS ("
+    "SELECT id, first_value(id) OVER ("
+    "PARTITION BY sso_oauth_user_id ORDER BY time_created, id"
+    ") AS first_id FROM users"
+    ") "
+)
+
+
+def merge_duplicate_users(connection: Connection) -> int:
+    """Merges users with same SSO user ID into first one, returns count of removed users."""
+    for table, column in (("courses", "owner_id"), ("user_courses", "user_id")):
+        connection.execute(
+            text(
+                f"{_DUPLICATE_USERS}"
+                f"UPDATE {table} SET {column} = duplicates.first_id FROM duplicates "
+                f"WHERE {table}.{column} = duplicates.id "
+                "AND duplicates.id <> duplicates.first_id"
+            )
+        )
+    return connection.execute(
+        text(
+            f"{_DUPLICATE_USERS}"
+            "DELETE FROM users USING duplicates "
+            "WHERE users.id = duplicates.id AND duplicates.id <> duplicates.first_id"
+        )
+    ).rowcount
+
+
+def main() -> None:
+    """Runs migration."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+
+    with engine.begin() as connection:
+        merged_users = merge_duplicate_users(connection)
+        removed_purchases = remove_user_courses_duplicates(connection)
+
+    # Concurrent index build can not run in transaction.
+    created = []
+    with engine.execution_options(isolation_level="AUTOCOMMIT").connect() as connection:
+        for name, (definition, unique) in _INDEXES.items():
+            if create_index_concurrently(connection, name, definition, unique=unique):
+                created.append(name)
+        if add_user_courses_unique_constraint(connection):
+            created.append("uq_user_courses_user_id_course_id")
+    print(
+        f"Done, merged {merged_users} duplicate users, "
+        f"removed {removed_purchases} duplicate purchases, "
+        f"created indexes: {', '.join(created) or 'none'}."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@
 
 # Logs.
 import logging
+from typing import Literal
 
 # Pydantic abstract class with data types.
 from pydantic import BaseSettings, PostgresDsn, RedisDsn, EmailStr, conint
@@ -34,6 +35,25 @@ class Settings(BaseSettings):
     database_max_overflow: int = 0
     # Pool size for database pool.
     database_pool_size: int = 20
+    # Read replica connection string (DSN), if not set all queries goes to the primary.
+    # May be same as primary DSN for testing.
+    database_replica_dsn: PostgresDsn | None = None
+    # Seconds user sticks to the primary after writing (to read own writes with replication lag),
+    # other workers are told about that by signed cookie.
+    database_replica_read_your_writes_window: int = 5
+    # Connections held longer than that (in seconds) are reported with route that holds them.
+    database_pool_held_connection_threshold: float = 5.0
+    # Interval (in seconds) of writing database pool metrics to the log, 0 to disable.
+    database_pool_metrics_log_interval: int = 60
+    # Max SQL statements per request, routes exceeding it are reported (debug only).
+    database_statements_per_request_budget: int = 5
+    # Compression of lectures content (none, zlib, zstd), stores content as `bytea`.
+    # Existing text column should be converted with `python -m app.commands.compress_lecture_contents`.
+    database_lecture_content_compression: Literal["none", "zlib", "zstd"] = "none"
+    # Content smaller than that (in bytes) is stored without compression.
+    database_lecture_content_compression_min_size: int = 256
+    # Max total length of decompressed content cached in each worker.
+    database_lecture_content_cache_max_size: int = 32 * 1024 * 1024
 
     # Mail.
 
@@ -82,11 +102,52 @@ class Settings(BaseSettings):
     cache_dsn: RedisDsn
     # Encoding for Redis.
     cache_encoding: str = "utf-8"
+    # Seconds to wait for Redis (connect or response), so requests do not hang while it is down.
+    cache_timeout: float = 1.0
+
+    # Permissions.
+
+    # Seconds roles permissions snapshot is kept in each worker,
+    # if role change announcement (Redis pub/sub) is lost.
+    permissions_cache_ttl: int = 300
+
+    # Users cache (authentication).
+
+    # Seconds user is cached in each worker (may be stale for that time if pub/sub is lost).
+    users_cache_local_ttl: int = 30
+    # Max users cached in each worker.
+    users_cache_local_max_size: int = 10_000
+    # Seconds user is cached in Redis.
+    users_cache_ttl: int = 300
 
     # Requests limiter.
 
-    # TODO 07.31.22: Allow to handle requests limiter disable better, and do not connect to Redis if not required.
+    # If false, requests are not limited and Redis is not connected by limiter.
     requests_limiter_enabled: bool = True
+    # Seconds to wait for Redis (connect or response), before using in-memory limiter.
+    requests_limiter_redis_timeout: float = 0.5
+    # Max seconds between reconnect attempts while Redis is unavailable.
+    requests_limiter_reconnect_backoff_max: float = 30.0
+    # Max keys counted by in-memory limiter in each worker (while Redis is unavailable).
+    requests_limiter_fallback_max_keys: int = 10_000
+    # Approximate limiter mode (`RateLimiter(mode="approximate")`):
+    # milliseconds between reconciliations with Redis,
+    # and count of workers sharing the budget (each worker leases 1 / workers of it).
+    # 0 assumes `workers` of `gunicorn.conf.py` (2 * CPU + 1), set actual count otherwise
+    # (e.g. 1 for single process uvicorn), as too small leases means more Redis round trips.
+    requests_limiter_approximate_sync_interval: int = 250
+    requests_limiter_approximate_workers: int = 0
+    # Limiter checks of concurrent requests are sent to Redis in batches (pipelines):
+    # milliseconds to wait for more checks (while previous batch is in flight),
+    # and max checks in batch (1 to disable batching).
+    requests_limiter_batch_window: float = 0.2
+    requests_limiter_batch_max_size: int = 100
+
+    # Internal metrics.
+
+    # If true, will expose internal metrics (database pools, etc.) with `/internal/metrics`
+    # (to administrators only, who have permission to manage roles).
+    internal_metrics_enabled: bool = False
 
     # OpenAPI.
 
@@ -120,8 +181,29 @@ class Settings(BaseSettings):
 
     # Security.
     security_access_tokens_ttl: int = 7776000
+    # If true, role ID is embedded into access tokens and used for permission checks,
+    # without querying user (role changes are applied only for newly issued tokens).
+    security_access_tokens_role_id_claim: bool = False
+    # Max verified tokens cached in each worker (to not decode same token again), 0 to disable.
+    security_tokens_cache_max_size: int = 10_000
+    # Expected count of revoked (not yet expired) tokens, and false positive rate at that count,
+    # for revoked tokens filter in each worker (false positives are confirmed with Redis).
+    security_tokens_revocation_filter_capacity: int = 100_000
+    security_tokens_revocation_filter_error_rate: float = 0.001
+    # If true, tokens are accepted (with warning) when revocation can not be checked at all:
+    # filter is not loaded yet (worker started while Redis is down) and Redis is unavailable.
+    # Tokens that hit loaded filter are rejected if Redis is unavailable regardless.
+    security_tokens_revocation_fail_open: bool = True
     security_tokens_issuer: str = "localhost"
+    # Current signing key: secret for HMAC algorithms (HS*), or PEM private key for asymmetric ones
+    # (RS*/PS*/ES*/EdDSA, requires `cryptography`, public keys are exposed with `/auth/keys`).
     security_tokens_secret_key: str = "RANDOM_SECRET_KEY_TO_BE_SECURE"
+    security_tokens_algorithm: str = "HS256"
+    # ID of the current key (`kid` header), should be changed when key is rotated.
+    security_tokens_key_id: str = "default"
+    # Rotated out keys by their ID, tokens signed with them are still accepted (same algorithm),
+    # for asymmetric algorithms public keys are enough.
+    security_tokens_previous_keys: dict[str, str] = {}
 
 
 def _init_gatey_client(settings: Settings) -> gatey_sdk.Client | None:
@@ -2,5 +2,5 @@
     Database module for working with database ORM.
 """
 
-from . import core, crud, dependencies, models
-from .dependencies import get_db
+from . import compression, core, crud, dependencies, instrumentation, models, routing
+from .dependencies import get_db, get_async_db
@@ -0,0 +1,156 @@
+"""
+    Compressed text storage for the database (lectures content).
+    Provides column type that compresses text (zlib or zstd) on write and decompresses on read,
+    with bounded in-process cache of decompressed values (for hot rows, like lectures content).
+
+    Stored value is format marker (NUL byte and format byte) followed by payload.
+    Value without marker is treated as raw UTF-8 (rows converted from text column).
+    Compression is opt-in (`database_lecture_content_compression`), as it stores column as `bytea`,
+    existing text column should be converted with `python -m app.commands.compress_lecture_contents`.
+"""
+
+import hashlib
+import zlib
+from collections import OrderedDict
+
+from sqlalchemy import LargeBinary, Text
+from sqlalchemy.types import TypeDecorator
+
+from app.config import get_settings
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_MARKER = b"\x00"
+_FORMAT_RAW = b"r"
+_FORMAT_ZLIB = b"z"
+_FORMAT_ZSTD = b"s"
+_FORMATS = {"zlib": _FORMAT_ZLIB, "zstd": _FORMAT_ZSTD}
+
+
+class DecompressedCache:
+    """
+    LRU cache of decompressed values, bounded by size.
+    Keyed by digest of stored (compressed) value, so compressed value itself is not held.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        :param max_size: Max total length of cached decompressed values.
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._values: OrderedDict[bytes, str] = OrderedDict()
+
+    def get(self, stored: bytes) -> str | None:
+        """Returns decompressed value from cache, or None if not cached."""
+        key = self._get_key(stored)
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._values.move_to_end(key)
+        return value
+
+    def put(self, stored: bytes, value: str) -> None:
+        """Caches decompressed value, evicting least recently used ones."""
+        key = self._get_key(stored)
+        if len(value) > self.max_size or key in self._values:
+            return
+        self._values[key] = value
+        self.size += len(value)
+        while self.size > self.max_size:
+            _, evicted = self._values.popitem(last=False)
+            self.size -= len(evicted)
+
+    @staticmethod
+    def _get_key(stored: bytes) -> bytes:
+        """Returns fixed-size key of stored value."""
+        return hashlib.blake2b(stored, digest_size=16).digest()
+
+
+_cache = DecompressedCache(get_settings().database_lecture_content_cache_max_size)
+
+
+class CompressedText(TypeDecorator):
+    """
+    Text column that is stored compressed (as `bytea`) if compression is enabled,
+    otherwise it is plain text column.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if is_compression_enabled():
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or not is_compression_enabled():
+            return value
+        return compress(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return decompress(bytes(value))
+
+
+def is_compression_enabled() -> bool:
+    """Returns true if compressed storage is enabled."""
+    return get_settings().database_lecture_content_compression != "none"
+
+
+def compress(value: str) -> bytes:
+    """Returns value compressed with configured format (raw if it is too small)."""
+    settings = get_settings()
+    data = value.encode("utf-8")
+    if len(data) < settings.database_lecture_content_compression_min_size:
+        return _MARKER + _FORMAT_RAW + data
+
+    format_ = _FORMATS[settings.database_lecture_content_compression]
+    if format_ == _FORMAT_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd compression requires `zstandard` to be installed!")
+        return _MARKER + format_ + zstandard.ZstdCompressor().compress(data)
+    return _MARKER + format_ + zlib.compress(data)
+
+
+def decompress(stored: bytes) -> str:
+    """Returns decompressed value (cached), supports any format and raw UTF-8 without marker."""
+    if not stored.startswith(_MARKER):
+        return stored.decode("utf-8")
+    format_, payload = stored[1:2], stored[2:]
+    if format_ == _FORMAT_RAW:
+        return payload.decode("utf-8")
+
+    value = _cache.get(stored)
+    if value is not None:
+        return value
+    if format_ == _FORMAT_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd decompression requires `zstandard` to be installed!")
+        data = zstandard.ZstdDecompressor().decompress(payload)
+    elif format_ == _FORMAT_ZLIB:
+        data = zlib.decompress(payload)
+    else:
+        raise ValueError(f"Unknown compressed value format {format_!r}!")
+    value = data.decode("utf-8")
+    _cache.put(stored, value)
+    return value
+
+
+def is_compressed(stored: bytes) -> bool:
+    """Returns true if stored value is already written with format marker."""
+    return stored.startswith(_MARKER)
+
+
+def get_cache() -> DecompressedCache:
+    """Returns cache of decompressed values."""
+    return _cache
@@ -7,9 +7,19 @@ from app.config import Settings
 
 # Imports.
 from sqlalchemy import MetaData, create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
+
+from . import instrumentation
+from .routing import RoutingSession
+
+
+def _build_async_dsn(dsn: str) -> str:
+    """Returns database DSN with asyncio driver (asyncpg) for the async engine."""
+    _, _, dsn_without_scheme = str(dsn).partition("://")
+    return f"postgresql+asyncpg://{dsn_without_scheme}"
+
 
 # Database engine.
 settings = Settings()
@@ -19,13 +29,57 @@ engine = create_engine(
     max_overflow=settings.database_max_overflow,
     pool_timeout=settings.database_pool_timeout,
     pool_recycle=settings.database_pool_recycle,
-    poolclass=QueuePool,
+    poolclass=instrumentation.InstrumentedQueuePool,
 )
 metadata = MetaData(bind=engine)
 
+# Async database engine (asyncio, used by API routers to not block event loop).
+# Pool is same as for sync engine, but own (connections are not shared between engines).
+async_engine = create_async_engine(
+    url=_build_async_dsn(settings.database_dsn),
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
+    poolclass=instrumentation.InstrumentedAsyncAdaptedQueuePool,
+)
+
+# Async read replica engine (optional), used by async session for reads.
+async_replica_engine = (
+    create_async_engine(
+        url=_build_async_dsn(settings.database_replica_dsn),
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        poolclass=instrumentation.InstrumentedAsyncAdaptedQueuePool,
+    )
+    if settings.database_replica_dsn
+    else None
+)
+
+# Pool metrics (checkout wait time, saturation, connections held for too long).
+instrumentation.register_engine("primary", engine)
+instrumentation.register_engine("primary_async", async_engine.sync_engine)
+if async_replica_engine is not None:
+    instrumentation.register_engine("replica_async", async_replica_engine.sync_engine)
+
 # Base, session from core.
+# Sessions does not expire on commit, as written rows are already up to date
+# (server generated values are returned with INSERT/UPDATE, see `TimestampMixin`).
 SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, expire_on_commit=True, bind=engine
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+# Notice that async session also should not expire on commit,
+# as there is no implicit IO (lazy loading) allowed under asyncio.
+# Reads are routed to the replica, if it is configured.
+AsyncSessionLocal = async_sessionmaker(
+    autoflush=False,
+    expire_on_commit=False,
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica_bind=async_replica_engine.sync_engine if async_replica_engine else None,
 )
 Base = declarative_base(metadata=metadata)
 
@@ -2,6 +2,6 @@
     Database CRUD utils.
 """
 
-from . import user, user_course, course, course_lecture
+from . import user, user_course, user_role, course, course_lecture
 
-__all__ = ["user", "user_course", "course", "course_lecture"]
\ No newline at end of file
+__all__ = ["user", "user_course", "user_role", "course", "course_lecture"]
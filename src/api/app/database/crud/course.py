@@ -2,19 +2,47 @@
     Course CRUD utils for the database.
 """
 
+import json
+import uuid
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from enum import Enum
 from math import ceil
+from sqlalchemy import Label, Select, func, select, tuple_
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models.course import Course, CourseDifficulty
 
 
+class CourseSortOrder(Enum):
+    """
+    Sort order of the courses listing.
+    Each order is (sort key, id) pair backed by an index, so keyset (cursor) pagination is stable.
+    """
+
+    published_at = "published_at"  # Newest first.
+    price = "price"  # Cheapest first.
+    title = "title"  # Alphabetical.
+
+
 def get_by_id(db: Session, course_id: str) -> Course:
     """Returns course by it`s ID."""
-    return db.query(Course).filter(Course.id == course_id).first()
+    return db.execute(_select_by_id(course_id)).scalars().first()
+
+
+async def get_by_id_async(db: AsyncSession, course_id: str) -> Course:
+    """Returns course by it`s ID (asyncio)."""
+    return (await db.execute(_select_by_id(course_id))).scalars().first()
 
 
 def get_by_name(db: Session, course_name: str) -> Course:
     """Returns course by it`s name."""
-    return db.query(Course).filter(Course.name == course_name).first()
+    return db.execute(_select_by_name(course_name)).scalars().first()
+
+
+async def get_by_name_async(db: AsyncSession, course_name: str) -> Course:
+    """Returns course by it`s name (asyncio)."""
+    return (await db.execute(_select_by_name(course_name))).scalars().first()
 
 
 def get_all_filtered_paginated(
@@ -26,35 +54,89 @@ def get_all_filtered_paginated(
     difficulty: CourseDifficulty | None = None,
     per_page: int = 5,
     page: int = 1,
-) -> tuple[list[Course], int, int]:
-    """Returns all courses by specified parameters."""
+    sort: CourseSortOrder = CourseSortOrder.published_at,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> tuple[list[Course], int | None, int | None, str | None]:
+    """
+    Returns all courses by specified parameters, with cursor for the next page.
+    If cursor is passed, page is ignored and courses after that cursor are returned.
+    Total is selected within same query, or skipped (None) if `include_total` is false.
+    :raises ValueError: If pagination parameters or cursor are invalid.
+    """
     if per_page < 1 or page < 1:
         raise ValueError("per_page and page should be >= 1")
 
-    query = db.query(Course)
-    if active_only:
-        query = query.filter(Course.is_active == active_only)
-    if public_only:
-        query = query.filter(Course.is_public == public_only)
-    if max_price:
-        query = query.filter(Course.price <= max_price)
-    if difficulty:
-        query = query.filter(Course.difficulty == difficulty.value)
-    if language:
-        pass
+    query = _select_filtered(public_only, active_only, language, max_price, difficulty)
+    paginated_query = _paginate(query, per_page, page, sort, cursor)
+    if include_total:
+        paginated_query = paginated_query.add_columns(_select_total(query))
+
+    # Paginate and return query courses (with total courses for that query).
+    rows = db.execute(paginated_query).all()
+    courses = [row[0] for row in rows]
+    courses, next_cursor = _split_next_cursor(courses, per_page, sort)
 
     # Total courses in database for that query (without pagination).
-    courses_total = query.count()
+    # Page with no courses has no row to carry total, so it requires separate query.
+    courses_total, max_page = None, None
+    if include_total:
+        if rows:
+            courses_total = rows[0][1]
+        elif cursor is None and page == 1:
+            courses_total = 0
+        else:
+            courses_total = db.execute(_select_count(query)).scalar_one()
+        max_page = ceil(courses_total / per_page)
+
+    return courses, courses_total, max_page, next_cursor
+
+
+async def get_all_filtered_paginated_async(
+    db: AsyncSession,
+    public_only: bool = True,
+    active_only: bool = True,
+    language: str | None = None,
+    max_price: int | None = None,
+    difficulty: CourseDifficulty | None = None,
+    per_page: int = 5,
+    page: int = 1,
+    sort: CourseSortOrder = CourseSortOrder.published_at,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> tuple[list[Course], int | None, int | None, str | None]:
+    """
+    Returns all courses by specified parameters (asyncio), with cursor for the next page.
+    If cursor is passed, page is ignored and courses after that cursor are returned.
+    Total is selected within same query, or skipped (None) if `include_total` is false.
+    :raises ValueError: If pagination parameters or cursor are invalid.
+    """
+    if per_page < 1 or page < 1:
+        raise ValueError("per_page and page should be >= 1")
 
-    # Calculate values.
-    max_page = ceil(courses_total / per_page)
-    page_offset = per_page * (page - 1)
+    query = _select_filtered(public_only, active_only, language, max_price, difficulty)
+    paginated_query = _paginate(query, per_page, page, sort, cursor)
+    if include_total:
+        paginated_query = paginated_query.add_columns(_select_total(query))
 
-    # Paginate and return query courses.
-    query = query.offset(offset=page_offset).limit(limit=per_page)
-    courses = query.all()
+    # Paginate and return query courses (with total courses for that query).
+    rows = (await db.execute(paginated_query)).all()
+    courses = [row[0] for row in rows]
+    courses, next_cursor = _split_next_cursor(courses, per_page, sort)
 
-    return courses, courses_total, max_page
+    # Total courses in database for that query (without pagination).
+    # Page with no courses has no row to carry total, so it requires separate query.
+    courses_total, max_page = None, None
+    if include_total:
+        if rows:
+            courses_total = rows[0][1]
+        elif cursor is None and page == 1:
+            courses_total = 0
+        else:
+            courses_total = (await db.execute(_select_count(query))).scalar_one()
+        max_page = ceil(courses_total / per_page)
+
+    return courses, courses_total, max_page, next_cursor
 
 
 def create(
@@ -69,7 +151,46 @@ def create(
     """Creates new course."""
 
     # Create new course.
-    course = Course(
+    course = _build(difficulty, owner_id, name, title, description, price)
+
+    # Apply course in database (generated values are returned with INSERT).
+    db.add(course)
+    db.commit()
+
+    return course
+
+
+async def create_async(
+    db: AsyncSession,
+    difficulty: CourseDifficulty,
+    owner_id: str,
+    name: str,
+    title: str,
+    description: str = "...",
+    price: int = 0,
+) -> Course:
+    """Creates new course (asyncio)."""
+
+    # Create new course.
+    course = _build(difficulty, owner_id, name, title, description, price)
+
+    # Apply course in database (generated values are returned with INSERT).
+    db.add(course)
+    await db.commit()
+
+    return course
+
+
+def _build(
+    difficulty: CourseDifficulty,
+    owner_id: str,
+    name: str,
+    title: str,
+    description: str,
+    price: int,
+) -> Course:
+    """Returns new (not applied) course model."""
+    return Course(
         name=name.lower().replace(" ", "-"),
         difficulty=difficulty.value,
         price=price,
@@ -78,9 +199,131 @@ def create(
         description=description,
     )
 
-    # Apply course in database.
-    db.add(course)
-    db.commit()
-    db.refresh(course)
 
-    return course
+def _select_by_id(course_id: str) -> Select:
+    """Returns query for course by it`s ID."""
+    return select(Course).where(Course.id == course_id)
+
+
+def _select_by_name(course_name: str) -> Select:
+    """Returns query for course by it`s name."""
+    return select(Course).where(Course.name == course_name)
+
+
+def _select_filtered(
+    public_only: bool,
+    active_only: bool,
+    language: str | None,
+    max_price: int | None,
+    difficulty: CourseDifficulty | None,
+) -> Select:
+    """Returns query for all courses by specified parameters (without pagination)."""
+    query = select(Course)
+    if active_only:
+        query = query.where(Course.is_active == active_only)
+    if public_only:
+        query = query.where(Course.is_public == public_only)
+    if max_price:
+        query = query.where(Course.price <= max_price)
+    if difficulty:
+        query = query.where(Course.difficulty == difficulty.value)
+    if language:
+        pass
+    return query
+
+
+def _select_count(query: Select) -> Select:
+    """Returns query for total count of rows in given query."""
+    return select(func.count()).select_from(query.subquery())
+
+
+def _select_total(query: Select) -> Label:
+    """Returns scalar subquery for total count of rows in given query, to select it as a column."""
+    return _select_count(query).scalar_subquery().label("courses_total")
+
+
+def _paginate(
+    query: Select,
+    per_page: int,
+    page: int,
+    sort: CourseSortOrder,
+    cursor: str | None,
+) -> Select:
+    """
+    Returns query ordered by sort order and paginated with keyset pagination (when cursor is passed),
+    or offset pagination otherwise. One more row than requested is selected to know if there is next page.
+    """
+    sort_column = _SORT_COLUMNS[sort]
+    descending = sort in _SORT_DESCENDING
+    if descending:
+        query = query.order_by(sort_column.desc(), Course.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Course.id.asc())
+
+    if cursor is not None:
+        sort_value, course_id = _decode_cursor(cursor, sort)
+        keyset = tuple_(sort_column, Course.id)
+        query = query.where(
+            keyset < tuple_(sort_value, course_id)
+            if descending
+            else keyset > tuple_(sort_value, course_id)
+        )
+    else:
+        query = query.offset(per_page * (page - 1))
+    return query.limit(per_page + 1)
+
+
+def _split_next_cursor(
+    courses: list[Course], per_page: int, sort: CourseSortOrder
+) -> tuple[list[Course], str | None]:
+    """Returns courses for requested page and cursor for the next page (None if that is the last page)."""
+    if len(courses) <= per_page:
+        return courses, None
+    courses = courses[:per_page]
+    return courses, _encode_cursor(courses[-1], sort)
+
+
+def _encode_cursor(course: Course, sort: CourseSortOrder) -> str:
+    """Returns opaque cursor that points after given course in given sort order."""
+    sort_value = getattr(course, _SORT_COLUMNS[sort].key)
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    cursor = json.dumps([sort.value, sort_value, course.id], separators=(",", ":"))
+    return urlsafe_b64encode(cursor.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort: CourseSortOrder) -> tuple[object, str]:
+    """
+    Returns (sort key, id) pair from opaque cursor.
+    :raises ValueError: If cursor is malformed or was issued for another sort order.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        cursor_sort, sort_value, course_id = json.loads(
+            urlsafe_b64decode(cursor + padding)
+        )
+        if cursor_sort != sort.value:
+            raise ValueError("Cursor was issued for another sort order!")
+        if sort is CourseSortOrder.published_at:
+            if not isinstance(sort_value, str):
+                raise ValueError("Invalid cursor publication date!")
+            sort_value = datetime.fromisoformat(sort_value)
+        elif sort is CourseSortOrder.price and not isinstance(sort_value, int):
+            raise ValueError("Invalid cursor price!")
+        elif sort is CourseSortOrder.title and not isinstance(sort_value, str):
+            raise ValueError("Invalid cursor title!")
+        if not isinstance(course_id, str):
+            raise ValueError("Invalid cursor course id!")
+        course_id = str(uuid.UUID(course_id))  # Raises ValueError for non UUID.
+    except (TypeError, json.JSONDecodeError, UnicodeDecodeError) as error:
+        raise ValueError("Invalid cursor!") from error
+    return sort_value, course_id
+
+
+# Sort order columns, all of them has (column, id) index on the model.
+_SORT_COLUMNS = {
+    CourseSortOrder.published_at: Course.published_at,
+    CourseSortOrder.price: Course.price,
+    CourseSortOrder.title: Course.title,
+}
+_SORT_DESCENDING = {CourseSortOrder.published_at}
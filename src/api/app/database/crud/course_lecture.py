@@ -2,18 +2,135 @@
     Course lecture CRUD utils for the database.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    ColumnElement,
+    Label,
+    Select,
+    and_,
+    case,
+    false,
+    null,
+    or_,
+    select,
+)
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.models.course import Course
 from app.database.models.course_lecture import CourseLecture
+from app.database.models.user_course import UserCourse
 
 
-def get_by_id(db: Session, course_lecture_id: str) -> CourseLecture:
-    """Returns course lecture by it`s ID."""
-    return db.query(CourseLecture).filter(CourseLecture.id == course_lecture_id).first()
+def get_by_id(
+    db: Session, course_lecture_id: str, with_content: bool = False
+) -> CourseLecture:
+    """
+    Returns course lecture by it`s ID.
+    :param with_content: If false, content is not loaded (deferred).
+    """
+    query = _select_by_id(course_lecture_id, with_content)
+    return db.execute(query).scalars().first()
+
+
+async def get_by_id_async(
+    db: AsyncSession, course_lecture_id: str, with_content: bool = False
+) -> CourseLecture:
+    """
+    Returns course lecture by it`s ID (asyncio).
+    :param with_content: If false, content is not loaded (deferred).
+    """
+    query = _select_by_id(course_lecture_id, with_content)
+    return (await db.execute(query)).scalars().first()
+
+
+def get_by_course_id(
+    db: Session, course_id: str, with_content: bool = False
+) -> list[CourseLecture]:
+    """
+    Returns course lectures by it`s course id.
+    :param with_content: If false, only metadata is loaded (content is deferred).
+    """
+    query = _select_by_course_id(course_id, with_content)
+    return db.execute(query).scalars().all()
+
 
+async def get_by_course_id_async(
+    db: AsyncSession, course_id: str, with_content: bool = False
+) -> list[CourseLecture]:
+    """
+    Returns course lectures by it`s course id (asyncio).
+    :param with_content: If false, only metadata is loaded (content is deferred).
+    """
+    query = _select_by_course_id(course_id, with_content)
+    return (await db.execute(query)).scalars().all()
 
-def get_by_course_id(db: Session, course_id: str) -> CourseLecture:
-    """Returns course lectures by it`s course id."""
-    return db.query(CourseLecture).filter(CourseLecture.course_id == course_id).all()
+
+def get_course_with_lectures(
+    db: Session,
+    user_id: str | None,
+    course_id: str | None = None,
+    course_name: str | None = None,
+) -> tuple[Course | None, list[CourseLecture], bool]:
+    """
+    Returns course by it`s ID or name, it`s lectures and is course purchased by user,
+    in one query. Lectures content is loaded only if user has access to it.
+    :param user_id: If none, means unauthorized user (course is not purchased).
+    """
+    query = _select_course_with_lectures(user_id, course_id, course_name)
+    return _unpack_course_with_lectures(db.execute(query).all())
+
+
+async def get_course_with_lectures_async(
+    db: AsyncSession,
+    user_id: str | None,
+    course_id: str | None = None,
+    course_name: str | None = None,
+) -> tuple[Course | None, list[CourseLecture], bool]:
+    """
+    Returns course by it`s ID or name, it`s lectures and is course purchased by user,
+    in one query (asyncio). Lectures content is loaded only if user has access to it.
+    :param user_id: If none, means unauthorized user (course is not purchased).
+    """
+    query = _select_course_with_lectures(user_id, course_id, course_name)
+    return _unpack_course_with_lectures((await db.execute(query)).all())
+
+
+def get_course_with_lecture(
+    db: Session,
+    user_id: str | None,
+    course_lecture_id: str,
+    course_id: str | None = None,
+    course_name: str | None = None,
+) -> tuple[Course | None, CourseLecture | None, bool]:
+    """
+    Returns course by it`s ID or name, course lecture by it`s ID (of any course),
+    and is course purchased by user, in one query.
+    Lecture content is loaded only if user has access to it.
+    :param user_id: If none, means unauthorized user (course is not purchased).
+    """
+    query = _select_course_with_lecture(
+        user_id, course_lecture_id, course_id, course_name
+    )
+    return _unpack_course_with_lecture(db.execute(query).first())
+
+
+async def get_course_with_lecture_async(
+    db: AsyncSession,
+    user_id: str | None,
+    course_lecture_id: str,
+    course_id: str | None = None,
+    course_name: str | None = None,
+) -> tuple[Course | None, CourseLecture | None, bool]:
+    """
+    Returns course by it`s ID or name, course lecture by it`s ID (of any course),
+    and is course purchased by user, in one query (asyncio).
+    Lecture content is loaded only if user has access to it.
+    :param user_id: If none, means unauthorized user (course is not purchased).
+    """
+    query = _select_course_with_lecture(
+        user_id, course_lecture_id, course_id, course_name
+    )
+    return _unpack_course_with_lecture((await db.execute(query)).first())
 
 
 def create(
@@ -26,9 +143,138 @@ def create(
         content=content, title=title, description=description, course_id=course_id
     )
 
-    # Apply course lecture in database.
+    # Apply course lecture in database (generated values are returned with INSERT).
     db.add(course_lecture)
     db.commit()
-    db.refresh(course_lecture)
 
     return course_lecture
+
+
+async def create_async(
+    db: AsyncSession, course_id: str, title: str, description="...", content="..."
+) -> CourseLecture:
+    """Creates new course lecture (asyncio)."""
+
+    # Create new course lecture.
+    course_lecture = CourseLecture(
+        content=content, title=title, description=description, course_id=course_id
+    )
+
+    # Apply course lecture in database (generated values are returned with INSERT).
+    db.add(course_lecture)
+    await db.commit()
+
+    return course_lecture
+
+
+def _select_by_id(course_lecture_id: str, with_content: bool = False) -> Select:
+    """Returns query for course lecture by it`s ID."""
+    query = select(CourseLecture).where(CourseLecture.id == course_lecture_id)
+    return query.options(undefer(CourseLecture.content)) if with_content else query
+
+
+def _select_by_course_id(course_id: str, with_content: bool = False) -> Select:
+    """Returns query for course lectures by it`s course id."""
+    query = select(CourseLecture).where(CourseLecture.course_id == course_id)
+    return query.options(undefer(CourseLecture.content)) if with_content else query
+
+
+def _select_course_with_lectures(
+    user_id: str | None, course_id: str | None, course_name: str | None
+) -> Select:
+    """Returns query for course, it`s lectures (row per lecture) and is it purchased."""
+    return (
+        _select_course(user_id, course_id, course_name)
+        .add_columns(CourseLecture, _select_accessible_content(user_id))
+        .outerjoin(CourseLecture, CourseLecture.course_id == Course.id)
+        .order_by(CourseLecture.time_created, CourseLecture.id)
+    )
+
+
+def _select_course_with_lecture(
+    user_id: str | None,
+    course_lecture_id: str,
+    course_id: str | None,
+    course_name: str | None,
+) -> Select:
+    """Returns query for course, course lecture (of any course) and is course purchased."""
+    return (
+        _select_course(user_id, course_id, course_name)
+        .add_columns(CourseLecture, _select_accessible_content(user_id))
+        .outerjoin(CourseLecture, CourseLecture.id == course_lecture_id)
+    )
+
+
+def _select_course(
+    user_id: str | None, course_id: str | None, course_name: str | None
+) -> Select:
+    """
+    Returns query for course by it`s ID or name, and is course purchased by user.
+    Purchase is joined (at most one row, as it is unique), to be selected once per row.
+    """
+    query = select(Course, _is_purchased(user_id).label("is_purchased"))
+    if user_id is not None:
+        query = query.outerjoin(
+            UserCourse,
+            and_(UserCourse.course_id == Course.id, UserCourse.user_id == user_id),
+        )
+    if course_id is not None:
+        return query.where(Course.id == course_id)
+    return query.where(Course.name == course_name)
+
+
+def _select_accessible_content(user_id: str | None) -> Label:
+    """
+    Returns lecture content column, that is NULL if content will not be shown
+    (lecture is not active, or course is not public and not purchased by user).
+    Should be selected with `_select_course` (that joins purchase).
+    """
+    is_shown = and_(
+        CourseLecture.is_active, or_(Course.is_public, _is_purchased(user_id))
+    )
+    return case((is_shown, CourseLecture.content), else_=null()).label(
+        "accessible_content"
+    )
+
+
+def _is_purchased(user_id: str | None) -> ColumnElement[bool]:
+    """Returns expression that is true if course is purchased by user (joined purchase)."""
+    if user_id is None:
+        return false()
+    return UserCourse.user_id.is_not(None)
+
+
+def _unpack_course_with_lectures(
+    rows: list,
+) -> tuple[Course | None, list[CourseLecture], bool]:
+    """Returns course, it`s lectures and is course purchased from query rows."""
+    if not rows:
+        return None, [], False
+    course, is_purchased, _, _ = rows[0]
+    lectures = [
+        _with_accessible_content(lecture, content)
+        for _, _, lecture, content in rows
+        if lecture is not None
+    ]
+    return course, lectures, is_purchased
+
+
+def _unpack_course_with_lecture(
+    row,
+) -> tuple[Course | None, CourseLecture | None, bool]:
+    """Returns course, course lecture and is course purchased from query row."""
+    if row is None:
+        return None, None, False
+    course, is_purchased, lecture, content = row
+    if lecture is not None:
+        lecture = _with_accessible_content(lecture, content)
+    return course, lecture, is_purchased
+
+
+def _with_accessible_content(
+    lecture: CourseLecture, content: str | None
+) -> CourseLecture:
+    """Sets loaded content to the lecture (deferred), if it is accessible."""
+    if content is not None:
+        set_committed_value(lecture, "content", content)
+    return lecture
@@ -2,23 +2,79 @@
     User CRUD utils for the database.
 """
 
+import uuid
+from typing import AsyncIterator, Iterator
+
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models.user import User
 
 
 def get_by_id(db: Session, user_id: str) -> User:
     """Returns user by it`s ID."""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.execute(_select_by_id(user_id)).scalars().first()
+
+
+async def get_by_id_async(db: AsyncSession, user_id: str) -> User:
+    """Returns user by it`s ID (asyncio)."""
+    return (await db.execute(_select_by_id(user_id))).scalars().first()
 
 
 def get_by_sso_oauth_user_id(db: Session, sso_oauth_user_id: str) -> User:
     """Returns user by OAuth SSO ID."""
-    return db.query(User).filter(User.sso_oauth_user_id == sso_oauth_user_id).first()
+    return db.execute(_select_by_sso_oauth_user_id(sso_oauth_user_id)).scalars().first()
+
+
+async def get_by_sso_oauth_user_id_async(
+    db: AsyncSession, sso_oauth_user_id: str
+) -> User:
+    """Returns user by OAuth SSO ID (asyncio)."""
+    query = _select_by_sso_oauth_user_id(sso_oauth_user_id)
+    return (await db.execute(query)).scalars().first()
 
 
 def get_all(db: Session) -> list[User]:
     """Returns all users."""
-    return db.query(User).all()
+    return db.execute(select(User)).scalars().all()
+
+
+async def get_all_async(db: AsyncSession) -> list[User]:
+    """Returns all users (asyncio)."""
+    return (await db.execute(select(User))).scalars().all()
+
+
+def get_page(db: Session, per_page: int, after_id: str | None = None) -> list[User]:
+    """
+    Returns page of users ordered by ID, after given user ID (keyset pagination).
+    :raises ValueError: If `after_id` is not UUID.
+    """
+    return db.execute(_select_page(per_page, after_id)).scalars().all()
+
+
+async def get_page_async(
+    db: AsyncSession, per_page: int, after_id: str | None = None
+) -> list[User]:
+    """
+    Returns page of users ordered by ID, after given user ID (asyncio).
+    :raises ValueError: If `after_id` is not UUID.
+    """
+    return (await db.execute(_select_page(per_page, after_id))).scalars().all()
+
+
+def iterate_all(db: Session, yield_per: int = 500) -> Iterator[User]:
+    """Yields all users ordered by ID, fetched with server side cursor."""
+    query = select(User).order_by(User.id).execution_options(yield_per=yield_per)
+    yield from db.execute(query).scalars()
+
+
+async def iterate_all_async(
+    db: AsyncSession, yield_per: int = 500
+) -> AsyncIterator[User]:
+    """Yields all users ordered by ID, fetched with server side cursor (asyncio)."""
+    query = select(User).order_by(User.id).execution_options(yield_per=yield_per)
+    async for user in await db.stream_scalars(query):
+        yield user
 
 
 def create(db: Session, sso_oauth_user_id: int, email: str | None = None) -> User:
@@ -27,10 +83,24 @@ def create(db: Session, sso_oauth_user_id: int, email: str | None = None) -> Use
     # Create new user.
     user = User(sso_oauth_user_id=sso_oauth_user_id, email=email)
 
-    # Apply user in database.
+    # Apply user in database (generated values are returned with INSERT).
     db.add(user)
     db.commit()
-    db.refresh(user)
+
+    return user
+
+
+async def create_async(
+    db: AsyncSession, sso_oauth_user_id: int, email: str | None = None
+) -> User:
+    """Creates new user (asyncio)."""
+
+    # Create new user.
+    user = User(sso_oauth_user_id=sso_oauth_user_id, email=email)
+
+    # Apply user in database (generated values are returned with INSERT).
+    db.add(user)
+    await db.commit()
 
     return user
 
@@ -41,3 +111,24 @@ def get_or_create(db: Session, user_id: str, email: str | None = None) -> User:
     if user is None:
         return create(db, user_id=user_id, email=email)
     return user
+
+
+def _select_by_id(user_id: str) -> Select:
+    """Returns query for user by it`s ID."""
+    return select(User).where(User.id == user_id)
+
+
+def _select_by_sso_oauth_user_id(sso_oauth_user_id: str) -> Select:
+    """Returns query for user by OAuth SSO ID."""
+    return select(User).where(User.sso_oauth_user_id == sso_oauth_user_id)
+
+
+def _select_page(per_page: int, after_id: str | None) -> Select:
+    """
+    Returns query for page of users ordered by ID, after given user ID.
+    :raises ValueError: If `after_id` is not UUID.
+    """
+    query = select(User).order_by(User.id).limit(per_page)
+    if after_id is not None:
+        query = query.where(User.id > str(uuid.UUID(after_id)))
+    return query
@@ -2,45 +2,115 @@
     User purchased course CRUD utils for the database.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Insert, Select, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.models.course import Course
 from app.database.models.user_course import UserCourse
-from app.database import crud
 
 
 def get_by_id(db: Session, user_course_id: str) -> UserCourse:
     """Returns user course by it`s ID."""
-    return db.query(UserCourse).filter(UserCourse.id == user_course_id).first()
+    return db.execute(_select_by_id(user_course_id)).scalars().first()
 
 
-def get_by_user_id(db: Session, user_id: str) -> UserCourse:
+async def get_by_id_async(db: AsyncSession, user_course_id: str) -> UserCourse:
+    """Returns user course by it`s ID (asyncio)."""
+    return (await db.execute(_select_by_id(user_course_id))).scalars().first()
+
+
+def get_by_user_id(db: Session, user_id: str) -> list[UserCourse]:
     """Returns user courses by owner user ID."""
-    return db.query(UserCourse).filter(UserCourse.user_id == user_id).all()
+    return db.execute(_select_by_user_id(user_id)).scalars().all()
+
+
+async def get_by_user_id_async(db: AsyncSession, user_id: str) -> list[UserCourse]:
+    """Returns user courses by owner user ID (asyncio)."""
+    return (await db.execute(_select_by_user_id(user_id))).scalars().all()
 
 
 def get_by_user_id_and_course_id(
     db: Session, user_id: str, course_id: str
-) -> UserCourse:
+) -> list[UserCourse]:
     """Returns user course by owner user ID and course."""
+    query = _select_by_user_id_and_course_id(user_id, course_id)
+    return db.execute(query).scalars().all()
+
+
+async def get_by_user_id_and_course_id_async(
+    db: AsyncSession, user_id: str, course_id: str
+) -> list[UserCourse]:
+    """Returns user course by owner user ID and course (asyncio)."""
+    query = _select_by_user_id_and_course_id(user_id, course_id)
+    return (await db.execute(query)).scalars().all()
+
+
+def purchase(db: Session, user_id: str, course: Course) -> UserCourse | None:
+    """
+    Purchases course by user atomically, in single statement.
+    Returns None if course is already purchased by user.
+    """
+    user_course = db.execute(_insert_purchase(user_id, course)).scalars().first()
+    db.commit()
+    return _with_course(user_course, course)
+
+
+async def purchase_async(
+    db: AsyncSession, user_id: str, course: Course
+) -> UserCourse | None:
+    """
+    Purchases course by user atomically, in single statement (asyncio).
+    Returns None if course is already purchased by user.
+    """
+    query = _insert_purchase(user_id, course)
+    user_course = (await db.execute(query)).scalars().first()
+    await db.commit()
+    return _with_course(user_course, course)
+
+
+def _insert_purchase(user_id: str, course: Course) -> Insert:
+    """
+    Returns query that inserts user course and returns it,
+    or does nothing (returns no rows) if course is already purchased by user.
+    """
     return (
-        db.query(UserCourse)
-        .filter(UserCourse.user_id == user_id)
-        .filter(UserCourse.course_id == course_id)
-        .all()
+        insert(UserCourse)
+        .values(user_id=user_id, course_id=course.id, purchased_for=course.price)
+        .on_conflict_do_nothing(constraint="uq_user_courses_user_id_course_id")
+        .returning(UserCourse)
     )
 
 
-def create(db: Session, user_id: str, course_id: str) -> UserCourse:
-    """Creates new user purchased course."""
+def _with_course(user_course: UserCourse | None, course: Course) -> UserCourse | None:
+    """Sets already loaded course to the purchased user course (without query)."""
+    if user_course is not None:
+        set_committed_value(user_course, "course", course)
+    return user_course
+
+
+def _select_by_id(user_course_id: str) -> Select:
+    """Returns query for user course by it`s ID."""
+    return select(UserCourse).where(UserCourse.id == user_course_id)
+
 
-    # Create new user purchased course.
-    course = crud.course.get_by_id(db, course_id)
-    user_course = UserCourse(
-        user_id=user_id, course_id=course_id, purchased_for=course.price
+def _select_by_user_id(user_id: str) -> Select:
+    """
+    Returns query for user courses by owner user ID.
+    Courses are loaded within same query, as they are serialized with user courses.
+    """
+    return (
+        select(UserCourse)
+        .where(UserCourse.user_id == user_id)
+        .options(joinedload(UserCourse.course))
     )
 
-    # Apply user course in database.
-    db.add(user_course)
-    db.commit()
-    db.refresh(user_course)
 
-    return user_course
+def _select_by_user_id_and_course_id(user_id: str, course_id: str) -> Select:
+    """Returns query for user course by owner user ID and course."""
+    return (
+        select(UserCourse)
+        .where(UserCourse.user_id == user_id)
+        .where(UserCourse.course_id == course_id)
+    )
@@ -0,0 +1,18 @@
+"""
+    User role CRUD utils for the database.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.models.user_role import UserRole
+
+
+def get_all(db: Session) -> list[UserRole]:
+    """Returns all user roles."""
+    return db.execute(select(UserRole)).scalars().all()
+
+
+async def get_all_async(db: AsyncSession) -> list[UserRole]:
+    """Returns all user roles (asyncio)."""
+    return (await db.execute(select(UserRole))).scalars().all()
@@ -5,9 +5,10 @@
 # For importing Session from dependencies!
 # Do not remove.
 from sqlalchemy.orm import Session  # noqa # pylint: disable=unused-import
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa # pylint: disable=unused-import
 
 # Importing session.
-from .core import SessionLocal, sessionmaker
+from .core import SessionLocal, AsyncSessionLocal, sessionmaker
 
 
 def get_db() -> sessionmaker:
@@ -17,3 +18,9 @@ def get_db() -> sessionmaker:
         yield db_session
     finally:
         db_session.close()
+
+
+async def get_async_db() -> AsyncSession:
+    """Async session getter for database. Used as dependency for asyncio routers."""
+    async with AsyncSessionLocal() as db_session:
+        yield db_session
@@ -0,0 +1,237 @@
+"""
+    Database instrumentation.
+    Counts SQL statements issued while handling single request (for finding N+1 queries),
+    and collects connection pool metrics (checkout wait time, saturation, connections held for too long).
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import get_settings, get_logger
+
+# Statements counter of the current request (context), None if not counting.
+# Mutable container as context is copied into tasks and greenlets,
+# and counter should still be shared with the request handler.
+_statements_counter: ContextVar[list[int] | None] = ContextVar(
+    "database_statements_counter", default=None
+)
+
+# Route of the current request (context), to know who holds pool connections.
+_current_route: ContextVar[str | None] = ContextVar(
+    "database_current_route", default=None
+)
+
+# Upper bounds (in seconds) of checkout wait time histogram buckets.
+_checkout_wait_buckets = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+# Instrumented engines by name, see `register_engine`.
+_engines: dict[str, Engine] = {}
+_log_task: asyncio.Task | None = None
+
+
+class PoolMetrics:
+    """Connection pool metrics, shared by pool and it`s recreated instances."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.checkout_wait_histogram = [0] * (len(_checkout_wait_buckets) + 1)
+        self.held_too_long = 0
+        self.held_too_long_routes: Counter[str] = Counter()
+        # Currently checked out connections, connection record ID -> (checked out at, route).
+        self.held: dict[int, tuple[float, str | None]] = {}
+
+    def observe_checkout_wait(self, wait: float) -> None:
+        """Records time spent waiting for connection checkout."""
+        self.checkouts += 1
+        self.checkout_wait_total += wait
+        self.checkout_wait_max = max(self.checkout_wait_max, wait)
+        self.checkout_wait_histogram[bisect_left(_checkout_wait_buckets, wait)] += 1
+
+    def serialize(self, pool: QueuePool) -> dict:
+        """Returns dict with pool metrics and current pool state."""
+        held_threshold = get_settings().database_pool_held_connection_threshold
+        now = time.monotonic()
+        return {
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "checkout_wait": {
+                "total": self.checkout_wait_total,
+                "max": self.checkout_wait_max,
+                "avg": (
+                    self.checkout_wait_total / self.checkouts if self.checkouts else 0.0
+                ),
+                "histogram": {
+                    f"le_{bucket}": count
+                    for bucket, count in zip(
+                        (*_checkout_wait_buckets, "inf"), self.checkout_wait_histogram
+                    )
+                },
+            },
+            "held_too_long": self.held_too_long,
+            "held_too_long_routes": dict(self.held_too_long_routes),
+            "held_now_too_long": [
+                {"route": route, "held_for": now - checked_out_at}
+                for checked_out_at, route in self.held.values()
+                if now - checked_out_at > held_threshold
+            ],
+        }
+
+
+class _InstrumentedPoolMixin:
+    """Mixin for queue pools that measures checkout wait time and timeouts."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        """Recreates pool with same metrics (pool is recreated on engine dispose)."""
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        checkout_started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            checkout_wait = time.perf_counter() - checkout_started_at
+            self.metrics.observe_checkout_wait(checkout_wait)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """Queue pool with metrics."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(
+    _InstrumentedPoolMixin, AsyncAdaptedQueuePool
+):
+    """Queue pool with metrics, for asyncio engines."""
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    """
+    Registers engine (sync engine, or `sync_engine` of the async one) with instrumented pool,
+    to track connections held by routes and report it`s pool metrics.
+    """
+    _engines[name] = engine
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(_, connection_record, __) -> None:
+        _track_checkout(engine.pool.metrics, connection_record)
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(_, connection_record) -> None:
+        _track_checkin(engine.pool.metrics, connection_record)
+
+
+def get_pools_metrics() -> dict[str, dict]:
+    """Returns metrics for all registered engine pools."""
+    return {
+        name: engine.pool.metrics.serialize(engine.pool)
+        for name, engine in _engines.items()
+    }
+
+
+def set_current_route(route: str) -> None:
+    """Sets route of the current request (context), that holds it`s checked out connections."""
+    _current_route.set(route)
+
+
+def install_statements_counter(engine: Engine) -> None:
+    """Hooks statements counter to the engine (sync engine, or `sync_engine` of the async one)."""
+    if not event.contains(engine, "before_cursor_execute", _count_statement):
+        event.listen(engine, "before_cursor_execute", _count_statement)
+
+
+def start_counting_statements() -> None:
+    """Starts counting statements in current context."""
+    _statements_counter.set([0])
+
+
+def get_statements_count() -> int:
+    """Returns statements count in current context (0 if not counting)."""
+    counter = _statements_counter.get()
+    return counter[0] if counter is not None else 0
+
+
+async def on_startup() -> None:
+    """Starts periodic logging of the pool metrics."""
+    global _log_task  # pylint: disable=global-statement
+    interval = get_settings().database_pool_metrics_log_interval
+    if interval > 0 and _engines:
+        _log_task = asyncio.create_task(_log_pools_metrics_periodically(interval))
+
+
+async def on_shutdown() -> None:
+    """Stops periodic logging of the pool metrics."""
+    if _log_task is not None:
+        _log_task.cancel()
+
+
+async def _log_pools_metrics_periodically(interval: int) -> None:
+    """Writes pool metrics to the log every interval (in seconds)."""
+    while True:
+        await asyncio.sleep(interval)
+        for name, metrics in get_pools_metrics().items():
+            get_logger().info(
+                f"Database pool `{name}`: in use {metrics['in_use']}/{metrics['size']} "
+                f"(overflow {metrics['overflow']}, idle {metrics['idle']}), "
+                f"checkouts {metrics['checkouts']}, timeouts {metrics['timeouts']}, "
+                f"checkout wait avg {metrics['checkout_wait']['avg']:.4f}s "
+                f"max {metrics['checkout_wait']['max']:.4f}s, "
+                f"held too long {metrics['held_too_long']} "
+                f"(now: {len(metrics['held_now_too_long'])})."
+            )
+
+
+def _track_checkout(metrics: PoolMetrics, connection_record) -> None:
+    """Remembers when and by which route connection was checked out."""
+    checked_out_at, route = time.monotonic(), _current_route.get()
+    connection_record.info["checked_out_at"] = checked_out_at
+    connection_record.info["checked_out_by"] = route
+    metrics.held[id(connection_record)] = (checked_out_at, route)
+
+
+def _track_checkin(metrics: PoolMetrics, connection_record) -> None:
+    """Reports connection if it was held for too long."""
+    checked_out_at = connection_record.info.pop("checked_out_at", None)
+    route = connection_record.info.pop("checked_out_by", None) or "unknown"
+    metrics.held.pop(id(connection_record), None)
+    if checked_out_at is None:
+        return
+
+    held_for = time.monotonic() - checked_out_at
+    if held_for > get_settings().database_pool_held_connection_threshold:
+        metrics.held_too_long += 1
+        metrics.held_too_long_routes[route] += 1
+        get_logger().warning(
+            f"Database connection was held for {held_for:.2f}s by route {route}!"
+        )
+
+
+def _count_statement(*_) -> None:
+    """Engine event listener that counts statement in current context."""
+    counter = _statements_counter.get()
+    if counter is not None:
+        counter[0] += 1
@@ -10,8 +10,12 @@ from sqlalchemy.dialects.postgresql import UUID
 class TimestampMixin:
     """
     Adds date-time fields for `created` and `updated`.
+    Server generated values are fetched eagerly within INSERT/UPDATE (RETURNING),
+    so there is no need to refresh rows after writing.
     """
 
+    __mapper_args__ = {"eager_defaults": True}
+
     time_created = Column(
         DateTime(timezone=False), server_default=func.now(), nullable=False
     )
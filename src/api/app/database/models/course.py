@@ -5,9 +5,18 @@
 from enum import Enum, auto
 
 from sqlalchemy.orm import relationship
-from sqlalchemy import Boolean, Column, DateTime, Text, Integer, String, ForeignKey
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Text,
+    Integer,
+    String,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.database.core import Base
 from app.database.mixins import UUIDMixin, TimestampMixin
@@ -30,6 +39,33 @@ class Course(UUIDMixin, TimestampMixin, Base):
     """Course model."""
 
     __tablename__ = "courses"
+    # Existing database: `python -m app.commands.create_lookup_indexes`.
+    __table_args__ = (
+        # Listing sort orders (keyset pagination), see `crud.course.CourseSortOrder`.
+        Index("ix_courses_published_at_id", "published_at", "id"),
+        Index("ix_courses_price_id", "price", "id"),
+        Index("ix_courses_title_id", "title", "id"),
+        # Same, but only for listings of active public courses (most of the traffic),
+        # price index is also used for `max_price` filter.
+        Index(
+            "ix_courses_active_public_published_at_id",
+            "published_at",
+            "id",
+            postgresql_where=text("is_active AND is_public"),
+        ),
+        Index(
+            "ix_courses_active_public_price_id",
+            "price",
+            "id",
+            postgresql_where=text("is_active AND is_public"),
+        ),
+        Index(
+            "ix_courses_active_public_title_id",
+            "title",
+            "id",
+            postgresql_where=text("is_active AND is_public"),
+        ),
+    )
 
     # Access data.
     name = Column(String(48), nullable=False, unique=True)
@@ -37,7 +73,11 @@ class Course(UUIDMixin, TimestampMixin, Base):
     # Display data.
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False, default="...")
-    published_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Not null, as it is listing sort key (keyset pagination can not compare NULLs),
+    # existing databases: `python -m app.commands.backfill_courses_published_at`.
+    published_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     edited_at = Column(DateTime(timezone=True), server_default=func.now())
     difficulty = Column(Integer, nullable=False)
     preview_url = Column(String, nullable=True)
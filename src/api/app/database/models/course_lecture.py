@@ -2,11 +2,12 @@
     Course lecture database model.
 """
 
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy import Boolean, Column, Text, String, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.database.core import Base
+from app.database.compression import CompressedText
 from app.database.mixins import UUIDMixin, TimestampMixin
 
 
@@ -16,7 +17,10 @@ class CourseLecture(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "course_lectures"
 
     # Access data.
-    course_id = Column(UUID(as_uuid=False), ForeignKey("courses.id"), nullable=False)
+    # Existing database: `python -m app.commands.create_lookup_indexes`.
+    course_id = Column(
+        UUID(as_uuid=False), ForeignKey("courses.id"), nullable=False, index=True
+    )
     course = relationship("Course", back_populates="course_lectures")
 
     # Display data.
@@ -24,7 +28,10 @@ class CourseLecture(UUIDMixin, TimestampMixin, Base):
     description = Column(Text, nullable=False, default="...")
 
     # Content.
-    content = Column(Text, nullable=False, default="...")
+    # Deferred, as it is unbounded and not shown until course is purchased,
+    # should be loaded explicitly (see `crud.course_lecture`) when it will be shown.
+    # Stored compressed, if compression is enabled.
+    content = deferred(Column(CompressedText, nullable=False, default="..."))
 
     # Flags.
     is_active = Column(
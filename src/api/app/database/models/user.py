@@ -23,7 +23,8 @@ class User(UUIDMixin, TimestampMixin, Base):
 
     # ID that linked to user by OAuth process (SSO).
     # For now this is `Florgon` one ecosystem SSO via OAuth.
-    sso_oauth_user_id = Column(Integer, nullable=False)
+    # Existing database: `python -m app.commands.create_lookup_indexes`.
+    sso_oauth_user_id = Column(Integer, nullable=False, unique=True, index=True)
 
     # Information about user.
 
@@ -3,7 +3,7 @@
 """
 
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -15,6 +15,14 @@ class UserCourse(UUIDMixin, TimestampMixin, Base):
     """User purchased course model."""
 
     __tablename__ = "user_courses"
+    __table_args__ = (
+        # Course can be purchased only once by the user.
+        # Also used as index for lookups by user (leading column) and access checks.
+        # Existing database: `python -m app.commands.add_user_courses_unique_constraint`.
+        UniqueConstraint(
+            "user_id", "course_id", name="uq_user_courses_user_id_course_id"
+        ),
+    )
 
     # User who is purchased course.
     user_id = Column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=False)
@@ -0,0 +1,176 @@
+"""
+    Database read replica routing.
+    Routes reads to the replica (if configured) and writes to the primary.
+    User who wrote something sticks to the primary for a short window,
+    so they always see their own writes regardless of the replication lag (read-your-writes),
+    other workers are told about that by signed cookie set on response after writes.
+"""
+
+import hashlib
+import hmac
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import Delete, Insert, Update, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+
+# Cookie with signed primary stickiness of the user, set on response after writes.
+PRIMARY_STICKY_COOKIE = "primary_sticky"
+
+# User of the current request (context), set when request is authenticated.
+_current_user_id: ContextVar[str | None] = ContextVar(
+    "database_current_user_id", default=None
+)
+# If true, all queries in current request (context) goes to the primary.
+_use_primary: ContextVar[bool] = ContextVar("database_use_primary", default=False)
+# Stickiness cookies of the current request (context), set by the middleware.
+_request_stickiness: ContextVar["RequestStickiness | None"] = ContextVar(
+    "database_request_stickiness", default=None
+)
+
+# Local (worker) cache of users that should stick to the primary, user ID -> monotonic time.
+# Other workers are told by the cookie, so reads does not cost any lookup.
+_primary_sticky_until: dict[str, float] = {}
+_primary_sticky_max_local_users = 10_000
+
+
+class RequestStickiness:
+    """Primary stickiness cookie sent with the request, and cookie to set on response."""
+
+    __slots__ = ("cookie", "new_cookie")
+
+    def __init__(self, cookie: str | None) -> None:
+        self.cookie = cookie
+        self.new_cookie: str | None = None
+
+
+class RoutingSession(Session):
+    """
+    Session that routes reads to the replica and writes to the primary.
+    Once session has written anything, it uses only the primary until it is closed.
+    """
+
+    def __init__(self, *args, replica_bind: Engine | None = None, **kwargs):
+        """
+        :param replica_bind: Replica engine, if None all queries goes to the primary (`bind`).
+        """
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        """Returns replica engine for reads, or primary engine for everything else."""
+        if (
+            self.replica_bind is None
+            or self._flushing
+            or self.info.get("has_writes", False)
+            or _use_primary.get()
+            or isinstance(clause, (Insert, Update, Delete))
+        ):
+            return super().get_bind(mapper, clause=clause, **kwargs)
+        return self.replica_bind
+
+
+def start_request(cookie: str | None) -> RequestStickiness:
+    """
+    Starts stickiness of current request (context), should be called by the middleware.
+    :param cookie: Primary stickiness cookie sent with the request.
+    Returns stickiness, with cookie to set on response (if request user has written anything).
+    """
+    stickiness = RequestStickiness(cookie)
+    _request_stickiness.set(stickiness)
+    return stickiness
+
+
+def stick_to_primary_if_wrote_recently(user_id: str) -> None:
+    """
+    Sets current request user and routes all queries of current request to the primary
+    if that user has written anything within read-your-writes window.
+    Should be called when request is authenticated, before querying user data.
+    """
+    _current_user_id.set(user_id)
+    if get_settings().database_replica_dsn is None:
+        return
+
+    sticky_until = _primary_sticky_until.get(user_id)
+    if sticky_until is not None and sticky_until > time.monotonic():
+        _use_primary.set(True)
+        return
+
+    stickiness = _request_stickiness.get()
+    if stickiness is not None and _is_valid_sticky_cookie(stickiness.cookie, user_id):
+        _use_primary.set(True)
+
+
+def _sign_sticky_cookie(user_id: str, expires_at: int) -> str:
+    """Returns signature of the primary stickiness cookie."""
+    key = get_settings().security_tokens_secret_key.encode()
+    message = f"{user_id}:{expires_at}".encode()
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+def _is_valid_sticky_cookie(cookie: str | None, user_id: str) -> bool:
+    """Returns true if cookie is signed for given user and not expired yet."""
+    if not cookie:
+        return False
+    try:
+        cookie_user_id, expires_at, signature = cookie.split(":")
+        expires_at = int(expires_at)
+    except ValueError:
+        return False
+    return (
+        cookie_user_id == user_id
+        and expires_at > time.time()
+        and hmac.compare_digest(signature, _sign_sticky_cookie(user_id, expires_at))
+    )
+
+
+def _mark_current_user_wrote() -> None:
+    """Sticks current request user to the primary for read-your-writes window."""
+    settings = get_settings()
+    user_id = _current_user_id.get()
+    if user_id is None or settings.database_replica_dsn is None:
+        return
+
+    window = settings.database_replica_read_your_writes_window
+    if len(_primary_sticky_until) >= _primary_sticky_max_local_users:
+        now = time.monotonic()
+        for expired_user_id in [
+            uid for uid, until in _primary_sticky_until.items() if until <= now
+        ]:
+            del _primary_sticky_until[expired_user_id]
+    _primary_sticky_until[user_id] = time.monotonic() + window
+
+    # Other workers are told by the cookie, set on response by the middleware.
+    stickiness = _request_stickiness.get()
+    if stickiness is not None:
+        expires_at = int(time.time()) + window
+        stickiness.new_cookie = (
+            f"{user_id}:{expires_at}:{_sign_sticky_cookie(user_id, expires_at)}"
+        )
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _on_orm_execute(orm_execute_state) -> None:
+    """Marks session as written on INSERT/UPDATE/DELETE statements."""
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _on_after_flush(session: Session, _) -> None:
+    """Marks session as written on flush."""
+    session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    """Sticks current user to the primary after commit of any writes."""
+    if session.info.get("has_writes", False):
+        _mark_current_user_wrote()
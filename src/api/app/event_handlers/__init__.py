@@ -6,7 +6,8 @@
 
 from fastapi import FastAPI
 
-from app.services import limiter
+from app.database import instrumentation
+from app.services import limiter, permissions, tokens_revocation, users_cache
 
 
 def add_event_handlers(app: FastAPI) -> None:
@@ -15,3 +16,11 @@ def add_event_handlers(app: FastAPI) -> None:
     """
     app.add_event_handler("startup", limiter.on_startup)
     app.add_event_handler("shutdown", limiter.on_shutdown)
+    app.add_event_handler("startup", instrumentation.on_startup)
+    app.add_event_handler("shutdown", instrumentation.on_shutdown)
+    app.add_event_handler("startup", permissions.on_startup)
+    app.add_event_handler("shutdown", permissions.on_shutdown)
+    app.add_event_handler("startup", users_cache.on_startup)
+    app.add_event_handler("shutdown", users_cache.on_shutdown)
+    app.add_event_handler("startup", tokens_revocation.on_startup)
+    app.add_event_handler("shutdown", tokens_revocation.on_shutdown)
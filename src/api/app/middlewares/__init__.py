@@ -4,9 +4,11 @@
     And middlewares itself.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings, get_gatey_client, get_logger
+from app.database import core, instrumentation, routing
+from app.services import limiter
 from gatey_sdk.integrations.starlette import GateyStarletteMiddleware
 
 
@@ -16,6 +18,81 @@ def add_middlewares(app: FastAPI) -> None:
     """
     _add_cors_middleware(app)
     _add_gatey_middleware(app)
+    _add_database_instrumentation_middleware(app)
+    _add_database_routing_middleware(app)
+    _add_rate_limit_headers_middleware(app)
+
+
+def _add_rate_limit_headers_middleware(app: FastAPI) -> None:
+    """
+    Registers middleware that adds rate limit headers (of GCRA requests limiter) to responses.
+    """
+    app.middleware("http")(limiter.rate_limit_headers_middleware)
+    get_logger().debug("Rate limit headers middleware was hooked up.")
+
+
+def _add_database_routing_middleware(app: FastAPI) -> None:
+    """
+    Registers middleware that passes primary stickiness cookie (read-your-writes) of the user
+    to the database routing, and sets it on response after writes.
+    Skipped if read replica is not configured.
+    """
+    settings = get_settings()
+    if settings.database_replica_dsn is None:
+        return
+
+    @app.middleware("http")
+    async def _database_routing_middleware(req: Request, call_next):
+        cookie = req.cookies.get(routing.PRIMARY_STICKY_COOKIE)
+        stickiness = routing.start_request(cookie)
+        response = await call_next(req)
+        if stickiness.new_cookie is not None:
+            response.set_cookie(
+                routing.PRIMARY_STICKY_COOKIE,
+                stickiness.new_cookie,
+                max_age=settings.database_replica_read_your_writes_window,
+                httponly=True,
+            )
+        return response
+
+    get_logger().debug("Database routing middleware was hooked up.")
+
+
+def _add_database_instrumentation_middleware(app: FastAPI) -> None:
+    """
+    Registers middleware that tracks route holding database pool connections.
+
+    In debug, it also counts database statements per request,
+    and reports routes that exceed statements budget (N+1 queries).
+    """
+    settings = get_settings()
+    count_statements = settings.fastapi_debug
+    budget = settings.database_statements_per_request_budget
+    if count_statements:
+        instrumentation.install_statements_counter(core.engine)
+        instrumentation.install_statements_counter(core.async_engine.sync_engine)
+        if core.async_replica_engine is not None:
+            instrumentation.install_statements_counter(
+                core.async_replica_engine.sync_engine
+            )
+
+    @app.middleware("http")
+    async def _database_instrumentation_middleware(req: Request, call_next):
+        instrumentation.set_current_route(f"{req.method} {req.url.path}")
+        if not count_statements:
+            return await call_next(req)
+
+        instrumentation.start_counting_statements()
+        response = await call_next(req)
+        statements_count = instrumentation.get_statements_count()
+        if statements_count > budget:
+            get_logger().warning(
+                f"Route {req.method} {req.url.path} issued {statements_count} "
+                f"database statements (budget: {budget})!"
+            )
+        return response
+
+    get_logger().debug("Database instrumentation middleware was hooked up.")
 
 
 def _add_gatey_middleware(app: FastAPI) -> None:
@@ -6,7 +6,7 @@
 from app.config import get_settings
 from fastapi import FastAPI
 
-from . import utils, auth, courses, course_lectures, users, mailing, roles
+from . import utils, auth, courses, course_lectures, users, mailing, roles, internal
 
 
 def include_routers(app: FastAPI) -> None:
@@ -15,5 +15,14 @@ def include_routers(app: FastAPI) -> None:
     """
     settings = get_settings()
     proxy_url_prefix = settings.proxy_url_prefix
-    for module in [utils, auth, courses, course_lectures, users, mailing, roles]:
+    for module in [
+        utils,
+        auth,
+        courses,
+        course_lectures,
+        users,
+        mailing,
+        roles,
+        internal,
+    ]:
         app.include_router(module.router, prefix=proxy_url_prefix)
@@ -5,13 +5,16 @@
 
 import requests
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 
 from app.config import get_settings, Settings, get_logger
 from app.database import crud
-from app.database.dependencies import get_db, Session
+from app.database.dependencies import get_async_db, AsyncSession
+from app.services import tokens_revocation
 from app.services.api.response import ApiErrorCode, api_error, api_success
+from app.services.request.auth import query_auth_data_from_request
+from app.services.tokens_keys import get_key_ring
 from app.tokens.access_token import AccessToken
 
 router = APIRouter()
@@ -40,7 +43,9 @@ def send_sso_oauth_exchange_request(
 
 
 @router.get("/auth/sso")
-async def method_auth_sso(code: str, db: Session = Depends(get_db)) -> JSONResponse:
+async def method_auth_sso(
+    code: str, db: AsyncSession = Depends(get_async_db)
+) -> JSONResponse:
     """Returns token from SSO OAuth code."""
 
     settings = get_settings()
@@ -76,9 +81,9 @@ async def method_auth_sso(code: str, db: Session = Depends(get_db)) -> JSONRespo
             "Unable to query required data from exchanged request. Please review granted OAuth permissions!",
         )
 
-    current_user = crud.user.get_by_sso_oauth_user_id(db, sso_user_id)
+    current_user = await crud.user.get_by_sso_oauth_user_id_async(db, sso_user_id)
     if current_user is None:
-        current_user = crud.user.create(
+        current_user = await crud.user.create_async(
             db, sso_oauth_user_id=sso_user_id, email=sso_user_email
         )
         logger.info(
@@ -90,7 +95,12 @@ async def method_auth_sso(code: str, db: Session = Depends(get_db)) -> JSONRespo
         issuer=settings.security_tokens_issuer,
         ttl=access_token_ttl,
         user_id=current_user.id,
-    ).encode(key=settings.security_tokens_secret_key)
+        role_id=(
+            current_user.role_id
+            if settings.security_access_tokens_role_id_claim
+            else None
+        ),
+    ).encode(key=get_key_ring())
 
     logger.info(f"Successfully authorized user with id: {current_user.id}!")
     return api_success(
@@ -101,3 +111,29 @@ async def method_auth_sso(code: str, db: Session = Depends(get_db)) -> JSONRespo
             "expires_in": access_token_ttl,
         }
     )
+
+
+@router.get("/auth/revoke")
+async def method_auth_revoke(
+    req: Request, db: AsyncSession = Depends(get_async_db)
+) -> JSONResponse:
+    """Revokes access token of the request (logout)."""
+
+    auth_data = await query_auth_data_from_request(req, db)
+    if auth_data.claims.token_id is None:
+        return api_error(
+            ApiErrorCode.AUTH_INVALID_TOKEN,
+            "Token can not be revoked, as it was issued without ID!",
+        )
+    await tokens_revocation.revoke(
+        auth_data.claims.token_id, auth_data.claims.expires_at
+    )
+    get_logger().info(f"Revoked access token of user with id: {auth_data.user_id}!")
+    return api_success({"revoked": True})
+
+
+@router.get("/auth/keys")
+async def method_auth_keys() -> JSONResponse:
+    """Returns public keys (JWK set) to verify access tokens (only for asymmetric algorithms)."""
+
+    return api_success(get_key_ring().get_public_jwks())
@@ -8,7 +8,7 @@ from app.services.request.auth import (
     query_auth_data_from_request,
     try_query_auth_data_from_request,
 )
-from app.database.dependencies import get_db, Session
+from app.database.dependencies import get_async_db, AsyncSession
 from app.database import crud
 from app.config import get_logger
 from app.database.models.course import Course
@@ -23,21 +23,12 @@ from fastapi.responses import JSONResponse
 router = APIRouter()
 
 
-def user_has_access_to_course_content(
-    db: Session, user_id: str | None, course: Course
-) -> bool:
+def user_has_access_to_course_content(course: Course, is_purchased: bool) -> bool:
     """
     Returns true if user has access to that course
-    :param user_id: If none, means unauthorized user.
+    :param is_purchased: Is course purchased by user (false for unauthorized user).
     """
-    if not course.is_public:
-        if user_id is None:
-            return False
-        user_course = crud.user_course.get_by_user_id_and_course_id(
-            db=db, user_id=user_id, course_id=course.id
-        )
-        return user_course is not None
-    return True
+    return course.is_public or is_purchased
 
 
 @router.get("/courses/lectures/list")
@@ -45,7 +36,7 @@ async def method_courses_lectures_list(
     req: Request,
     course_id: str | None = None,
     course_name: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Returns list of avaliable course lectures."""
 
@@ -55,25 +46,27 @@ async def method_courses_lectures_list(
             "Please pass `course_name` or `course_id` (not both)!",
         )
 
-    is_authenticated, auth_data = try_query_auth_data_from_request(req, db)
+    is_authenticated, auth_data = await try_query_auth_data_from_request(req, db)
     user_id = auth_data.user_id if is_authenticated else None
 
-    course = (
-        crud.course.get_by_id(db, course_id)
-        if course_id
-        else crud.course.get_by_name(db, course_name)
+    (
+        course,
+        course_lectures,
+        is_purchased,
+    ) = await crud.course_lecture.get_course_with_lectures_async(
+        db, user_id=user_id, course_id=course_id, course_name=course_name
     )
     if not course:
         return api_error(
             ApiErrorCode.API_ITEM_NOT_FOUND, "Course with that ID or name not found!"
         )
 
-    user_has_access_to_content = user_has_access_to_course_content(db, user_id, course)
+    user_has_access_to_content = user_has_access_to_course_content(
+        course, is_purchased
+    )
     return api_success(
         serialize_course_lectures(
-            course_lectures=crud.course_lecture.get_by_course_id(
-                db, course_id=course_id
-            ),
+            course_lectures=course_lectures,
             show_content=user_has_access_to_content,
         )
         | {"content_hidden_until_purchase": not user_has_access_to_content}
@@ -86,7 +79,7 @@ async def method_courses_lectures_get(
     course_lecture_id: str,
     course_id: str | None = None,
     course_name: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Returns one course lecture by id/name."""
 
@@ -96,22 +89,24 @@ async def method_courses_lectures_get(
             "Please pass `course_name` or `course_id` (not both)!",
         )
 
-    is_authenticated, auth_data = try_query_auth_data_from_request(req, db)
+    is_authenticated, auth_data = await try_query_auth_data_from_request(req, db)
     user_id = auth_data.user_id if is_authenticated else None
 
-    course = (
-        crud.course.get_by_id(db, course_id)
-        if course_id
-        else crud.course.get_by_name(db, course_name)
+    (
+        course,
+        course_lecture,
+        is_purchased,
+    ) = await crud.course_lecture.get_course_with_lecture_async(
+        db,
+        user_id=user_id,
+        course_lecture_id=course_lecture_id,
+        course_id=course_id,
+        course_name=course_name,
     )
     if not course:
         return api_error(
             ApiErrorCode.API_ITEM_NOT_FOUND, "Course with that ID or name not found!"
         )
-
-    course_lecture = crud.course_lecture.get_by_id(
-        db, course_lecture_id=course_lecture_id
-    )
     if not course_lecture:
         return api_error(
             ApiErrorCode.API_ITEM_NOT_FOUND, "Course lecture with that ID not found!"
@@ -122,7 +117,9 @@ async def method_courses_lectures_get(
             "That course lecture does not belongs to requested course!",
         )
 
-    user_has_access_to_content = user_has_access_to_course_content(db, user_id, course)
+    user_has_access_to_content = user_has_access_to_course_content(
+        course, is_purchased
+    )
     return api_success(
         serialize_course_lecture(
             course_lecture=course_lecture, show_content=user_has_access_to_content
@@ -138,23 +135,24 @@ async def method_courses_lectures_new(
     title: str,
     description: str = "...",
     content: str = "...",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Creates new course lecture (permitted only)."""
 
-    user = query_auth_data_from_request(req, db).user
-    if not user.role.p_create_courses:
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    if not permissions.p_create_courses:
         return api_error(
             ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
         )
 
-    course = crud.course.get_by_id(db, course_id=course_id)
+    course = await crud.course.get_by_id_async(db, course_id=course_id)
     if not course:
         return api_error(
             ApiErrorCode.API_ITEM_NOT_FOUND, "Course with that ID not found!"
         )
 
-    course_lecture = crud.course_lecture.create(
+    course_lecture = await crud.course_lecture.create_async(
         db=db,
         course_id=course.id,
         title=title,
@@ -173,12 +171,13 @@ async def method_courses_lectures_new(
 
 @router.get("/courses/lectures/edit")
 async def method_courses_lectures_edit(
-    req: Request, db: Session = Depends(get_db)
+    req: Request, db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """Edits course lecture (permitted only)."""
 
-    user = query_auth_data_from_request(req, db).user
-    if not user.role.p_edit_courses:
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    if not permissions.p_edit_courses:
         return api_error(
             ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
         )
@@ -6,8 +6,9 @@
 from fastapi import APIRouter, Request, Depends, BackgroundTasks
 from fastapi.responses import JSONResponse
 from app.database import crud
-from app.database.dependencies import get_db, Session
+from app.database.dependencies import get_async_db, AsyncSession
 from app.database.models.course import CourseDifficulty
+from app.database.crud.course import CourseSortOrder
 from app.config import get_logger
 from app.services.api.response import api_error, ApiErrorCode, api_success
 from app.services.request.auth import query_auth_data_from_request
@@ -27,11 +28,18 @@ async def method_courses_list(
     language: str = "en",
     page: int = 1,
     per_page: int = 5,
+    cursor: str | None = None,
+    sort: str = CourseSortOrder.published_at.value,
+    include_total: bool = True,
     difficulty: str | None = None,
     max_price: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
-    """Returns list of avaliable courses."""
+    """
+    Returns list of avaliable courses.
+    Pass `cursor` (`next_cursor` from previous response) instead of `page` to paginate with constant cost.
+    Pass `include_total=false` to skip counting (`total` and `max_page` will be null), for infinite scroll.
+    """
 
     if 1 > per_page > 10:
         return api_error(
@@ -44,17 +52,32 @@ async def method_courses_list(
         difficulty_enum = CourseDifficulty[difficulty] if difficulty else None
     except KeyError:
         return api_error(ApiErrorCode.API_INVALID_REQUEST, "Invalid difficulty name!")
+    try:
+        sort_enum = CourseSortOrder[sort]
+    except KeyError:
+        return api_error(ApiErrorCode.API_INVALID_REQUEST, "Invalid sort name!")
 
-    courses, courses_total, max_page = crud.course.get_all_filtered_paginated(
-        db=db,
-        public_only=public_only,
-        active_only=active_only,
-        language=language if exclude_foreign_languages else None,
-        difficulty=difficulty_enum,
-        max_price=max_price,
-        page=page,
-        per_page=per_page,
-    )
+    try:
+        (
+            courses,
+            courses_total,
+            max_page,
+            next_cursor,
+        ) = await crud.course.get_all_filtered_paginated_async(
+            db=db,
+            public_only=public_only,
+            active_only=active_only,
+            language=language if exclude_foreign_languages else None,
+            difficulty=difficulty_enum,
+            max_price=max_price,
+            page=page,
+            per_page=per_page,
+            sort=sort_enum,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError:
+        return api_error(ApiErrorCode.API_INVALID_REQUEST, "Invalid `cursor`!")
     current_total = len(courses)
     get_logger().debug(
         f"Listed {current_total} (all: {courses_total}) courses for /courses/list request!"
@@ -67,6 +90,8 @@ async def method_courses_list(
                 "page": page,
                 "per_page": per_page,
                 "max_page": max_page,
+                "sort": sort_enum.name,
+                "next_cursor": next_cursor,
             },
         }
         | serialize_courses(courses)
@@ -75,7 +100,9 @@ async def method_courses_list(
 
 @router.get("/courses/get")
 async def method_courses_get(
-    name: str | None = None, course_id: str | None = None, db: Session = Depends(get_db)
+    name: str | None = None,
+    course_id: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Returns one course by id/name."""
 
@@ -86,9 +113,9 @@ async def method_courses_get(
         )
 
     course = (
-        crud.course.get_by_id(db, course_id)
+        await crud.course.get_by_id_async(db, course_id)
         if course_id
-        else crud.course.get_by_name(db, name)
+        else await crud.course.get_by_name_async(db, name)
     )
     if not course:
         return api_error(ApiErrorCode.API_ITEM_NOT_FOUND, "Course not found!")
@@ -101,10 +128,12 @@ async def method_courses_buy(
     req: Request,
     name: str | None = None,
     course_id: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Buys course by id/name."""
-    user = query_auth_data_from_request(req, db).user
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    user = await auth_data.get_user()
 
     if (not name and not course_id) or (name and course_id):
         return api_error(
@@ -113,14 +142,14 @@ async def method_courses_buy(
         )
 
     course = (
-        crud.course.get_by_id(db, course_id)
+        await crud.course.get_by_id_async(db, course_id)
         if course_id
-        else crud.course.get_by_name(db, name)
+        else await crud.course.get_by_name_async(db, name)
     )
     if not course:
         return api_error(ApiErrorCode.API_ITEM_NOT_FOUND, "Course not found!")
     if course.price > 0:
-        if user.role.p_buy_courses_for_free:
+        if permissions.p_buy_courses_for_free:
             pass
         else:
             return api_error(
@@ -128,27 +157,17 @@ async def method_courses_buy(
                 "Purchasing courses that are not free is not implemented yet!",
             )
 
-    if not user.role.p_buy_courses:
+    if not permissions.p_buy_courses:
         return api_error(
             ApiErrorCode.API_FORBIDDEN,
             "Your role does not allows to buy courses! Please reach out support!",
         )
-    if crud.user_course.get_by_user_id_and_course_id(
-        db, user_id=user.id, course_id=course.id
-    ):
-        return api_error(
-            ApiErrorCode.API_FORBIDDEN, "That course is already purchased by you!"
-        )
-
-    purchased_course = crud.user_course.create(db, user_id=user.id, course_id=course.id)
+    purchased_course = await crud.user_course.purchase_async(
+        db, user_id=user.id, course=course
+    )
     if not purchased_course:
-        get_logger().warning(
-            "Failed to create new course purchase! "
-            f"From user_id: {user.id}, course_id: {course.id}"
-        )
         return api_error(
-            ApiErrorCode.API_UNKNOWN_ERROR,
-            "Failed to purchase course due to unknown error!",
+            ApiErrorCode.API_FORBIDDEN, "That course is already purchased by you!"
         )
 
     get_logger().info(
@@ -169,12 +188,14 @@ async def method_courses_new(
     title: str,
     description: str,
     price: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Creates new course (permitted only)."""
 
-    user = query_auth_data_from_request(req, db).user
-    if not user.role.p_create_courses:
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    user = await auth_data.get_user()
+    if not permissions.p_create_courses:
         return api_error(
             ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
         )
@@ -184,7 +205,7 @@ async def method_courses_new(
     except KeyError:
         return api_error(ApiErrorCode.API_INVALID_REQUEST, "Invalid difficulty name!")
 
-    course = crud.course.create(
+    course = await crud.course.create_async(
         db,
         difficulty=difficulty_enum,
         owner_id=user.id,
@@ -201,12 +222,13 @@ async def method_courses_new(
 
 @router.get("/courses/edit")
 async def method_courses_edit(
-    req: Request, db: Session = Depends(get_db)
+    req: Request, db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """Edits course (permitted only)."""
 
-    user = query_auth_data_from_request(req, db).user
-    if not user.role.p_edit_courses:
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    if not permissions.p_edit_courses:
         return api_error(
             ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
         )
@@ -0,0 +1,52 @@
+"""
+    Internal API router.
+    Provides API methods (routes) for internal usage (monitoring).
+"""
+
+from fastapi import APIRouter, Request, Depends
+from fastapi.responses import JSONResponse
+
+from app.config import get_settings
+from app.database import instrumentation
+from app.database.dependencies import get_async_db, AsyncSession
+from app.services import tokens_revocation
+from app.services.limiter import FastAPILimiter
+from app.services.api.response import api_error, api_success, ApiErrorCode
+from app.services.request.auth import (
+    get_verified_tokens_cache_metrics,
+    query_auth_data_from_request,
+)
+
+router = APIRouter()
+
+
+@router.get("/internal/metrics", include_in_schema=False)
+async def method_internal_metrics(
+    req: Request, db: AsyncSession = Depends(get_async_db)
+) -> JSONResponse:
+    """Returns internal metrics (if enabled), only for administrators (who manage roles)."""
+
+    if not get_settings().internal_metrics_enabled:
+        return api_error(
+            ApiErrorCode.API_METHOD_NOT_FOUND,
+            "Method not found! Please read documentation.",
+        )
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    if not permissions.p_manage_roles:
+        return api_error(
+            ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
+        )
+
+    return api_success(
+        {
+            "database_pools": instrumentation.get_pools_metrics(),
+            "verified_tokens_cache": get_verified_tokens_cache_metrics(),
+            "tokens_revocation": tokens_revocation.get_metrics(),
+            "requests_limiter_batching": (
+                FastAPILimiter.batcher.get_metrics()
+                if FastAPILimiter.batcher is not None
+                else None
+            ),
+        }
+    )
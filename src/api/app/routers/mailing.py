@@ -5,7 +5,7 @@
 
 from app.services.api.response import api_error, ApiErrorCode, api_success
 from app.services.request.auth import query_auth_data_from_request
-from app.database.dependencies import get_db, Session
+from app.database.dependencies import get_async_db, AsyncSession
 from app.database import crud
 from app.email.messages import send_custom_email
 from fastapi import APIRouter, Request, Depends, BackgroundTasks
@@ -24,12 +24,13 @@ async def method_mailing_send(
     mailing_group_id: int | None = None,
     skip_create_task: bool = False,
     display_recepients: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Creates new mailing task (Permitted only)."""
 
-    user = query_auth_data_from_request(req, db).user
-    if not user.role.p_manage_mailings:
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    if not permissions.p_manage_mailings:
         return api_error(
             ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
         )
@@ -45,7 +46,7 @@ async def method_mailing_send(
             ApiErrorCode.API_ITEM_NOT_FOUND, "Mailing group is not found yet..."
         )
     else:
-        users = crud.user.get_all(db)
+        users = await crud.user.get_all_async(db)
     # Doing database requests like that is not good!
     recepients = [user.email for user in users]
 
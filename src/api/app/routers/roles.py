@@ -7,8 +7,8 @@ from fastapi.responses import JSONResponse
 
 from app.services.api.response import api_error, ApiErrorCode, api_success
 from app.services.request.auth import query_auth_data_from_request
-from app.database.dependencies import get_db, Session
-from app.database.models.user_role import UserRole
+from app.database.dependencies import get_async_db, AsyncSession
+from app.services.permissions import get_all_role_permissions
 
 
 router = APIRouter()
@@ -16,11 +16,12 @@ router = APIRouter()
 
 @router.get("/roles")
 async def method_roles_list(
-    req: Request, db: Session = Depends(get_db)
+    req: Request, db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """Returns all roles."""
-    user = query_auth_data_from_request(req, db).user
-    if not user.role.p_manage_roles:
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    if not permissions.p_manage_roles:
         return api_error(
             ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
         )
@@ -31,13 +32,9 @@ async def method_roles_list(
                 {
                     "name": role.name,
                     "id": role.id,
-                    "permisions": {
-                        k: v
-                        for k, v in role.__dict__.items()
-                        if isinstance(k, str) and k.startswith("p_")
-                    },
+                    "permisions": role.serialize_permissions(),
                 }
-                for role in db.query(UserRole).all()
+                for role in await get_all_role_permissions(db)
             ]
         }
     )
@@ -3,14 +3,22 @@
     Provides API methods (routes) for working with users.
 """
 
-from app.services.api.response import api_error, ApiErrorCode, api_success
+from typing import AsyncIterator
+
+from app.services.api.response import (
+    api_error,
+    ApiErrorCode,
+    api_success,
+    api_success_stream,
+)
 from app.services.request.auth import query_auth_data_from_request
-from app.database.dependencies import get_db, Session
+from app.database.dependencies import get_async_db, AsyncSession
+from app.database.core import AsyncSessionLocal
 from app.serializers.user import serialize_user, serialize_users
 from app.serializers.user_course import serialize_user_courses
 from app.database import crud
 from fastapi import APIRouter, Request, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 
 router = APIRouter()
@@ -18,14 +26,16 @@ router = APIRouter()
 
 @router.get("/users/me")
 async def method_users_me(
-    req: Request, show_courses: bool = False, db: Session = Depends(get_db)
+    req: Request,
+    show_courses: bool = False,
+    db: AsyncSession = Depends(get_async_db),
 ) -> JSONResponse:
     """Returns id, email for current user."""
-    auth_data = query_auth_data_from_request(req, db)
+    auth_data = await query_auth_data_from_request(req, db)
 
-    serialized_user = serialize_user(auth_data.user)
+    serialized_user = serialize_user(await auth_data.get_user())
     if show_courses:
-        purchased_courses = crud.user_course.get_by_user_id(
+        purchased_courses = await crud.user_course.get_by_user_id_async(
             db, user_id=auth_data.user_id
         )
         return api_success(serialized_user | serialize_user_courses(purchased_courses))
@@ -34,12 +44,14 @@ async def method_users_me(
 
 @router.get("/users/me/courses")
 async def method_users_me_courses(
-    req: Request, db: Session = Depends(get_db)
+    req: Request, db: AsyncSession = Depends(get_async_db)
 ) -> JSONResponse:
     """Returns list of your courses."""
-    auth_data = query_auth_data_from_request(req, db)
+    auth_data = await query_auth_data_from_request(req, db)
 
-    purchased_courses = crud.user_course.get_by_user_id(db, user_id=auth_data.user_id)
+    purchased_courses = await crud.user_course.get_by_user_id_async(
+        db, user_id=auth_data.user_id
+    )
     return api_success(
         {"total": len(purchased_courses)} | serialize_user_courses(purchased_courses)
     )
@@ -47,15 +59,55 @@ async def method_users_me_courses(
 
 @router.get("/users/list")
 async def method_users_list(
-    req: Request, db: Session = Depends(get_db)
-) -> JSONResponse:
-    """Returns list of all users (Permitted only)."""
+    req: Request,
+    stream: bool = False,
+    per_page: int | None = None,
+    after_id: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+) -> JSONResponse | StreamingResponse:
+    """
+    Returns list of all users (Permitted only).
+    Pass `stream=true` to get all users streamed (chunked) with server side cursor,
+    or `per_page` (and `after_id` from previous page `next_after_id`) to get users by pages.
+    """
 
-    user = query_auth_data_from_request(req, db).user
-    if not user.role.p_list_users:
+    auth_data = await query_auth_data_from_request(req, db)
+    permissions = await auth_data.get_permissions()
+    if not permissions.p_list_users:
         return api_error(
             ApiErrorCode.API_FORBIDDEN, "You have no access to call this method!"
         )
 
-    users = crud.user.get_all(db)
+    if stream:
+        return api_success_stream("users", _iterate_serialized_users())
+
+    if per_page is not None:
+        if not 1 <= per_page <= 1000:
+            return api_error(
+                ApiErrorCode.API_INVALID_REQUEST,
+                "`per_page` should between 1 and 1000!",
+            )
+        try:
+            users = await crud.user.get_page_async(
+                db, per_page=per_page, after_id=after_id
+            )
+        except ValueError:
+            return api_error(ApiErrorCode.API_INVALID_REQUEST, "Invalid `after_id`!")
+        next_after_id = users[-1].id if len(users) == per_page else None
+        return api_success(
+            {"total": len(users), "next_after_id": next_after_id}
+            | serialize_users(users)
+        )
+
+    users = await crud.user.get_all_async(db)
     return api_success({"total": len(users)} | serialize_users(users))
+
+
+async def _iterate_serialized_users() -> AsyncIterator[dict]:
+    """
+    Yields all serialized users, fetched with server side cursor.
+    Uses own session, as response is streamed after request handler returns.
+    """
+    async with AsyncSessionLocal() as db:
+        async for user in crud.user.iterate_all_async(db):
+            yield serialize_user(user, in_list=True)
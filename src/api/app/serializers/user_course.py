@@ -14,7 +14,7 @@ def serialize(user_course: UserCourse, serailize_parent_course: bool = True,in_l
         "purchase_id": user_course.id,
         "course_id": user_course.course_id,
         "purchased_for": user_course.purchased_for,
-        "purchased_at": time.mktime(user_course.time_purchased.timetuple()),
+        "purchased_at": time.mktime(user_course.purchased_at.timetuple()),
     }
     
     if serailize_parent_course:
@@ -2,6 +2,6 @@
     Services utils.
 """
 
-from . import api, request
+from . import api, cache, permissions, users_cache, request
 
-__all__ = ["api", "request"]
+__all__ = ["api", "cache", "permissions", "users_cache", "request"]
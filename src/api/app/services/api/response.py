@@ -2,7 +2,10 @@
     API response wrappers.
 """
 
-from fastapi.responses import JSONResponse
+import json
+from typing import AsyncIterator
+
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from .errors import ApiErrorCode
 from .version import API_VERSION
@@ -36,3 +39,27 @@ def api_error(
 def api_success(data: dict) -> JSONResponse:
     """Returns API success response."""
     return JSONResponse({"v": API_VERSION, "success": data}, status_code=200)
+
+
+def api_success_stream(
+    list_key: str, items: AsyncIterator[dict], chunk_size: int = 100
+) -> StreamingResponse:
+    """
+    Returns API success response with list of items streamed (chunked) as they are yielded,
+    so whole list is never held in memory. Total items count is sent after the list.
+    """
+
+    async def _stream_body() -> AsyncIterator[str]:
+        yield f'{{"v":{json.dumps(API_VERSION)},"success":{{{json.dumps(list_key)}:['
+        total, chunk = 0, []
+        async for item in items:
+            chunk.append(json.dumps(item))
+            total += 1
+            if len(chunk) >= chunk_size:
+                yield ("," if total > len(chunk) else "") + ",".join(chunk)
+                chunk = []
+        if chunk:
+            yield ("," if total > len(chunk) else "") + ",".join(chunk)
+        yield f'],"total":{total}}}}}'
+
+    return StreamingResponse(_stream_body(), media_type="application/json")
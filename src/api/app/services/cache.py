@@ -0,0 +1,79 @@
+"""
+    Cache (Redis) client, shared by services that keeps state shared between workers.
+    Also provides pub/sub listener for services that should be notified by other workers.
+"""
+
+import asyncio
+import inspect
+from typing import Awaitable, Callable
+
+import aioredis
+
+from app.config import get_settings, get_logger
+
+_redis: aioredis.Redis | None = None
+_pubsub_redis: aioredis.Redis | None = None
+_LISTENER_RETRY_DELAY = 5
+
+
+def get_redis() -> aioredis.Redis:
+    """Returns Redis client (lazy, connections are opened on first command)."""
+    global _redis  # pylint: disable=global-statement
+    if _redis is None:
+        settings = get_settings()
+        _redis = aioredis.from_url(
+            settings.cache_dsn,
+            encoding=settings.cache_encoding,
+            decode_responses=True,
+            socket_timeout=settings.cache_timeout,
+            socket_connect_timeout=settings.cache_timeout,
+        )
+    return _redis
+
+
+def _get_pubsub_redis() -> aioredis.Redis:
+    """
+    Returns Redis client for pub/sub listeners (lazy),
+    without read timeout, as listener waits for messages.
+    """
+    global _pubsub_redis  # pylint: disable=global-statement
+    if _pubsub_redis is None:
+        settings = get_settings()
+        _pubsub_redis = aioredis.from_url(
+            settings.cache_dsn,
+            encoding=settings.cache_encoding,
+            decode_responses=True,
+            socket_connect_timeout=settings.cache_timeout,
+        )
+    return _pubsub_redis
+
+
+async def listen_channel(
+    channel: str,
+    on_message: Callable[[str], None],
+    on_subscribe: Callable[[], None | Awaitable[None]],
+) -> None:
+    """
+    Listens for messages in pub/sub channel forever (reconnects on failure).
+    Should be run as background task.
+    :param on_message: Called with each message data.
+    :param on_subscribe: Called (or awaited, if coroutine function) after (re)subscribing,
+    as messages may be missed while not subscribed.
+    """
+    while True:
+        pubsub = _get_pubsub_redis().pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            subscribed = on_subscribe()
+            if inspect.isawaitable(subscribed):
+                await subscribed
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    on_message(message["data"])
+        except (aioredis.RedisError, OSError):
+            get_logger().warning(
+                f"Lost subscription to `{channel}` channel, reconnecting..."
+            )
+        finally:
+            await pubsub.reset()
+        await asyncio.sleep(_LISTENER_RETRY_DELAY)
@@ -8,16 +8,26 @@
 """
 
 
+import time
 from math import ceil
+from multiprocessing import cpu_count
 from typing import Callable
 
 import aioredis
-from app.config import get_settings
 from fastapi import HTTPException
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.status import HTTP_429_TOO_MANY_REQUESTS
 
+from app.config import get_logger, get_settings
+from app.services.limiter import scripts
+from app.services.limiter.approximate import ApproximateLimiter
+from app.services.limiter.batching import EvalshaBatcher
+from app.services.limiter.fallback import LocalLimiter
+
+# Seconds to use fallback limiter after Redis failure, doubled on each next failure.
+_RECONNECT_BACKOFF_MIN = 0.1
+
 
 async def default_identifier(request: Request):
     """Returns default limiter Redis identifier for unique key."""
@@ -50,12 +60,29 @@ async def default_callback(
     )
 
 
+async def rate_limit_headers_middleware(request: Request, call_next):
+    """
+    Adds rate limit headers (`X-RateLimit-*`, set by GCRA limiter on request state)
+    to the response, as endpoints returns own responses (dependency response is not used).
+    """
+    response = await call_next(request)
+    headers = getattr(request.state, "rate_limit_headers", None)
+    if headers is not None:
+        response.headers.update(headers)
+    return response
+
+
 class FastAPILimiter:
     redis: aioredis.Redis = None
     prefix: str = None
-    lua_sha: str = None
     identifier: Callable = None
     callback: Callable = None
+    approximate: ApproximateLimiter = None
+    batcher: EvalshaBatcher | None = None
+    fallback: LocalLimiter = None
+    # Redis is not used until that (monotonic) time, see `mark_unavailable`.
+    unavailable_until: float = 0.0
+    reconnect_backoff: float = 0.0
     lua_script = """local key = KEYS[1]
 local limit = tonumber(ARGV[1])
 local expire_time = ARGV[2]
@@ -71,6 +98,31 @@ else
     redis.call("SET", key, 1,"px",expire_time)
  return 0
 end"""
+    # Generic cell rate algorithm (GCRA): requests are spread evenly over the period,
+    # with bursts up to limit (no double bursts at window edges, as there is no window).
+    # Stores theoretical arrival time (TAT) in milliseconds, returns
+    # {allowed (1 or 0), remaining, milliseconds to retry after, milliseconds to full reset}.
+    gcra_lua_script = """if redis.replicate_commands then
+    redis.replicate_commands()
+end
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local interval = period / limit
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
+local tat = math.max(tonumber(redis.call('GET', key) or "0"), now)
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if allow_at > now then
+    return {0, 0, math.ceil(allow_at - now), math.ceil(tat - now)}
+end
+redis.call('SET', key, string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+local remaining = math.floor((period - (new_tat - now)) / interval)
+return {1, remaining, 0, math.ceil(new_tat - now)}"""
+    # Loaded on first use, as Redis is connected lazily.
+    lua = scripts.Script(lua_script)
+    gcra_lua = scripts.Script(gcra_lua_script)
 
     @classmethod
     async def init(
@@ -84,19 +136,89 @@ end"""
         cls.prefix = prefix
         cls.identifier = identifier
         cls.callback = callback
-        cls.lua_sha = await redis.script_load(cls.lua_script)
+        cls.lua.reset()
+        cls.gcra_lua.reset()
+
+        settings = get_settings()
+        # Assumes gunicorn workers (`gunicorn.conf.py`) if not set, see setting.
+        workers = settings.requests_limiter_approximate_workers or 2 * cpu_count() + 1
+        cls.approximate = ApproximateLimiter(
+            redis,
+            workers=workers,
+            sync_interval=settings.requests_limiter_approximate_sync_interval / 1000,
+        )
+        await cls.approximate.init()
+        cls.fallback = LocalLimiter(
+            max_keys=settings.requests_limiter_fallback_max_keys, workers=workers
+        )
+        if settings.requests_limiter_batch_max_size > 1:
+            cls.batcher = EvalshaBatcher(
+                redis,
+                window=settings.requests_limiter_batch_window / 1000,
+                max_size=settings.requests_limiter_batch_max_size,
+            )
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Returns false if Redis failed recently (fallback limiter should be used)."""
+        return cls.unavailable_until <= time.monotonic()
+
+    @classmethod
+    def mark_available(cls):
+        """Resets reconnect backoff after successful Redis call."""
+        if cls.reconnect_backoff:
+            get_logger().info("Requests limiter is using Redis again.")
+            cls.reconnect_backoff = 0.0
+
+    @classmethod
+    def mark_unavailable(cls):
+        """Switches to fallback limiter until reconnect backoff (doubled on each failure)."""
+        if not cls.is_available():
+            return  # Concurrent requests failed with same failure.
+        max_backoff = get_settings().requests_limiter_reconnect_backoff_max
+        cls.reconnect_backoff = min(
+            max(cls.reconnect_backoff * 2, _RECONNECT_BACKOFF_MIN), max_backoff
+        )
+        cls.unavailable_until = time.monotonic() + cls.reconnect_backoff
+        # Scripts may be lost (Redis restarted).
+        cls.lua.reset()
+        cls.gcra_lua.reset()
+        get_logger().warning(
+            "Requests limiter failed to use Redis, using in-memory limiter "
+            f"for {cls.reconnect_backoff:.1f}s!"
+        )
+
+    @classmethod
+    async def evalsha(cls, script: scripts.Script, numkeys: int, *args):
+        """
+        Calls limiter script, within batch of concurrent calls (if enabled).
+        Script is loaded again if Redis lost it, see `scripts.evalsha`.
+        """
+        call = cls.batcher.evalsha if cls.batcher is not None else None
+        return await scripts.evalsha(cls.redis, script, numkeys, *args, call=call)
 
     @classmethod
     async def close(cls):
+        if cls.redis is None:
+            return
+        if cls.approximate is not None:
+            await cls.approximate.close()
         await cls.redis.close()
 
 
 async def on_startup():
     settings = get_settings()
-    redis = await aioredis.from_url(
-        settings.cache_dsn, encoding=settings.cache_encoding, decode_responses=True
+    if not settings.requests_limiter_enabled:
+        return  # Redis is not required (and not connected) when limiter is disabled.
+
+    # Connections are opened on first command (lazy), and reopened after failure.
+    redis = aioredis.from_url(
+        settings.cache_dsn,
+        encoding=settings.cache_encoding,
+        decode_responses=True,
+        socket_timeout=settings.requests_limiter_redis_timeout,
+        socket_connect_timeout=settings.requests_limiter_redis_timeout,
     )
-
     await FastAPILimiter.init(redis)
 
 
@@ -0,0 +1,202 @@
+"""
+    Approximate (hybrid) requests limiter.
+    Each worker leases share of the key budget from Redis and spends it locally (in memory),
+    so Redis is queried once per lease instead of once per request.
+    Leases are reconciled with Redis in batches (single pipeline) every sync interval:
+    unused tokens of idle keys are returned, exhausted keys are checked for returned tokens.
+
+    Accuracy bounds (per key and window):
+    - Never admits more than limit, as leased tokens are counted in Redis when leased.
+    - May admit less: tokens leased by a worker can be used only by that worker until
+    returned (key was idle for sync interval) or lost at window end, and exhausted key
+    is rechecked once per sync interval.
+"""
+
+import asyncio
+import time
+
+import aioredis
+
+from app.config import get_logger
+
+from .scripts import Script, evalsha
+
+# Leases part of remaining budget (remaining / workers, at least one) and returns
+# leased tokens count (0 if exhausted) and milliseconds until window end.
+# Compatible with exact limiter script (count stored in the key that expires at window end).
+_LEASE_SCRIPT = """local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local expire_time = tonumber(ARGV[2])
+local workers = tonumber(ARGV[3])
+local current = tonumber(redis.call('get', key) or "0")
+local ttl = redis.call('pttl', key)
+if ttl < 0 then
+    current = 0
+    ttl = expire_time
+end
+if current >= limit then
+    return {0, ttl}
+end
+local lease = math.ceil((limit - current) / workers)
+redis.call('set', key, current + lease, 'px', ttl)
+return {lease, ttl}"""
+
+# Returns unused leased tokens (if key is not expired yet).
+_RETURN_SCRIPT = """local key = KEYS[1]
+local current = tonumber(redis.call('get', key) or "0")
+local tokens = math.min(tonumber(ARGV[1]), current)
+if tokens > 0 then
+    redis.call('decrby', key, tokens)
+end
+return tokens"""
+
+
+class _Bucket:
+    """Local state of the key: leased tokens left, and window it was leased for."""
+
+    __slots__ = (
+        "times",
+        "milliseconds",
+        "tokens",
+        "hits",
+        "exhausted",
+        "expires_at",
+        "leasing",
+    )
+
+    def __init__(self, times: int, milliseconds: int) -> None:
+        self.times = times
+        self.milliseconds = milliseconds
+        self.tokens = 0
+        self.hits = 0  # Requests since last sync, bucket is idle if there was none.
+        self.exhausted = False  # Redis budget is exhausted, rejected until sync.
+        self.expires_at = time.monotonic() + milliseconds / 1000
+        self.leasing: asyncio.Task | None = None
+
+
+class ApproximateLimiter:
+    """Limiter that spends budget leased from Redis locally, see module docstring."""
+
+    def __init__(
+        self, redis: aioredis.Redis, workers: int, sync_interval: float
+    ) -> None:
+        """
+        :param workers: Count of workers sharing the budget (lease is it`s share).
+        :param sync_interval: Seconds between reconciliations with Redis.
+        """
+        self.redis = redis
+        self.workers = workers
+        self.sync_interval = sync_interval
+        self._buckets: dict[str, _Bucket] = {}
+        self._lease_script = Script(_LEASE_SCRIPT)
+        self._return_script = Script(_RETURN_SCRIPT)
+        self._sync_task: asyncio.Task | None = None
+
+    async def init(self) -> None:
+        """Starts reconciliation with Redis (background task), scripts are loaded lazily."""
+        self._sync_task = asyncio.create_task(self._sync_periodically())
+
+    async def close(self) -> None:
+        """Stops reconciliation (unused tokens are lost until window end)."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+
+    async def hit(self, key: str, times: int, milliseconds: int) -> int:
+        """Spends token of the key, returns 0 if allowed or milliseconds until reset."""
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.expires_at <= time.monotonic():
+            bucket = self._buckets[key] = _Bucket(times, milliseconds)
+        bucket.hits += 1
+
+        while bucket.tokens <= 0 and not bucket.exhausted:
+            if bucket.leasing is None:
+                bucket.leasing = asyncio.create_task(self._lease(key, bucket))
+            await asyncio.shield(bucket.leasing)
+
+        if bucket.tokens <= 0:
+            return max(1, int((bucket.expires_at - time.monotonic()) * 1000))
+        bucket.tokens -= 1
+        return 0
+
+    async def sync(self) -> None:
+        """
+        Reconciles local buckets with Redis (single pipeline):
+        returns tokens of idle keys, and leases again for exhausted ones.
+        """
+        now = time.monotonic()
+        returned: list[tuple[str, int]] = []
+        exhausted: list[tuple[str, _Bucket]] = []
+        for key, bucket in list(self._buckets.items()):
+            if bucket.leasing is not None:
+                continue
+            if bucket.expires_at <= now:
+                del self._buckets[key]
+            elif bucket.hits == 0:
+                del self._buckets[key]
+                # Near window end tokens are not returned, as key may be expired.
+                if bucket.tokens > 0 and bucket.expires_at - now > self.sync_interval:
+                    returned.append((key, bucket.tokens))
+            else:
+                bucket.hits = 0
+                if bucket.exhausted:
+                    exhausted.append((key, bucket))
+        if not returned and not exhausted:
+            return
+
+        return_sha = await self._return_script.load(self.redis)
+        lease_sha = await self._lease_script.load(self.redis)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, tokens in returned:
+                pipe.evalsha(return_sha, 1, key, tokens)
+            for key, bucket in exhausted:
+                pipe.evalsha(lease_sha, *self._lease_args(key, bucket))
+            results = await pipe.execute()
+        for (_, bucket), result in zip(exhausted, results[len(returned):]):
+            self._apply_lease(bucket, result)
+
+    async def _lease(self, key: str, bucket: _Bucket) -> None:
+        """Leases tokens for the key from Redis."""
+        try:
+            result = await evalsha(
+                self.redis, self._lease_script, *self._lease_args(key, bucket)
+            )
+            self._apply_lease(bucket, result)
+        except (aioredis.RedisError, OSError):
+            self.reset_scripts()
+            raise
+        finally:
+            bucket.leasing = None
+
+    def reset_scripts(self) -> None:
+        """Forgets loaded scripts (reloaded on next use, as Redis may be restarted)."""
+        self._lease_script.reset()
+        self._return_script.reset()
+
+    def _lease_args(self, key: str, bucket: _Bucket) -> tuple:
+        """Returns arguments of lease script call for the key (after SHA)."""
+        return (
+            1,
+            key,
+            bucket.times,
+            bucket.milliseconds,
+            self.workers,
+        )
+
+    @staticmethod
+    def _apply_lease(bucket: _Bucket, result: list[int]) -> None:
+        """Adds leased tokens to the bucket, and aligns it window with Redis."""
+        tokens, ttl = int(result[0]), int(result[1])
+        bucket.tokens += tokens
+        bucket.exhausted = tokens == 0
+        bucket.expires_at = time.monotonic() + ttl / 1000
+
+    async def _sync_periodically(self) -> None:
+        """Reconciles with Redis every sync interval."""
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except (aioredis.RedisError, OSError):
+                self.reset_scripts()
+                get_logger().warning("Failed to sync approximate requests limiter!")
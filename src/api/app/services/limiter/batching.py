@@ -0,0 +1,98 @@
+"""
+    Micro-batching of requests limiter checks.
+    Checks (script calls) of concurrent requests arriving within short window are sent
+    to Redis as single pipeline (one round trip), and each caller gets it`s own result.
+    Window is waited only while previous batch is in flight (under load), otherwise
+    batch is sent on next event loop iteration, to not add latency to single requests.
+"""
+
+import asyncio
+
+import aioredis
+
+
+class EvalshaBatcher:
+    """Sends concurrent `evalsha` calls in batches (pipelines)."""
+
+    def __init__(self, redis: aioredis.Redis, window: float, max_size: int) -> None:
+        """
+        :param window: Seconds to wait for more calls after first call of the batch,
+        while previous batch is in flight.
+        :param max_size: Max calls in batch, batch is sent immediately when it is full.
+        """
+        self.redis = redis
+        self.window = window
+        self.max_size = max_size
+        self._batch: list[tuple[tuple, asyncio.Future]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._in_flight = 0  # Batches sent and not yet answered by Redis.
+
+        # Metrics.
+        self.calls = 0
+        self.batches = 0
+
+    async def evalsha(self, sha: str, numkeys: int, *args):
+        """Calls script (as `redis.evalsha`) within next batch, returns it`s result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append(((sha, numkeys, *args), future))
+        if len(self._batch) >= self.max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self._in_flight:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                # Nothing to wait for, batch only calls made within current loop iteration.
+                self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def get_metrics(self) -> dict:
+        """Returns batching metrics (average batch size)."""
+        return {
+            "calls": self.calls,
+            "batches": self.batches,
+            "avg_batch_size": self.calls / self.batches if self.batches else 0.0,
+        }
+
+    def _flush(self) -> None:
+        """Sends current batch (in background task)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._execute(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, batch: list[tuple[tuple, asyncio.Future]]) -> None:
+        """Executes batch as pipeline, and resolves futures of the callers."""
+        self.calls += len(batch)
+        self.batches += 1
+        self._in_flight += 1
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for args, _ in batch:
+                    pipe.evalsha(*args)
+                results = await pipe.execute(raise_on_error=False)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        finally:
+            self._in_flight -= 1
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue  # Caller is cancelled.
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,10 +1,14 @@
 # pylint: disable=all
-from typing import Callable, Optional
+from math import ceil
+from typing import Callable, Literal, Optional
 
+import aioredis
 from pydantic import conint
 from starlette.requests import Request
 from starlette.responses import Response
 
+from app.config import get_settings
+
 from . import FastAPILimiter
 
 
@@ -18,37 +22,100 @@ class RateLimiter:
         hours: conint(ge=-1) = 0,
         identifier: Optional[Callable] = None,
         callback: Optional[Callable] = None,
+        mode: Literal["exact", "approximate"] = "exact",
+        algorithm: Literal["fixed-window", "gcra"] = "fixed-window",
     ):
+        """
+        :param mode: `exact` checks each request in Redis, `approximate` spends
+        budget leased from Redis locally (see `limiter.approximate` for accuracy).
+        :param algorithm: `fixed-window` counts requests in window (may allow
+        double burst at window edge), `gcra` spreads requests evenly over period
+        and sets `X-RateLimit-*` headers on each response (only with `exact` mode,
+        headers are added by `rate_limit_headers_middleware`).
+        """
+        if algorithm == "gcra" and mode != "exact":
+            raise ValueError("GCRA limiter algorithm requires `exact` mode!")
         self.times = times
         self.milliseconds = (
             milliseconds + 1000 * seconds + 60000 * minutes + 3600000 * hours
         )
         self.identifier = identifier
         self.callback = callback
+        self.mode = mode
+        self.algorithm = algorithm
+        # Index of the limiter in route dependencies (Redis key suffix), by route endpoint.
+        # Resolved once on first request to the route, as routes are not changed at runtime.
+        self._indexes: dict[Callable, int] = {}
 
     async def __call__(self, request: Request, response: Response):
+        if not get_settings().requests_limiter_enabled:
+            return
         if not FastAPILimiter.redis:
             raise Exception(
                 "You must call FastAPILimiter.init in startup event of fastapi!"
             )
-        index = 0
-        for route in request.app.routes:
-            if route.path == request.scope["path"]:
-                for idx, dependency in enumerate(route.dependencies):
-                    if self is dependency.dependency:
-                        index = idx
-                        break
+        endpoint = request.scope.get("endpoint")
+        index = self._indexes.get(endpoint)
+        if index is None:
+            index = self._resolve_index(request)
+            if endpoint is not None:
+                self._indexes[endpoint] = index
         # moved here because constructor run before app startup
         identifier = self.identifier or FastAPILimiter.identifier
         callback = self.callback or FastAPILimiter.callback
-        redis = FastAPILimiter.redis
         rate_key = await identifier(request)
         key = f"{FastAPILimiter.prefix}:{rate_key}:{index}"
-        pexpire = await redis.evalsha(
-            FastAPILimiter.lua_sha, 1, key, str(self.times), str(self.milliseconds)
-        )
+        pexpire = None
+        if FastAPILimiter.is_available():
+            try:
+                pexpire = await self._hit(key, request)
+                FastAPILimiter.mark_available()
+            except (aioredis.RedisError, OSError):
+                FastAPILimiter.mark_unavailable()
+        if pexpire is None:
+            # Redis is unavailable, requests are limited in worker memory.
+            pexpire = FastAPILimiter.fallback.hit(key, self.times, self.milliseconds)
         if pexpire != 0:
             return await callback(request, response, pexpire)
 
+    async def _hit(self, key: str, request: Request) -> int:
+        """Hits limiter in Redis, returns 0 or milliseconds to retry after."""
+        if self.algorithm == "gcra":
+            return await self._hit_gcra(key, request)
+        if self.mode == "approximate":
+            return await FastAPILimiter.approximate.hit(
+                key, self.times, self.milliseconds
+            )
+        return await FastAPILimiter.evalsha(
+            FastAPILimiter.lua, 1, key, str(self.times), str(self.milliseconds)
+        )
+
+    async def _hit_gcra(self, key: str, request: Request) -> int:
+        """
+        Hits GCRA limiter and sets rate limit headers on request state
+        (for `rate_limit_headers_middleware`), returns 0 or retry after (ms).
+        """
+        allowed, remaining, retry_after, reset = await FastAPILimiter.evalsha(
+            FastAPILimiter.gcra_lua, 1, key, str(self.times), str(self.milliseconds)
+        )
+        request.state.rate_limit_headers = {
+            "X-RateLimit-Limit": str(self.times),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(ceil(int(reset) / 1000)),
+        }
+        return 0 if allowed else max(1, int(retry_after))
+
+    def _resolve_index(self, request: Request) -> int:
+        """Returns index of the limiter in dependencies of the request route (0 if not found)."""
+        endpoint = request.scope.get("endpoint")
+        for route in request.app.routes:
+            if (
+                endpoint is not None and getattr(route, "endpoint", None) is endpoint
+            ) or (endpoint is None and route.path == request.scope["path"]):
+                for idx, dependency in enumerate(getattr(route, "dependencies", [])):
+                    if self is dependency.dependency:
+                        return idx
+        return 0
+
     async def check(self, request: Request, response: Response | None = None):
         return await self.__call__(request, response)
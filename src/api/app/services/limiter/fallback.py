@@ -0,0 +1,38 @@
+"""
+    In-process requests limiter, used while Redis is unavailable.
+    Counts requests in fixed windows in worker memory (bounded count of keys),
+    each worker allows it`s share of the limit (limit / workers), as workers do not share state.
+"""
+
+import time
+from collections import OrderedDict
+from math import ceil
+
+
+class LocalLimiter:
+    """Fixed window limiter with bounded LRU of keys."""
+
+    def __init__(self, max_keys: int, workers: int) -> None:
+        """
+        :param max_keys: Max keys counted (least recently used keys are forgotten).
+        :param workers: Count of workers sharing the limit.
+        """
+        self.max_keys = max_keys
+        self.workers = workers
+        # Key -> [monotonic time when window ends, requests count].
+        self._windows: OrderedDict[str, list] = OrderedDict()
+
+    def hit(self, key: str, times: int, milliseconds: int) -> int:
+        """Counts request of the key, returns 0 if allowed or milliseconds until reset."""
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or window[0] <= now:
+            window = self._windows[key] = [now + milliseconds / 1000, 0]
+        self._windows.move_to_end(key)
+        while len(self._windows) > self.max_keys:
+            self._windows.popitem(last=False)
+
+        if window[1] >= ceil(times / self.workers):
+            return max(1, int((window[0] - now) * 1000))
+        window[1] += 1
+        return 0
@@ -0,0 +1,49 @@
+"""
+    Lua scripts of requests limiter.
+    Scripts are loaded into Redis on first use (as Redis is connected lazily),
+    and loaded again if Redis lost them (restarted), without failing over to in-memory limiter.
+"""
+
+from typing import Awaitable, Callable
+
+import aioredis
+from aioredis.exceptions import NoScriptError
+
+
+class Script:
+    """Lua script, with it`s SHA once loaded into Redis."""
+
+    __slots__ = ("source", "sha")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.sha: str | None = None
+
+    async def load(self, redis: aioredis.Redis) -> str:
+        """Returns SHA of the script, loads it if it is not loaded yet."""
+        if self.sha is None:
+            self.sha = await redis.script_load(self.source)
+        return self.sha
+
+    def reset(self) -> None:
+        """Forgets SHA of the script (loaded again on next use)."""
+        self.sha = None
+
+
+async def evalsha(
+    redis: aioredis.Redis,
+    script: Script,
+    numkeys: int,
+    *args,
+    call: Callable[..., Awaitable] | None = None,
+):
+    """
+    Calls script (as `redis.evalsha`), loads it and retries once if Redis lost it.
+    :param call: Function to call script with by SHA (e.g. batched), `redis.evalsha` if not set.
+    """
+    call = call or redis.evalsha
+    try:
+        return await call(await script.load(redis), numkeys, *args)
+    except NoScriptError:
+        script.reset()
+        return await call(await script.load(redis), numkeys, *args)
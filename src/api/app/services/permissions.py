@@ -0,0 +1,123 @@
+"""
+    Roles permissions snapshot.
+    Roles are tiny and rarely changed, so every worker keeps immutable snapshot of all roles
+    permissions, instead of loading role from the database for each permission check.
+    Snapshot is reloaded when role change is announced with Redis pub/sub (`publish_roles_changed`),
+    or when it is older than TTL (announcement is lost).
+    Roles are changed by hand (in the database), and announced with
+    `python -m app.commands.announce_roles_changed` after that.
+"""
+
+import asyncio
+import time
+
+import aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings, get_logger
+from app.database import crud
+from app.database.models.user_role import UserRole
+from app.services.cache import get_redis, listen_channel
+
+_PERMISSIONS = tuple(
+    column.name for column in UserRole.__table__.columns if column.name.startswith("p_")
+)
+# Also listened by users cache (roles of users may be changed with roles).
+ROLES_CHANGED_CHANNEL = "permissions:roles-changed"
+
+
+class RolePermissions:
+    """Immutable snapshot of role permissions (`p_*` fields of the role)."""
+
+    __slots__ = ("id", "name", *_PERMISSIONS)
+
+    def __init__(self, role: UserRole) -> None:
+        object.__setattr__(self, "id", role.id)
+        object.__setattr__(self, "name", role.name)
+        for permission in _PERMISSIONS:
+            object.__setattr__(self, permission, getattr(role, permission))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Role permissions snapshot is immutable!")
+
+    def __delattr__(self, name):
+        raise AttributeError("Role permissions snapshot is immutable!")
+
+    def serialize_permissions(self) -> dict[str, bool]:
+        """Returns dict with all permissions of the role."""
+        return {permission: getattr(self, permission) for permission in _PERMISSIONS}
+
+
+# Snapshot of all roles, role ID -> permissions, replaced as whole on reload.
+_roles: dict[int, RolePermissions] = {}
+_roles_expires_at = 0.0
+_roles_lock = asyncio.Lock()
+_listener_task: asyncio.Task | None = None
+
+
+async def get_role_permissions(
+    db: AsyncSession, role_id: int
+) -> RolePermissions | None:
+    """Returns permissions of the role from snapshot, or None if there is no such role."""
+    permissions = (await _get_roles(db)).get(role_id)
+    if permissions is None:
+        # Role may be created after snapshot was loaded.
+        permissions = (await _get_roles(db, force_reload=True)).get(role_id)
+    return permissions
+
+
+async def get_all_role_permissions(db: AsyncSession) -> list[RolePermissions]:
+    """Returns permissions of all roles from snapshot."""
+    return list((await _get_roles(db)).values())
+
+
+def invalidate() -> None:
+    """Marks snapshot as stale, so it is reloaded on next access."""
+    global _roles_expires_at  # pylint: disable=global-statement
+    _roles_expires_at = 0.0
+
+
+async def publish_roles_changed() -> None:
+    """Announces roles change to all workers (should be called after changing roles)."""
+    invalidate()
+    try:
+        await get_redis().publish(ROLES_CHANGED_CHANNEL, "changed")
+    except aioredis.RedisError:
+        get_logger().warning("Failed to publish roles change, workers will wait for TTL!")
+
+
+async def on_startup() -> None:
+    """Starts listening for roles changes."""
+    global _listener_task  # pylint: disable=global-statement
+    _listener_task = asyncio.create_task(
+        listen_channel(
+            ROLES_CHANGED_CHANNEL,
+            on_message=lambda _: invalidate(),
+            on_subscribe=invalidate,
+        )
+    )
+
+
+async def on_shutdown() -> None:
+    """Stops listening for roles changes."""
+    if _listener_task is not None:
+        _listener_task.cancel()
+
+
+async def _get_roles(
+    db: AsyncSession, force_reload: bool = False
+) -> dict[int, RolePermissions]:
+    """Returns snapshot of all roles, reloads it if it is expired."""
+    global _roles, _roles_expires_at  # pylint: disable=global-statement
+    if not force_reload and time.monotonic() < _roles_expires_at:
+        return _roles
+
+    async with _roles_lock:
+        # Snapshot may be reloaded by another request while waiting for the lock.
+        if not force_reload and time.monotonic() < _roles_expires_at:
+            return _roles
+        roles = await crud.user_role.get_all_async(db)
+        _roles = {role.id: RolePermissions(role) for role in roles}
+        _roles_expires_at = time.monotonic() + get_settings().permissions_cache_ttl
+    return _roles
+
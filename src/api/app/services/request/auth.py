@@ -8,18 +8,27 @@ from typing import Type
 
 
 from fastapi.requests import Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import crud
+from app.database import routing
+from app.services import tokens_revocation
+from app.services.tokens_keys import get_key_ring
 from app.services.api.errors import ApiErrorCode, ApiErrorException
 from app.services.request.auth_data import AuthData
-from app.tokens import AccessToken, BaseToken
-from app.config import get_settings, get_logger
+from app.tokens import AccessToken, BaseToken, VerifiedTokensCache
+from app.config import get_settings
 
+# Verified tokens claims (to not decode same token for each request), None if disabled.
+_verified_tokens_cache = (
+    VerifiedTokensCache(max_size=get_settings().security_tokens_cache_max_size)
+    if get_settings().security_tokens_cache_max_size > 0
+    else None
+)
 
-def query_auth_data_from_token(
+
+async def query_auth_data_from_token(
     token: str,
-    db: Session,
+    db: AsyncSession,
 ) -> AuthData:
     """
     Queries authentication data from your token.
@@ -31,14 +40,17 @@ def query_auth_data_from_token(
     auth_data = _decode_token(
         token=token,
         token_type=AccessToken,
-    )
-    return _query_auth_data(
-        auth_data=auth_data,
         db=db,
     )
+    # Revocation is checked on each use, as verified (cached) token may be revoked later.
+    if await tokens_revocation.is_revoked(auth_data.claims):
+        if _verified_tokens_cache is not None:
+            _verified_tokens_cache.evict(token)
+        raise ApiErrorException(ApiErrorCode.AUTH_INVALID_TOKEN, "Token was revoked!")
+    return await _query_auth_data(auth_data=auth_data)
 
 
-def query_auth_data_from_request(req: Request, db: Session) -> AuthData:
+async def query_auth_data_from_request(req: Request, db: AsyncSession) -> AuthData:
     """
     Queries authentication data from request (from request token).
     :param req: Request itself.
@@ -47,12 +59,12 @@ def query_auth_data_from_request(req: Request, db: Session) -> AuthData:
 
     # Get token from request and query data from it as external token.
     token = _get_token_from_request(req=req)
-    return query_auth_data_from_token(token=token, db=db)
+    return await query_auth_data_from_token(token=token, db=db)
 
 
-def try_query_auth_data_from_request(
+async def try_query_auth_data_from_request(
     req: Request,
-    db: Session,
+    db: AsyncSession,
 ) -> tuple[bool, AuthData]:
     """
     Tries query authentication data from request (from request token), and returns tuple with status and auth data.
@@ -62,13 +74,20 @@ def try_query_auth_data_from_request(
 
     try:
         # Try to authenticate, and if does not fall, return OK.
-        auth_data = query_auth_data_from_request(req=req, db=db)
+        auth_data = await query_auth_data_from_request(req=req, db=db)
         return True, auth_data
     except ApiErrorException:
         # Any exception occurred - unable to authorize.
         return False, None
 
 
+def get_verified_tokens_cache_metrics() -> dict | None:
+    """Returns verified tokens cache metrics, or None if cache is disabled."""
+    if _verified_tokens_cache is None:
+        return None
+    return _verified_tokens_cache.get_metrics()
+
+
 def _get_token_from_request(req: Request) -> str:
     """
     Returns token from request.
@@ -82,7 +101,9 @@ def _get_token_from_request(req: Request) -> str:
     return token_header or token_param
 
 
-def _decode_token(token: str, token_type: Type[BaseToken]) -> AuthData:
+def _decode_token(
+    token: str, token_type: Type[BaseToken], db: AsyncSession
+) -> AuthData:
     """
     Decodes given token, to payload and session.
     :param token: Token to decode.
@@ -96,50 +117,23 @@ def _decode_token(token: str, token_type: Type[BaseToken]) -> AuthData:
     if not token:
         raise ApiErrorException(ApiErrorCode.AUTH_REQUIRED, "Authentication required!")
 
-    # Decode with valid signature.
-    settings = get_settings()
-    signed_token = token_type.decode(token, key=settings.security_tokens_secret_key)
-    if not signed_token.signature_is_valid():
-        # If there is invalid signature on the token,
-        # means token signed with foreign signature...
-        raise ApiErrorException(
-            ApiErrorCode.AUTH_INVALID_TOKEN,
-            "Unable to validate signature of the token!",
-        )
+    # Verify signature, type and expiration (claims are cached for same token).
+    claims = token_type.verify_fast(
+        token,
+        key=get_key_ring(),
+        cache=_verified_tokens_cache,
+    )
 
     # Return DTO.
-    return AuthData(token=signed_token)
+    return AuthData(claims=claims, db=db)
 
 
-def _query_auth_data(auth_data: AuthData, db: Session) -> AuthData:
+async def _query_auth_data(auth_data: AuthData) -> AuthData:
     """
-    Finalizes query of authentication data by query final user object.
+    Finalizes query of authentication data.
+    User is not queried there, as it is loaded by auth data only when accessed.
     :param auth_data: Authentication data DTO.
-    :param db: Database session.
     """
 
-    # Query database for our user to feed into auth data DTO.
-    user_id = auth_data.token.get_subject()
-    user = crud.user.get_by_id(db=db, user_id=user_id)
-
-    if not user:
-        # Internal authentication system integrity check.
-        # users should never be deleted and this should never happen.
-        _raise_integrity_check_error()
-
-    # TODO: Check user activity? (is_active)
-    # Return modified DTO with user ORM model instance.
-    auth_data.user_id = user_id
-    auth_data.user = user
+    routing.stick_to_primary_if_wrote_recently(auth_data.user_id)
     return auth_data
-
-
-def _raise_integrity_check_error():
-    """
-    Raises authentication system integrity check error.
-    """
-    get_logger().warning("Got catched authentication system integrity check failure!")
-    raise ApiErrorException(
-        ApiErrorCode.AUTH_INVALID_TOKEN,
-        "Authentication system integrity check failed!",
-    )
@@ -2,27 +2,73 @@
     DTO for authentication request.
 """
 
-from app.database.models.user import User
-from app.tokens import BaseToken
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings, get_logger
+from app.services import permissions, users_cache
+from app.services.api.errors import ApiErrorCode, ApiErrorException
+from app.services.permissions import RolePermissions
+from app.services.users_cache import CachedUser
+from app.tokens import VerifiedClaims
 
 
 class AuthData:
-    """DTO for authenticated request."""
+    """
+    DTO for authenticated request.
+    User ID and claims are taken from the token,
+    user and permissions are loaded lazily (on first access) as most requests does not need them.
+    """
 
-    user: User
-    token: BaseToken
+    claims: VerifiedClaims
 
-    def __init__(
-        self,
-        token: BaseToken,
-        user_id: str | None = None,
-        user: User | None = None,
-    ) -> None:
+    def __init__(self, claims: VerifiedClaims, db: AsyncSession) -> None:
+        """
+        :param claims: Verified access token claims.
+        :param db: Database session, to load user when it is accessed.
         """
-        :param token: Session or access token object.
-        :param user_id: SSO user ID (and native, because they are same).
-        :param user: User database model object.
+        self.claims = claims
+        self.user_id = claims.subject
+        self._db = db
+        self._user: CachedUser | None = None
+        self._permissions: RolePermissions | None = None
+
+    async def get_user(self) -> CachedUser:
+        """Returns user data (cached snapshot of the model), loads it on first access."""
+        if self._user is None:
+            self._user = await users_cache.get_user(self._db, self.user_id)
+            if self._user is None:
+                # Internal authentication system integrity check.
+                # users should never be deleted and this should never happen.
+                _raise_integrity_check_error()
+        return self._user
+
+    async def get_permissions(self) -> RolePermissions:
         """
-        self.user_id = user_id
-        self.user = user
-        self.token = token
+        Returns permissions of the user role, loads it on first access.
+        Role is taken from the token claim (if enabled), so user is not loaded.
+        """
+        if self._permissions is None:
+            role_id = (
+                self.claims.role_id
+                if get_settings().security_access_tokens_role_id_claim
+                else None
+            )
+            if role_id is None:
+                role_id = (await self.get_user()).role_id
+            self._permissions = await permissions.get_role_permissions(
+                self._db, role_id
+            )
+            if self._permissions is None:
+                _raise_integrity_check_error()
+        return self._permissions
+
+
+def _raise_integrity_check_error():
+    """
+    Raises authentication system integrity check error.
+    """
+    get_logger().warning("Got catched authentication system integrity check failure!")
+    raise ApiErrorException(
+        ApiErrorCode.AUTH_INVALID_TOKEN,
+        "Authentication system integrity check failed!",
+    )
@@ -0,0 +1,30 @@
+"""
+    Tokens signing keys.
+    Builds key ring from settings: current key signs tokens,
+    previous keys (rotated out) still verify tokens signed with them until removed.
+"""
+
+from app.config import get_settings
+from app.tokens import KeyRing, SigningKey
+
+_key_ring: KeyRing | None = None
+
+
+def get_key_ring() -> KeyRing:
+    """Returns tokens key ring (lazy, keys are prepared once)."""
+    global _key_ring  # pylint: disable=global-statement
+    if _key_ring is None:
+        settings = get_settings()
+        algorithm = settings.security_tokens_algorithm
+        _key_ring = KeyRing(
+            current=SigningKey(
+                settings.security_tokens_key_id,
+                algorithm,
+                settings.security_tokens_secret_key,
+            ),
+            previous=[
+                SigningKey(kid, algorithm, key)
+                for kid, key in settings.security_tokens_previous_keys.items()
+            ],
+        )
+    return _key_ring
@@ -0,0 +1,141 @@
+"""
+    Tokens revocation.
+    Revoked token IDs (`jti`) are stored in Redis until token expires,
+    and each worker keeps Bloom filter of them (updated with pub/sub),
+    so not revoked tokens (almost all) are checked without querying Redis,
+    and only filter hits are confirmed with Redis.
+    If Redis is unavailable, filter hits are rejected. Until filter is loaded
+    each check queries Redis, and if it is unavailable tokens are accepted or rejected
+    by `security_tokens_revocation_fail_open`.
+"""
+
+import asyncio
+import time
+
+import aioredis
+
+from app.config import get_settings, get_logger
+from app.services.cache import get_redis, listen_channel
+from app.tokens import BloomFilter, VerifiedClaims
+
+# Sorted set of revoked token IDs, scored by when token expires.
+_REVOKED_TOKENS_REDIS_KEY = "tokens-revocation:revoked"
+_TOKENS_REVOKED_CHANNEL = "tokens-revocation:revoked"
+
+# Local (worker) filter of revoked token IDs, None until loaded from Redis.
+_filter: BloomFilter | None = None
+_listener_task: asyncio.Task | None = None
+
+# Metrics.
+_checks = 0
+_filter_hits = 0
+_confirmed = 0
+
+
+async def is_revoked(claims: VerifiedClaims) -> bool:
+    """
+    Returns true if token is revoked.
+    Should be checked on each use of the token (including verified tokens cache hits).
+    Tokens without ID (issued before revocation was introduced) can not be revoked.
+    """
+    global _checks, _filter_hits, _confirmed  # pylint: disable=global-statement
+    token_id = claims.token_id
+    if token_id is None:
+        return False
+
+    _checks += 1
+    if _filter is not None:
+        if token_id not in _filter:
+            return False
+        _filter_hits += 1
+
+    try:
+        revoked = await get_redis().zscore(_REVOKED_TOKENS_REDIS_KEY, token_id)
+    except (aioredis.RedisError, OSError):
+        if _filter is not None:
+            # Filter hit, and unable to confirm (may be false positive), safer to reject.
+            get_logger().warning("Failed to confirm token revocation in Redis!")
+            return True
+        get_logger().warning(
+            "Failed to check token revocation in Redis (filter is not loaded)!"
+        )
+        return not get_settings().security_tokens_revocation_fail_open
+    if revoked is None:
+        return False
+    _confirmed += 1
+    return True
+
+
+async def revoke(token_id: str, expires_at: float | None) -> None:
+    """
+    Revokes token by it`s ID (in Redis, and in all workers).
+    :param expires_at: When token expires (it is kept revoked until then), None if never.
+    """
+    if _filter is not None:
+        _filter.add(token_id)
+    redis = get_redis()
+    await redis.zadd(
+        _REVOKED_TOKENS_REDIS_KEY,
+        {token_id: expires_at if expires_at is not None else float("inf")},
+    )
+    await redis.publish(_TOKENS_REVOKED_CHANNEL, token_id)
+
+
+def get_metrics() -> dict:
+    """Returns revocation checks metrics (how many checks are answered by filter)."""
+    return {
+        "filter_loaded": _filter is not None,
+        "filter_size": _filter.count if _filter is not None else 0,
+        "checks": _checks,
+        "filter_hits": _filter_hits,
+        "confirmed": _confirmed,
+        "false_positive_rate": (
+            (_filter_hits - _confirmed) / _checks if _checks else 0.0
+        ),
+    }
+
+
+async def on_startup() -> None:
+    """Starts listening for revoked tokens (filter is loaded after subscribing)."""
+    global _listener_task  # pylint: disable=global-statement
+    _listener_task = asyncio.create_task(
+        listen_channel(
+            _TOKENS_REVOKED_CHANNEL,
+            on_message=_on_token_revoked,
+            on_subscribe=_load_filter,
+        )
+    )
+
+
+async def on_shutdown() -> None:
+    """Stops listening for revoked tokens."""
+    if _listener_task is not None:
+        _listener_task.cancel()
+
+
+def _on_token_revoked(token_id: str) -> None:
+    """Adds token revoked by other worker to the filter."""
+    if _filter is not None:
+        _filter.add(token_id)
+
+
+async def _load_filter() -> None:
+    """
+    (Re)builds filter from Redis, dropping expired tokens.
+    Called after subscribing, so tokens revoked while loading are received with pub/sub.
+    """
+    global _filter  # pylint: disable=global-statement
+    settings = get_settings()
+    redis = get_redis()
+    await redis.zremrangebyscore(_REVOKED_TOKENS_REDIS_KEY, "-inf", time.time())
+    token_ids = await redis.zrange(_REVOKED_TOKENS_REDIS_KEY, 0, -1)
+
+    capacity = settings.security_tokens_revocation_filter_capacity
+    bloom_filter = BloomFilter(
+        capacity=max(capacity, 2 * len(token_ids)),
+        error_rate=settings.security_tokens_revocation_filter_error_rate,
+    )
+    for token_id in token_ids:
+        bloom_filter.add(token_id)
+    _filter = bloom_filter
+    get_logger().info(f"Loaded {len(token_ids)} revoked tokens into filter.")
@@ -0,0 +1,212 @@
+"""
+    Authenticated users cache.
+    Two-level cache of users data required by authentication (ID, email, role ID):
+    local (worker) LRU with short TTL, and shared Redis layer with longer TTL.
+    Users written with ORM (asyncio) are invalidated after commit (in Redis and in all workers,
+    with pub/sub), other writes should call `invalidate_user` explicitly.
+    Whole cache is cleared when roles change is announced (`permissions.publish_roles_changed`),
+    as roles of users may be changed by hand (in the database) with roles.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+
+import aioredis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.config import get_settings, get_logger
+from app.database import crud
+from app.database.models.user import User
+from app.services.cache import get_redis, listen_channel
+from app.services.permissions import ROLES_CHANGED_CHANNEL
+
+_USER_REDIS_KEY = "users-cache:{user_id}"
+_USERS_CHANGED_CHANNEL = "users-cache:invalidated"
+
+
+class CachedUser:
+    """Immutable snapshot of user data required by authentication."""
+
+    __slots__ = ("id", "email", "role_id")
+
+    def __init__(self, id: str, email: str, role_id: int) -> None:
+        # pylint: disable=redefined-builtin
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "email", email)
+        object.__setattr__(self, "role_id", role_id)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Cached user is immutable!")
+
+    @classmethod
+    def from_model(cls, user: User) -> "CachedUser":
+        """Returns snapshot of the user model."""
+        return cls(id=user.id, email=user.email, role_id=user.role_id)
+
+    @classmethod
+    def loads(cls, data: str) -> "CachedUser":
+        """Returns user from JSON stored in Redis."""
+        return cls(**json.loads(data))
+
+    def dumps(self) -> str:
+        """Returns user as JSON to store in Redis."""
+        return json.dumps({"id": self.id, "email": self.email, "role_id": self.role_id})
+
+
+# Local (worker) cache, user ID -> (monotonic time when expires, user).
+_local: OrderedDict[str, tuple[float, CachedUser]] = OrderedDict()
+_listener_tasks: list[asyncio.Task] = []
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def get_user(db: AsyncSession, user_id: str) -> CachedUser | None:
+    """Returns user by it`s ID from cache, or from database (and caches it)."""
+    user = _get_local(user_id)
+    if user is not None:
+        return user
+
+    settings = get_settings()
+    redis_key = _USER_REDIS_KEY.format(user_id=user_id)
+    try:
+        data = await get_redis().get(redis_key)
+    except aioredis.RedisError:
+        get_logger().warning("Failed to get user from cache in Redis!")
+        data = None
+    if data is not None:
+        user = CachedUser.loads(data)
+        _put_local(user)
+        return user
+
+    user_model = await crud.user.get_by_id_async(db=db, user_id=user_id)
+    if user_model is None:
+        return None
+    user = CachedUser.from_model(user_model)
+    _put_local(user)
+    try:
+        await get_redis().set(redis_key, user.dumps(), ex=settings.users_cache_ttl)
+    except aioredis.RedisError:
+        get_logger().warning("Failed to store user to cache in Redis!")
+    return user
+
+
+async def invalidate_user(user_id: str) -> None:
+    """Removes user from cache (in Redis, and in all workers)."""
+    _local.pop(user_id, None)
+    try:
+        redis = get_redis()
+        await redis.delete(_USER_REDIS_KEY.format(user_id=user_id))
+        await redis.publish(_USERS_CHANGED_CHANNEL, user_id)
+    except aioredis.RedisError:
+        get_logger().warning(
+            "Failed to invalidate user in Redis, it will be stale until TTL!"
+        )
+
+
+async def invalidate_all() -> None:
+    """
+    Removes all users from cache in Redis, and in this worker.
+    Other workers clears local cache on roles change announcement, so should be called before it.
+    """
+    _local.clear()
+    try:
+        redis = get_redis()
+        async for key in redis.scan_iter(match=_USER_REDIS_KEY.format(user_id="*")):
+            await redis.delete(key)
+    except aioredis.RedisError:
+        get_logger().warning(
+            "Failed to invalidate users in Redis, they will be stale until TTL!"
+        )
+
+
+async def on_startup() -> None:
+    """Starts listening for users invalidated by other workers, and for roles changes."""
+    _listener_tasks.append(
+        asyncio.create_task(
+            listen_channel(
+                _USERS_CHANGED_CHANNEL,
+                on_message=lambda user_id: _local.pop(user_id, None),
+                on_subscribe=_local.clear,
+            )
+        )
+    )
+    _listener_tasks.append(
+        asyncio.create_task(
+            listen_channel(
+                ROLES_CHANGED_CHANNEL,
+                on_message=lambda _: _local.clear(),
+                on_subscribe=_local.clear,
+            )
+        )
+    )
+
+
+async def on_shutdown() -> None:
+    """Stops listening for invalidated users and roles changes."""
+    for task in _listener_tasks:
+        task.cancel()
+    _listener_tasks.clear()
+
+
+def _get_local(user_id: str) -> CachedUser | None:
+    """Returns user from local cache, if it is not expired."""
+    cached = _local.get(user_id)
+    if cached is None:
+        return None
+    expires_at, user = cached
+    if expires_at <= time.monotonic():
+        _local.pop(user_id, None)
+        return None
+    _local.move_to_end(user_id)
+    return user
+
+
+def _put_local(user: CachedUser) -> None:
+    """Stores user in local cache, evicting least recently used ones."""
+    settings = get_settings()
+    _local[user.id] = (time.monotonic() + settings.users_cache_local_ttl, user)
+    _local.move_to_end(user.id)
+    while len(_local) > settings.users_cache_local_max_size:
+        _local.popitem(last=False)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_user_written(_, __, user: User) -> None:
+    """Remembers users written within session, to invalidate them after commit."""
+    session = object_session(user)
+    if session is not None:
+        session.info.setdefault("written_user_ids", set()).add(user.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    """Invalidates users written within committed session."""
+    user_ids = session.info.pop("written_user_ids", None)
+    if not user_ids:
+        return
+    for user_id in user_ids:
+        _local.pop(user_id, None)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Not under asyncio (sync session), only local state is invalidated.
+    task = loop.create_task(_invalidate_users(user_ids))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _on_after_rollback(session: Session, _) -> None:
+    """Forgets written users of rolled back session."""
+    session.info.pop("written_user_ids", None)
+
+
+async def _invalidate_users(user_ids: set[str]) -> None:
+    """Invalidates given users."""
+    for user_id in user_ids:
+        await invalidate_user(user_id)
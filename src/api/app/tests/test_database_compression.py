@@ -0,0 +1,37 @@
+"""
+    Tests compressed text storage.
+"""
+
+import zlib
+
+from app.database import compression
+
+
+def test_decompress_formats():
+    """Tests that all stored formats (including raw text without marker) are decompressed."""
+    content = "Lecture content. " * 100
+    data = content.encode("utf-8")
+    assert compression.decompress(data) == content
+    assert compression.decompress(b"\x00r" + data) == content
+    assert compression.decompress(b"\x00z" + zlib.compress(data)) == content
+
+
+def test_decompressed_cache_is_bounded():
+    """Tests that decompressed cache evicts least recently used values by size."""
+    cache = compression.DecompressedCache(max_size=10)
+    cache.put(b"a", "12345")
+    cache.put(b"b", "12345")
+    assert cache.get(b"a") == "12345"
+    cache.put(b"c", "12345")
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "12345"
+    assert cache.size == 10
+
+
+def test_decompressed_cache_does_not_hold_stored_value():
+    """Tests that decompressed cache is keyed by fixed-size digest, not stored value."""
+    cache = compression.DecompressedCache(max_size=100)
+    stored = b"\x00z" + zlib.compress(b"x" * 1000)
+    cache.put(stored, "x" * 10)
+    assert cache.get(bytes(stored)) == "x" * 10
+    assert all(len(key) == 16 for key in cache._values)
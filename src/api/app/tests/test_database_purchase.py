@@ -0,0 +1,80 @@
+"""
+    Tests course purchase under concurrency.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import delete, func, select
+
+from app.database.core import AsyncSessionLocal, SessionLocal, async_engine
+from app.database.crud import user_course
+from app.database.models.course import Course, CourseDifficulty
+from app.database.models.user import User
+from app.database.models.user_course import UserCourse
+from app.database.models.user_role import UserRole
+
+PARALLEL_PURCHASES = 200
+
+
+@pytest.fixture
+def seeded():
+    """Committed user and course (visible to parallel sessions), removed after test."""
+    with SessionLocal() as session:
+        role = UserRole(name="test-purchase")
+        session.add(role)
+        session.flush()
+        seeded_user = User(
+            sso_oauth_user_id=-2, email="purchase@race.test", role_id=role.id
+        )
+        session.add(seeded_user)
+        session.flush()
+        seeded_course = Course(
+            name="test-purchase",
+            title="Test",
+            difficulty=CourseDifficulty.easy.value,
+            owner_id=seeded_user.id,
+        )
+        session.add(seeded_course)
+        session.commit()
+        ids = role.id, seeded_user.id, seeded_course.id
+
+    yield ids[1], ids[2]
+
+    with SessionLocal() as session:
+        session.execute(delete(UserCourse).where(UserCourse.course_id == ids[2]))
+        session.execute(delete(Course).where(Course.id == ids[2]))
+        session.execute(delete(User).where(User.id == ids[1]))
+        session.execute(delete(UserRole).where(UserRole.id == ids[0]))
+        session.commit()
+
+
+async def _purchase_in_parallel(user_id: str, course_id: str) -> list:
+    """Purchases same course by same user in parallel sessions."""
+
+    async def _purchase():
+        async with AsyncSessionLocal() as db:
+            course = await db.get(Course, course_id)
+            return await user_course.purchase_async(db, user_id=user_id, course=course)
+
+    try:
+        return await asyncio.gather(*(_purchase() for _ in range(PARALLEL_PURCHASES)))
+    finally:
+        # Pool connections are bound to that event loop.
+        await async_engine.dispose()
+
+
+def test_parallel_purchases_create_single_row(seeded):  # pylint: disable=redefined-outer-name
+    """Tests that parallel purchases of same course creates exactly one user course."""
+    user_id, course_id = seeded
+    purchases = asyncio.run(_purchase_in_parallel(user_id, course_id))
+
+    assert len([purchase for purchase in purchases if purchase is not None]) == 1
+    with SessionLocal() as session:
+        count = session.execute(
+            select(func.count())
+            .select_from(UserCourse)
+            .where(UserCourse.user_id == user_id)
+            .where(UserCourse.course_id == course_id)
+        ).scalar_one()
+    assert count == 1
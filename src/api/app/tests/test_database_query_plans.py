@@ -0,0 +1,117 @@
+"""
+    Tests that database CRUD queries are backed by indexes.
+    Runs EXPLAIN for each query against seeded database with sequential scans disabled,
+    so any sequential scan left in the plan means there is no usable index.
+"""
+
+import pytest
+from sqlalchemy import Select, text
+
+from app.database.core import SessionLocal
+from app.database.crud import course, course_lecture, user, user_course
+from app.database.models.course import Course, CourseDifficulty
+from app.database.models.course_lecture import CourseLecture
+from app.database.models.user import User
+from app.database.models.user_course import UserCourse
+from app.database.models.user_role import UserRole
+
+
+@pytest.fixture
+def seeded():
+    """Database session with seeded rows, rolled back after test."""
+    with SessionLocal() as session:
+        role = UserRole(name="test-query-plans")
+        session.add(role)
+        session.flush()
+        seeded_user = User(
+            sso_oauth_user_id=-1, email="query@plans.test", role_id=role.id
+        )
+        session.add(seeded_user)
+        session.flush()
+        seeded_course = Course(
+            name="test-query-plans",
+            title="Test",
+            difficulty=CourseDifficulty.easy.value,
+            owner_id=seeded_user.id,
+        )
+        session.add(seeded_course)
+        session.flush()
+        seeded_course_lecture = CourseLecture(course_id=seeded_course.id, title="Test")
+        seeded_user_course = UserCourse(
+            user_id=seeded_user.id, course_id=seeded_course.id, purchased_for=0
+        )
+        session.add_all([seeded_course_lecture, seeded_user_course])
+        session.flush()
+        session.refresh(seeded_course)
+
+        session.execute(text("SET LOCAL enable_seqscan = off"))
+        yield session, _crud_queries(
+            seeded_user, seeded_course, seeded_course_lecture, seeded_user_course
+        )
+        session.rollback()
+
+
+def _query_plan_node_types(session, query: Select) -> list[str]:
+    """Returns all node types from EXPLAIN plan of the query."""
+    compiled = query.compile(dialect=session.bind.dialect)
+    plan = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params)
+        .scalar_one()
+    )
+
+    node_types, nodes = [], [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        node_types.append(node["Node Type"])
+        nodes.extend(node.get("Plans", []))
+    return node_types
+
+
+def _crud_queries(
+    seeded_user: User,
+    seeded_course: Course,
+    seeded_course_lecture: CourseLecture,
+    seeded_user_course: UserCourse,
+) -> dict[str, Select]:
+    """Returns all CRUD lookup queries with seeded values."""
+    queries = {
+        "user.by_id": user._select_by_id(seeded_user.id),
+        "user.by_sso_oauth_user_id": user._select_by_sso_oauth_user_id(
+            seeded_user.sso_oauth_user_id
+        ),
+        "course.by_id": course._select_by_id(seeded_course.id),
+        "course.by_name": course._select_by_name(seeded_course.name),
+        "course_lecture.by_id": course_lecture._select_by_id(seeded_course_lecture.id),
+        "course_lecture.by_course_id": course_lecture._select_by_course_id(
+            seeded_course.id
+        ),
+        "user_course.by_id": user_course._select_by_id(seeded_user_course.id),
+        "user_course.by_user_id": user_course._select_by_user_id(seeded_user.id),
+        "user_course.by_user_id_and_course_id": (
+            user_course._select_by_user_id_and_course_id(
+                seeded_user.id, seeded_course.id
+            )
+        ),
+    }
+    for sort in course.CourseSortOrder:
+        filtered = course._select_filtered(True, True, None, None, None)
+        cursor = course._encode_cursor(seeded_course, sort)
+        queries[f"course.list.{sort.name}"] = course._paginate(
+            filtered, 5, 1, sort, None
+        )
+        queries[f"course.list.{sort.name}.cursor"] = course._paginate(
+            filtered, 5, 1, sort, cursor
+        )
+    return queries
+
+
+def test_crud_queries_do_not_use_sequential_scan(seeded):  # pylint: disable=redefined-outer-name
+    """Tests that no CRUD lookup query falls back to a sequential scan."""
+    session, queries = seeded
+    sequential_scans = [
+        name
+        for name, query in queries.items()
+        if "Seq Scan" in _query_plan_node_types(session, query)
+    ]
+    assert sequential_scans == []
@@ -0,0 +1,54 @@
+"""
+    Tests database replica routing stickiness (read-your-writes) by the cookie.
+"""
+
+import pytest
+
+from app.config import get_settings
+from app.database import routing
+
+
+@pytest.fixture(autouse=True)
+def fixture_replica(monkeypatch):
+    """Configures replica, and clears local stickiness of the worker."""
+    monkeypatch.setattr(
+        get_settings(), "database_replica_dsn", "postgresql://replica/database"
+    )
+    monkeypatch.setattr(routing, "_primary_sticky_until", {})
+
+
+def _request(cookie: str | None, user_id: str) -> bool:
+    """Runs request of the user with given cookie, returns true if it uses the primary."""
+    routing._use_primary.set(False)
+    routing.start_request(cookie)
+    routing.stick_to_primary_if_wrote_recently(user_id)
+    return routing._use_primary.get()
+
+
+def test_sticks_to_primary_by_cookie(monkeypatch):
+    """Tests that cookie set after writes sticks only that user to the primary, on any worker."""
+    stickiness = routing.start_request(None)
+    routing.stick_to_primary_if_wrote_recently("user")
+    routing._mark_current_user_wrote()
+    cookie = stickiness.new_cookie
+
+    # Other worker (without local stickiness).
+    monkeypatch.setattr(routing, "_primary_sticky_until", {})
+    assert _request(cookie, "user")
+    assert not _request(cookie, "other-user")
+    assert not _request(None, "user")
+    assert not _request(cookie.replace("user:", "other-user:"), "other-user")
+    assert not _request("user:invalid", "user")
+
+
+def test_cookie_expires(monkeypatch):
+    """Tests that cookie does not stick user to the primary after read-your-writes window."""
+    monkeypatch.setattr(
+        get_settings(), "database_replica_read_your_writes_window", -1
+    )
+    stickiness = routing.start_request(None)
+    routing.stick_to_primary_if_wrote_recently("user")
+    routing._mark_current_user_wrote()
+
+    monkeypatch.setattr(routing, "_primary_sticky_until", {})
+    assert not _request(stickiness.new_cookie, "user")
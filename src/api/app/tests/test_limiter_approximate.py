@@ -0,0 +1,63 @@
+"""
+    Tests approximate requests limiter (against fakeredis, as separate workers).
+"""
+
+import asyncio
+
+import fakeredis
+from fakeredis import aioredis as fakeredis_aioredis
+
+from app.services.limiter.approximate import ApproximateLimiter
+
+WORKERS = 3
+
+
+async def _start_workers(sync_interval: float = 60.0) -> list[ApproximateLimiter]:
+    """Returns limiters of workers sharing single Redis."""
+    server = fakeredis.FakeServer()
+    workers = [
+        ApproximateLimiter(
+            fakeredis_aioredis.FakeRedis(server=server, decode_responses=True),
+            workers=WORKERS,
+            sync_interval=sync_interval,
+        )
+        for _ in range(WORKERS)
+    ]
+    for worker in workers:
+        await worker.init()
+    return workers
+
+
+def test_approximate_limiter_never_exceeds_limit():
+    """Tests that workers together admit no more than limit (concurrently)."""
+
+    async def run() -> tuple[int, str]:
+        workers = await _start_workers()
+        results = await asyncio.gather(
+            *[workers[i % WORKERS].hit("key", 40, 60_000) for i in range(300)]
+        )
+        counted = await workers[0].redis.get("key")
+        for worker in workers:
+            await worker.close()
+        return sum(result == 0 for result in results), counted
+
+    admitted, counted = asyncio.run(run())
+    assert admitted == 40
+    assert counted == "40"
+
+
+def test_approximate_limiter_returns_unused_tokens():
+    """Tests that tokens leased for idle key are returned on sync."""
+
+    async def run() -> tuple[str, str]:
+        worker = (await _start_workers(sync_interval=0.05))[0]
+        assert await worker.hit("key", 30, 60_000) == 0
+        leased = await worker.redis.get("key")
+        await asyncio.sleep(0.2)
+        returned = await worker.redis.get("key")
+        await worker.close()
+        return leased, returned
+
+    leased, returned = asyncio.run(run())
+    assert leased == str(30 // WORKERS)
+    assert returned == "1"
@@ -0,0 +1,116 @@
+"""
+    Tests batching of requests limiter checks (against fakeredis).
+"""
+
+import asyncio
+
+import fakeredis
+from fakeredis import aioredis as fakeredis_aioredis
+
+from app.services.limiter.batching import EvalshaBatcher
+
+# Returns it`s argument.
+_ECHO_SCRIPT = "return ARGV[1]"
+
+
+class _RecordingRedis:
+    """Redis stand-in that records sizes of sent pipelines, and echoes calls arguments."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def pipeline(self, transaction: bool) -> "_RecordingPipeline":
+        return _RecordingPipeline(self)
+
+
+class _RecordingPipeline:
+    """Pipeline of `_RecordingRedis`."""
+
+    def __init__(self, redis: _RecordingRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple] = []
+
+    async def __aenter__(self) -> "_RecordingPipeline":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        pass
+
+    def evalsha(self, *args) -> None:
+        self.calls.append(args)
+
+    async def execute(self, raise_on_error: bool = True) -> list:
+        self.redis.batch_sizes.append(len(self.calls))
+        return [args[-1] for args in self.calls]
+
+
+async def _start_batcher(
+    max_size: int = 100, connected: bool = True
+) -> tuple[EvalshaBatcher, str]:
+    """Returns batcher and SHA of echo script."""
+    server = fakeredis.FakeServer()
+    redis = fakeredis_aioredis.FakeRedis(server=server, decode_responses=True)
+    sha = await redis.script_load(_ECHO_SCRIPT)
+    server.connected = connected
+    return EvalshaBatcher(redis, window=0.01, max_size=max_size), sha
+
+
+def test_batcher_results_in_order():
+    """Tests that concurrent calls are sent in single batch, and each gets it`s own result."""
+
+    async def run() -> tuple[list, EvalshaBatcher]:
+        batcher, sha = await _start_batcher()
+        results = await asyncio.gather(
+            *[batcher.evalsha(sha, 0, str(index)) for index in range(10)]
+        )
+        return results, batcher
+
+    results, batcher = asyncio.run(run())
+    assert results == [str(index) for index in range(10)]
+    assert batcher.batches == 1
+
+
+def test_batcher_call_error():
+    """Tests that error of the call is raised only for that call."""
+
+    async def run() -> list:
+        batcher, sha = await _start_batcher()
+        return await asyncio.gather(
+            batcher.evalsha(sha, 0, "first"),
+            batcher.evalsha("0" * 40, 0, "unknown-script"),
+            batcher.evalsha(sha, 0, "last"),
+            return_exceptions=True,
+        )
+
+    first, error, last = asyncio.run(run())
+    assert (first, last) == ("first", "last")
+    assert type(error).__name__ == "NoScriptError"
+
+
+def test_batcher_flushes_at_max_size():
+    """Tests that full batch is sent immediately, and next calls go to next batch."""
+
+    redis = _RecordingRedis()
+
+    async def run() -> list:
+        # Window is never waited, as full batch should be sent without it.
+        batcher = EvalshaBatcher(redis, window=60.0, max_size=3)
+        calls = [batcher.evalsha("sha", 0, str(index)) for index in range(4)]
+        return await asyncio.wait_for(asyncio.gather(*calls), timeout=1.0)
+
+    assert asyncio.run(run()) == ["0", "1", "2", "3"]
+    assert redis.batch_sizes == [3, 1]
+
+
+def test_batcher_pipeline_failure():
+    """Tests that pipeline failure (Redis is unavailable) is raised for every call."""
+
+    async def run() -> list:
+        batcher, sha = await _start_batcher(connected=False)
+        return await asyncio.gather(
+            *[batcher.evalsha(sha, 0, str(index)) for index in range(3)],
+            return_exceptions=True,
+        )
+
+    errors = asyncio.run(run())
+    assert [type(error).__name__ for error in errors] == ["ConnectionError"] * 3
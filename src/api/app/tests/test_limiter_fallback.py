@@ -0,0 +1,76 @@
+"""
+    Tests in-memory requests limiter (used while Redis is unavailable).
+"""
+
+import aioredis
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.services.api.response import api_success
+from app.services.limiter import FastAPILimiter
+from app.services.limiter.depends import RateLimiter
+from app.services.limiter.fallback import LocalLimiter
+
+
+class _UnavailableRedis:
+    """Redis that fails on script calls (connection is lost)."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def script_load(self, _) -> str:
+        return "sha"
+
+    async def evalsha(self, *_):
+        self.calls += 1
+        raise aioredis.ConnectionError("Redis is unavailable!")
+
+    async def close(self) -> None:
+        pass
+
+
+def test_local_limiter_share_of_limit():
+    """Tests that worker allows only it`s share of the limit within window."""
+    limiter = LocalLimiter(max_keys=10, workers=2)
+    results = [limiter.hit("key", 10, 60_000) for _ in range(10)]
+    assert results[:5] == [0] * 5
+    assert all(0 < result <= 60_000 for result in results[5:])
+    assert limiter.hit("other-key", 10, 60_000) == 0
+
+
+def test_local_limiter_bounded_keys():
+    """Tests that least recently used keys are forgotten."""
+    limiter = LocalLimiter(max_keys=2, workers=1)
+    for key in ("first", "second", "third"):
+        limiter.hit(key, 1, 60_000)
+    assert limiter.hit("first", 1, 60_000) == 0
+    assert limiter.hit("third", 1, 60_000) != 0
+
+
+def test_rate_limiter_falls_back_on_redis_failure(monkeypatch):
+    """Tests that Redis failure of the limiter check is handled by in-memory limiter."""
+    redis = _UnavailableRedis()
+    monkeypatch.setattr(FastAPILimiter, "unavailable_until", 0.0)
+    monkeypatch.setattr(FastAPILimiter, "reconnect_backoff", 0.0)
+    app = FastAPI()
+
+    @app.on_event("startup")
+    async def _startup():
+        await FastAPILimiter.init(redis)
+        # Script is called with `redis.evalsha` (not batched).
+        monkeypatch.setattr(FastAPILimiter, "batcher", None)
+
+    @app.on_event("shutdown")
+    async def _shutdown():
+        await FastAPILimiter.close()
+
+    @app.get("/limited", dependencies=[Depends(RateLimiter(times=1, minutes=1))])
+    async def _limited():
+        return api_success({})
+
+    with TestClient(app) as client:
+        responses = [client.get("/limited") for _ in range(2)]
+
+    assert [response.status_code for response in responses] == [200, 429]
+    assert redis.calls == 1
+    assert not FastAPILimiter.is_available()
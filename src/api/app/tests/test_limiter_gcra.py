@@ -0,0 +1,69 @@
+"""
+    Tests GCRA requests limiter (against fakeredis).
+"""
+
+import asyncio
+
+import fakeredis
+from fakeredis import aioredis as fakeredis_aioredis
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.services.api.response import api_success
+from app.services.limiter import FastAPILimiter, rate_limit_headers_middleware
+from app.services.limiter.depends import RateLimiter
+
+
+def test_gcra_lua_script():
+    """Tests that GCRA allows burst up to limit, and returns remaining and retry after."""
+
+    async def run() -> list[list[int]]:
+        redis = fakeredis_aioredis.FakeRedis(
+            server=fakeredis.FakeServer(), decode_responses=True
+        )
+        return [
+            await redis.eval(FastAPILimiter.gcra_lua_script, 1, "key", "2", "60000")
+            for _ in range(3)
+        ]
+
+    first, second, rejected = asyncio.run(run())
+    assert first[:3] == [1, 1, 0]
+    assert second[:3] == [1, 0, 0]
+    assert rejected[:2] == [0, 0]
+    # Next request is allowed after interval (period / limit).
+    assert 29_000 < rejected[2] <= 30_000
+    assert 59_000 < rejected[3] <= 60_000
+
+
+def test_gcra_rate_limit_headers():
+    """Tests that rate limit headers are set on successful and rejected responses."""
+    app = FastAPI()
+    app.middleware("http")(rate_limit_headers_middleware)
+
+    @app.on_event("startup")
+    async def _startup():
+        redis = fakeredis_aioredis.FakeRedis(
+            server=fakeredis.FakeServer(), decode_responses=True
+        )
+        await FastAPILimiter.init(redis)
+
+    @app.on_event("shutdown")
+    async def _shutdown():
+        await FastAPILimiter.close()
+
+    @app.get(
+        "/limited",
+        dependencies=[Depends(RateLimiter(times=2, minutes=1, algorithm="gcra"))],
+    )
+    async def _limited():
+        return api_success({})
+
+    with TestClient(app) as client:
+        responses = [client.get("/limited") for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert [
+        response.headers["X-RateLimit-Remaining"] for response in responses
+    ] == ["1", "0", "0"]
+    assert all(response.headers["X-RateLimit-Limit"] == "2" for response in responses)
+    assert responses[2].headers["Retry-After"] == "30"
@@ -0,0 +1,44 @@
+"""
+    Tests requests limiter Lua scripts loading.
+"""
+
+import asyncio
+
+import pytest
+from aioredis.exceptions import NoScriptError
+
+from app.services.limiter.scripts import Script, evalsha
+
+
+class _RestartedRedis:
+    """Redis that lost loaded scripts (restarted) given count of times."""
+
+    def __init__(self, lost: int) -> None:
+        self.lost = lost
+        self.loaded = 0
+
+    async def script_load(self, _) -> str:
+        self.loaded += 1
+        return f"sha-{self.loaded}"
+
+    async def evalsha(self, sha: str, _, *args) -> list:
+        if self.lost:
+            self.lost -= 1
+            raise NoScriptError("No matching script. Please use EVAL.")
+        return [sha, *args]
+
+
+def test_evalsha_reloads_lost_script():
+    """Tests that script lost by Redis is loaded again, and call is retried."""
+    redis = _RestartedRedis(lost=1)
+    script = Script("return ARGV")
+    script.sha = "sha-before-restart"
+    assert asyncio.run(evalsha(redis, script, 0, "arg")) == ["sha-1", "arg"]
+    assert script.sha == "sha-1"
+
+
+def test_evalsha_retries_once():
+    """Tests that call is retried only once."""
+    redis = _RestartedRedis(lost=2)
+    with pytest.raises(NoScriptError):
+        asyncio.run(evalsha(redis, Script("return ARGV"), 0))
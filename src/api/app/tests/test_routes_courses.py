@@ -2,6 +2,8 @@
     Tests courses API methods.
 """
 
+from base64 import urlsafe_b64encode
+
 import pytest
 from app.app import app
 from fastapi.testclient import TestClient
@@ -29,6 +31,38 @@ def test_read_courses_list(client):  # pylint: disable=redefined-outer-name
     assert "page" in json["success"]["pagination"]
     assert "per_page" in json["success"]["pagination"]
     assert "max_page" in json["success"]["pagination"]
+    assert "next_cursor" in json["success"]["pagination"]
     assert json["success"]["pagination"]["page"] == 1
     assert json["success"]["pagination"]["per_page"] == 5
     assert json["success"]["current_total"] == 0
+
+
+def test_read_courses_list_invalid_cursor(client):  # pylint: disable=redefined-outer-name
+    """Tests that server responds with invalid request error for malformed cursor."""
+    response = client.get("/courses/list?per_page=5&cursor=invalid")
+    assert response.status_code == 400
+
+    json = response.json()
+    assert "error" in json
+    assert "v" in json
+
+
+def test_read_courses_list_cursor_with_invalid_id(client):  # pylint: disable=redefined-outer-name
+    """Tests that server responds with invalid request error for cursor with non UUID course id."""
+    cursor = urlsafe_b64encode(
+        b'["published_at","2024-01-01T00:00:00+00:00","not-an-uuid"]'
+    ).decode()
+    response = client.get(f"/courses/list?per_page=5&cursor={cursor}")
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_read_courses_list_without_total(client):  # pylint: disable=redefined-outer-name
+    """Tests that server skips total for courses list method when not requested."""
+    response = client.get("/courses/list?page=1&per_page=5&include_total=false")
+    assert response.status_code == 200
+
+    json = response.json()
+    assert "success" in json
+    assert json["success"]["pagination"]["total"] is None
+    assert json["success"]["pagination"]["max_page"] is None
@@ -0,0 +1,30 @@
+"""
+    Tests revoked tokens Bloom filter.
+"""
+
+from app.tokens import AccessToken, BloomFilter
+
+KEY = "test-key"
+
+
+def test_bloom_filter_no_false_negatives():
+    """Tests that added items are always found, and most of others are not."""
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [f"added-{index}" for index in range(1000)]
+    for item in added:
+        bloom_filter.add(item)
+
+    assert all(item in bloom_filter for item in added)
+    false_positives = sum(f"other-{index}" in bloom_filter for index in range(10_000))
+    assert false_positives < 300
+
+
+def test_access_token_id_claim():
+    """Tests that access tokens has unique ID available in verified claims."""
+    first = AccessToken("localhost", 60, "user-id").encode(key=KEY)
+    second = AccessToken("localhost", 60, "user-id").encode(key=KEY)
+
+    first_id = AccessToken.verify_fast(first, KEY).token_id
+    assert first_id is not None
+    assert first_id != AccessToken.verify_fast(second, KEY).token_id
+    assert AccessToken.decode(first, key=KEY).get_token_id() == first_id
@@ -0,0 +1,65 @@
+"""
+    Tests verified tokens cache.
+"""
+
+import time
+
+from app.tokens import AccessToken, VerifiedClaims, VerifiedTokensCache
+
+KEY = "test-key"
+
+
+def test_verified_tokens_cache_hit():
+    """Tests that token is decoded once and then served from cache."""
+    cache = VerifiedTokensCache(max_size=10)
+    token = AccessToken("localhost", 60, "user-id").encode(key=KEY)
+
+    first = AccessToken.decode(token, key=KEY, cache=cache)
+    second = AccessToken.decode(token, key=KEY, cache=cache)
+    assert first.get_user_id() == second.get_user_id() == "user-id"
+    assert cache.decodes == 1
+    assert cache.hits == 1
+
+
+def test_verified_tokens_cache_expired_and_other_key():
+    """Tests that cache does not serve expired tokens, or tokens verified with other key."""
+    cache = VerifiedTokensCache(max_size=10)
+    token = AccessToken("localhost", 60, "user-id").encode(key=KEY)
+    cache.put(token, KEY, _claims(expires_at=time.time() - 1))
+    assert cache.get(token, KEY) is None
+    assert cache.expired == 1
+
+    cache.put(token, KEY, _claims(expires_at=time.time() + 60))
+    assert cache.get(token, "other-key") is None
+
+
+def test_verify_fast():
+    """Tests that fast verification returns claims, and shares cache with decode."""
+    cache = VerifiedTokensCache(max_size=10)
+    token = AccessToken("localhost", 60, "user-id", role_id=1).encode(key=KEY)
+
+    claims = AccessToken.verify_fast(token, KEY, cache=cache)
+    assert claims.subject == "user-id"
+    assert claims.role_id == 1
+    assert AccessToken.verify_fast(token, KEY, cache=cache) is claims
+    assert AccessToken.decode(token, key=KEY, cache=cache).get_role_id() == 1
+    assert cache.decodes == 1
+
+
+def test_decode_caches_verified_claims():
+    """Tests that decode caches same claims as fast verification (shared by both)."""
+    cache = VerifiedTokensCache(max_size=10)
+    token = AccessToken("localhost", 60, "user-id").encode(key=KEY)
+
+    AccessToken.decode(token, key=KEY, cache=cache)
+    claims = cache.get(token, KEY)
+    assert isinstance(claims, VerifiedClaims)
+    assert AccessToken.verify_fast(token, KEY, cache=cache) is claims
+    assert cache.decodes == 1
+
+
+def _claims(expires_at: float) -> VerifiedClaims:
+    """Returns claims of token that expires at given time."""
+    return VerifiedClaims(
+        {"sub": "user-id", "iss": "localhost", "iat": time.time(), "exp": expires_at}
+    )
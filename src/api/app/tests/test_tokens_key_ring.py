@@ -0,0 +1,33 @@
+"""
+    Tests tokens key ring (key rotation).
+"""
+
+import pytest
+
+from app.tokens import AccessToken, KeyRing, SigningKey, exceptions
+
+
+def test_key_ring_rotation():
+    """Tests that tokens signed with previous key are accepted after rotation."""
+    old_ring = KeyRing(SigningKey("old", "HS256", "old-secret"))
+    new_ring = KeyRing(
+        SigningKey("new", "HS256", "new-secret"),
+        previous=[SigningKey("old", "HS256", "old-secret")],
+    )
+    old_token = AccessToken("localhost", 60, "user-id").encode(key=old_ring)
+    new_token = AccessToken("localhost", 60, "user-id").encode(key=new_ring)
+
+    assert AccessToken.verify_fast(old_token, new_ring).subject == "user-id"
+    assert AccessToken.decode(new_token, key=new_ring).get_user_id() == "user-id"
+    with pytest.raises(exceptions.TokenInvalidSignatureError):
+        AccessToken.verify_fast(new_token, old_ring)
+
+
+def test_key_ring_token_without_key_id():
+    """Tests that tokens signed with plain key (without `kid`) are verified with current key."""
+    ring = KeyRing(SigningKey("default", "HS256", "secret"))
+    token = AccessToken("localhost", 60, "user-id").encode(key="secret")
+
+    assert AccessToken.verify_fast(token, ring).subject == "user-id"
+    with pytest.raises(exceptions.TokenInvalidSignatureError):
+        AccessToken.verify_fast(token, KeyRing(SigningKey("default", "HS256", "other")))
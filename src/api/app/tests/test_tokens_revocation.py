@@ -0,0 +1,98 @@
+"""
+    Tests tokens revocation (against fakeredis).
+"""
+
+import asyncio
+import time
+
+import aioredis
+import fakeredis
+import pytest
+from fakeredis import aioredis as fakeredis_aioredis
+
+from app.config import get_settings
+from app.services import tokens_revocation
+from app.tokens import VerifiedClaims
+
+
+class _UnavailableRedis:
+    """Redis that is down."""
+
+    async def zscore(self, *_):
+        raise aioredis.ConnectionError("Redis is unavailable!")
+
+
+@pytest.fixture(name="redis")
+def fixture_redis(monkeypatch):
+    """Returns fake Redis used by revocation, with filter not loaded."""
+    redis = fakeredis_aioredis.FakeRedis(
+        server=fakeredis.FakeServer(), decode_responses=True
+    )
+    monkeypatch.setattr(tokens_revocation, "get_redis", lambda: redis)
+    monkeypatch.setattr(tokens_revocation, "_filter", None)
+    return redis
+
+
+def test_revoke(redis):
+    """Tests that revoked token is rejected, and others are answered by filter."""
+
+    async def run() -> tuple[bool, bool, bool]:
+        await tokens_revocation._load_filter()
+        await tokens_revocation.revoke("revoked-id", time.time() + 60)
+        assert await redis.zscore("tokens-revocation:revoked", "revoked-id")
+        return (
+            await tokens_revocation.is_revoked(_claims("revoked-id")),
+            await tokens_revocation.is_revoked(_claims("other-id")),
+            # Tokens without ID can not be revoked.
+            await tokens_revocation.is_revoked(_claims(None)),
+        )
+
+    assert asyncio.run(run()) == (True, False, False)
+
+
+def test_load_filter(redis):
+    """Tests that filter is loaded with not expired tokens, and expired ones are dropped."""
+
+    async def run() -> list[str]:
+        await redis.zadd(
+            "tokens-revocation:revoked",
+            {"expired-id": time.time() - 1, "revoked-id": time.time() + 60},
+        )
+        await tokens_revocation._load_filter()
+        return await redis.zrange("tokens-revocation:revoked", 0, -1)
+
+    assert asyncio.run(run()) == ["revoked-id"]
+    assert "revoked-id" in tokens_revocation._filter
+    assert "expired-id" not in tokens_revocation._filter
+
+
+def test_is_revoked_redis_unavailable(redis, monkeypatch):
+    """Tests that only filter hits are rejected when Redis is unavailable."""
+
+    async def run() -> list[bool]:
+        await tokens_revocation.revoke("revoked-id", time.time() + 60)
+        await tokens_revocation._load_filter()
+        monkeypatch.setattr(tokens_revocation, "get_redis", _UnavailableRedis)
+        results = [
+            await tokens_revocation.is_revoked(_claims("revoked-id")),
+            await tokens_revocation.is_revoked(_claims("other-id")),
+        ]
+
+        # Filter is not loaded, so nothing is known about the token.
+        monkeypatch.setattr(tokens_revocation, "_filter", None)
+        results.append(await tokens_revocation.is_revoked(_claims("revoked-id")))
+        monkeypatch.setattr(
+            get_settings(), "security_tokens_revocation_fail_open", False
+        )
+        results.append(await tokens_revocation.is_revoked(_claims("revoked-id")))
+        return results
+
+    # Filter hit, filter miss, not loaded (fail open), not loaded (fail closed).
+    assert asyncio.run(run()) == [True, False, False, True]
+
+
+def _claims(token_id: str | None) -> VerifiedClaims:
+    """Returns claims of token with given ID."""
+    return VerifiedClaims(
+        {"sub": "user-id", "iss": "localhost", "iat": time.time(), "jti": token_id}
+    )
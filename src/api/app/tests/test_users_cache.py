@@ -0,0 +1,55 @@
+"""
+    Tests authenticated users cache invalidation (against fakeredis).
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fakeredis_aioredis
+
+from app.services import cache, permissions, users_cache
+from app.services.users_cache import CachedUser
+
+
+@pytest.fixture(name="redis")
+def fixture_redis(monkeypatch):
+    """Returns fake Redis used by users cache, with local cache cleared."""
+    redis = fakeredis_aioredis.FakeRedis(
+        server=fakeredis.FakeServer(), decode_responses=True
+    )
+    monkeypatch.setattr(users_cache, "get_redis", lambda: redis)
+    monkeypatch.setattr(cache, "_get_pubsub_redis", lambda: redis)
+    monkeypatch.setattr(users_cache, "_local", type(users_cache._local)())
+    return redis
+
+
+def test_invalidate_all(redis):
+    """Tests that all users are removed from cache (in Redis, and local)."""
+
+    async def run() -> list[str]:
+        for user_id in ("first", "second"):
+            user = CachedUser(id=user_id, email=f"{user_id}@example.com", role_id=1)
+            users_cache._put_local(user)
+            await redis.set(f"users-cache:{user_id}", user.dumps())
+        await redis.set("other", "kept")
+        await users_cache.invalidate_all()
+        return sorted(await redis.keys("*"))
+
+    assert asyncio.run(run()) == ["other"]
+    assert not users_cache._local
+
+
+def test_roles_changed_clears_local(redis):
+    """Tests that local cache is cleared when roles change is announced."""
+
+    async def run() -> int:
+        await users_cache.on_startup()
+        await asyncio.sleep(0.1)  # Subscribed.
+        users_cache._put_local(CachedUser(id="user", email="user@example.com", role_id=1))
+        await redis.publish(permissions.ROLES_CHANGED_CHANNEL, "changed")
+        await asyncio.sleep(0.1)
+        await users_cache.on_shutdown()
+        return len(users_cache._local)
+
+    assert asyncio.run(run()) == 0
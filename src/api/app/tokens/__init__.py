@@ -8,10 +8,19 @@
 
 from .base_token import BaseToken
 from .access_token import AccessToken
+from .cache import VerifiedTokensCache
+from .bloom_filter import BloomFilter
+from .key_ring import KeyRing, SigningKey
+from .verified_claims import VerifiedClaims
 from . import exceptions
 
 __all__ = [
     "BaseToken",
     "AccessToken",
+    "VerifiedTokensCache",
+    "VerifiedClaims",
+    "BloomFilter",
+    "KeyRing",
+    "SigningKey",
     "exceptions"
 ]
\ No newline at end of file
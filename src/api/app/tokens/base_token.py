@@ -7,10 +7,14 @@
 
 
 import time  # Utils for expiration dates.
+from types import MappingProxyType
 
 import jwt  # Library with base JWT implementation.
 
 from . import exceptions
+from .cache import VerifiedTokensCache
+from .key_ring import KeyRing
+from .verified_claims import VerifiedClaims
 
 
 class BaseToken:
@@ -34,10 +38,9 @@ class BaseToken:
     # You should use this field with injecting own fields there on overriding token encoding.
     custom_payload: dict = {}
 
-    # JWT signing algorithm. Used by JWT library to sign tokens.
-    # May be: HS(256|384|512) for HMAC SHA,
-    # or one of crypto algorithms: RSA/EC/RSAPSS/OKPA.
-    # Notice that using asymmetric algorithm is more secure but not implemented yet.
+    # JWT signing algorithm. Used by JWT library to sign tokens with string key.
+    # May be: HS(256|384|512) for HMAC SHA.
+    # Keys from key ring (`KeyRing`) are signed with their own algorithm (may be asymmetric).
     _signing_algorithm: str = "HS256"
 
     # Totally raw token payload, being set when decoding token (should be empty with encoding operation),
@@ -52,9 +55,9 @@ class BaseToken:
     # Token additional headers (JWT headers), not supposed to use mostly.
     _custom_headers: dict = {}
 
-    # Secret key for signing actual token.
+    # Secret key (or key ring) for signing actual token.
     # Should not be modified directly as it will be updated automatically.
-    _key: str | None = None
+    _key: str | KeyRing | None = None
 
     # Core type of the token.
     # Should be individual for each token class, as there is validation for token type,
@@ -72,14 +75,16 @@ class BaseToken:
     _expires_at: float = 0
     _issued_at: float = 0
 
-    def get_key(self) -> str | None:
-        """Returns secret key or None if not set."""
+    def get_key(self) -> str | KeyRing | None:
+        """Returns secret key (or key ring) or None if not set."""
         return self._key
 
-    def set_key(self, key: str | None) -> None:
-        """Sets secret key or removes it."""
-        if not isinstance(key, str | None):
-            raise TypeError("Key must be a string or None for clearing the key")
+    def set_key(self, key: str | KeyRing | None) -> None:
+        """Sets secret key (or key ring) or removes it."""
+        if not isinstance(key, str | KeyRing | None):
+            raise TypeError(
+                "Key must be a string, key ring or None for clearing the key"
+            )
         self._key = key
 
     def get_raw_payload(self) -> dict | None:
@@ -111,7 +116,7 @@ class BaseToken:
         """Returns true if token was decoded with checking the signature."""
         return self._signature_is_valid
 
-    def encode(self, *, key: str | None = None):
+    def encode(self, *, key: str | KeyRing | None = None):
         """
         Encodes token into JWT string.
         You are supposed to inherit inside own class and
@@ -138,8 +143,8 @@ class BaseToken:
             )
 
         # Arguments.
-        if not isinstance(self._key, str):
-            raise TypeError("Key should be a string")
+        if not isinstance(self._key, str | KeyRing):
+            raise TypeError("Key should be a string or key ring")
         if not isinstance(self._subject, str):
             raise TypeError("Unexpected subject data type!")
         if not isinstance(self._issuer, str):
@@ -149,7 +154,9 @@ class BaseToken:
 
         # Get current time as time, when token was issued,
         # for IAT field and calculating EXP field with TTL.
-        issued_at = time.time()
+        # Whole seconds, as JWT library compares IAT with current time in whole seconds,
+        # and token would be rejected as not yet valid within the second it was issued.
+        issued_at = int(time.time())
 
         # Generate payload.
         payload = {
@@ -166,18 +173,31 @@ class BaseToken:
             # time when token was created (now) (timestamp, in seconds) and adding it TTL in seconds.
             payload["exp"] = issued_at + self._ttl
 
+        # Current key of the key ring, with it`s ID in headers (to select key when decoding).
+        key, algorithm = self._key, self._signing_algorithm
+        headers = self._custom_headers
+        if isinstance(key, KeyRing):
+            headers = headers | {"kid": key.current.kid}
+            key, algorithm = key.current.signing_key, key.current.algorithm
+
         # Encoding final JWT for payload/headers with secret key.
         token = jwt.encode(
-            key=self._key,
+            key=key,
             payload=payload,
-            headers=self._custom_headers,
-            algorithm=self._signing_algorithm,
+            headers=headers,
+            algorithm=algorithm,
             json_encoder=None,
         )
         return token
 
     @classmethod
-    def decode(cls, token: str, key: str | None = None):
+    def decode(
+        cls,
+        token: str,
+        key: str | KeyRing | None = None,
+        *,
+        cache: VerifiedTokensCache | None = None,
+    ):
         """
         Decodes token from JWT string.
         You are supposed to inherit inside own class and
@@ -188,10 +208,25 @@ class BaseToken:
             instance._custom_field = "myfield"
             return instance
         ```
+        :param cache: Verified tokens cache, if passed token is decoded only if not cached
+        (only tokens with signature verified by key are cached).
         """
 
-        # Decoding token.
-        payload = cls._decode_payload(token, key)
+        # Decoding token (or taking already verified claims from cache).
+        payload = None
+        if cache is not None and key is not None:
+            claims = cache.get(token, key)
+            if claims is not None:
+                payload = claims.raw
+                cls._check_payload_type(payload)
+        if payload is None:
+            decode_started_at = time.perf_counter()
+            payload = cls._decode_payload(token, key)
+            if cache is not None and key is not None:
+                cache.observe_decode(time.perf_counter() - decode_started_at)
+                claims = VerifiedClaims(MappingProxyType(payload))
+                cache.put(token, key, claims)
+                payload = claims.raw
 
         # Get token time-to-live (TTL).
         issued_at = float(payload["iat"])
@@ -237,7 +272,7 @@ class BaseToken:
     def _decode_payload(
         cls,
         token: str,
-        key: str | None = None,
+        key: str | KeyRing | None = None,
         *,
         _always_verify_signature: bool = False,
     ):
@@ -257,7 +292,12 @@ class BaseToken:
             token=token, key=key, verify_signature=verify_signature
         )
 
-        # Checking token types.
+        cls._check_payload_type(payload)
+        return payload
+
+    @classmethod
+    def _check_payload_type(cls, payload: dict) -> None:
+        """Checks that token payload has type of that token class."""
         expected_type = cls._type
         got_type = payload.get("typ", "")
         if got_type != expected_type:
@@ -266,11 +306,12 @@ class BaseToken:
                 f"Expected token type to be {expected_type}, but got {got_type}"
             )
 
-        return payload
-
     @classmethod
     def _decode_jwt_exception_wrapped(
-        cls, token: str, key: str | None = None, verify_signature: bool = True
+        cls,
+        token: str,
+        key: str | KeyRing | None = None,
+        verify_signature: bool = True,
     ) -> dict[str, any]:
         """
         Decodes JWT with wrapped exceptions (library exceptions, raised as core exceptions),
@@ -278,12 +319,17 @@ class BaseToken:
         :param _always_verify_signature: if True, will always verify signature even when key is none.
         """
         decode_options = {"verify_signature": verify_signature}
+        algorithms = [cls._signing_algorithm]
+        if isinstance(key, KeyRing):
+            # Prepared key selected by token key ID (header).
+            signing_key = key.get_verifying_key(token)
+            key, algorithms = signing_key.verifying_key, [signing_key.algorithm]
         try:
             return jwt.decode(
                 jwt=token,
                 key=key,
                 options=decode_options,
-                algorithms=cls._signing_algorithm,
+                algorithms=algorithms,
             )
         except jwt.exceptions.InvalidSignatureError as invalid_signature_error:
             # Raised when token can be decoded but the signature is invalid.
@@ -307,7 +353,7 @@ class BaseToken:
         subject: str,
         payload: dict | None = None,
         *,
-        key: str | None = None,
+        key: str | KeyRing | None = None,
     ):
         """
         Base token constructor.
@@ -326,6 +372,8 @@ class BaseToken:
 
         # Payload base.
         self.custom_payload = payload if payload is not None else {}
+        # Own headers, as class level ones are shared between instances.
+        self._custom_headers = {}
 
         # Fields.
         self._issuer = issuer
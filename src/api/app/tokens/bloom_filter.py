@@ -0,0 +1,53 @@
+"""
+    Bloom filter of token IDs.
+    Used to check that token is NOT revoked without querying shared storage,
+    only (rare) positive answers should be confirmed with the storage.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Probabilistic set of strings: `in` may return false positive (with given error rate),
+    but never false negative. Items can not be removed, filter should be rebuilt instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        :param capacity: Expected count of items, error rate grows when it is exceeded.
+        :param error_rate: Expected false positive rate at capacity.
+        """
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive!")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1!")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, item: str) -> None:
+        """Adds item to the filter."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """Returns true if item may be in the filter, false if it is definitely not."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def _positions(self, item: str):
+        """Yields bit positions of the item (double hashing of single digest)."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(
+            digest[8:], "little"
+        )
+        for index in range(self.hashes_count):
+            yield (first + index * second) % self.size
@@ -0,0 +1,105 @@
+"""
+    API tokens verified claims cache.
+    Allows to skip decoding (signature verification, parsing) of the same token again and again.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from .key_ring import KeyRing
+from .verified_claims import VerifiedClaims
+
+
+class VerifiedTokensCache:
+    """
+    Bounded LRU cache of verified tokens claims, keyed by digest of the token.
+    Claims are cached as immutable `VerifiedClaims` (with read-only raw payload),
+    for both fast verification and decoding, so entries has same shape for any path.
+    Entries are evicted when token expires (`exp`), and only served for the same key
+    they were verified with.
+    Notice that revocation is not checked there, caller should check it on each use of the token
+    (including cache hits), and may `evict` revoked token.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """
+        :param max_size: Max count of cached tokens.
+        """
+        self.max_size = max_size
+        # Token digest -> (key or key ring, claims).
+        self._entries: OrderedDict[
+            bytes, tuple[str | KeyRing, VerifiedClaims]
+        ] = OrderedDict()
+
+        # Metrics.
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.decodes = 0
+        self.decode_time_total = 0.0
+
+    def get(self, token: str, key: str | KeyRing) -> VerifiedClaims | None:
+        """Returns verified claims of the token, or None if not cached or expired."""
+        digest = self._digest(token)
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        verified_with_key, claims = entry
+        if claims.expires_at is not None and claims.expires_at <= time.time():
+            del self._entries[digest]
+            self.expired += 1
+            self.misses += 1
+            return None
+        if verified_with_key != key:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(digest)
+        return claims
+
+    def put(self, token: str, key: str | KeyRing, claims: VerifiedClaims) -> None:
+        """Caches verified claims of the token (until it expires, `exp`)."""
+        digest = self._digest(token)
+        self._entries[digest] = (key, claims)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def evict(self, token: str) -> None:
+        """Removes token from cache (for example, when it is revoked)."""
+        self._entries.pop(self._digest(token), None)
+
+    def clear(self) -> None:
+        """Removes all tokens from cache."""
+        self._entries.clear()
+
+    def observe_decode(self, decode_time: float) -> None:
+        """Records time spent on decoding token that is not cached."""
+        self.decodes += 1
+        self.decode_time_total += decode_time
+
+    def get_metrics(self) -> dict:
+        """Returns cache metrics (hit rate, decode time)."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "decodes": self.decodes,
+            "decode_time": {
+                "total": self.decode_time_total,
+                "avg": self.decode_time_total / self.decodes if self.decodes else 0.0,
+            },
+        }
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Returns digest of the token, used as key (to not keep tokens itself in memory)."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
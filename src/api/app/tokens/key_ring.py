@@ -0,0 +1,117 @@
+"""
+    API tokens key ring.
+    Holds signing keys by their ID (`kid` JWT header), prepared once (parsed, not on each token),
+    allows to rotate keys without invalidating tokens signed with previous (still accepted) keys.
+    Asymmetric algorithms (RS*/PS*/ES*/EdDSA) requires `cryptography` to be installed,
+    and allows other services to verify tokens with public keys (JWKS).
+"""
+
+import json
+
+import jwt
+from jwt.algorithms import get_default_algorithms
+from jwt.utils import base64url_encode
+
+from . import exceptions
+
+_ALGORITHMS = get_default_algorithms()
+
+
+class SigningKey:
+    """Immutable prepared key (with it`s ID and algorithm)."""
+
+    __slots__ = ("kid", "algorithm", "signing_key", "verifying_key", "header")
+
+    def __init__(self, kid: str, algorithm: str, key: str) -> None:
+        """
+        :param key: Secret for HMAC algorithms, or PEM private (or public, only to verify) key.
+        """
+        if algorithm not in _ALGORITHMS:
+            raise ValueError(
+                f"Unsupported (or requires `cryptography`) algorithm {algorithm}!"
+            )
+        algorithm_object = _ALGORITHMS[algorithm]
+        try:
+            prepared_key = algorithm_object.prepare_key(key)
+        except jwt.exceptions.InvalidKeyError as invalid_key_error:
+            raise ValueError(f"Invalid key {kid}!") from invalid_key_error
+
+        # Asymmetric keys: public key is used to verify, private key (if given) to sign.
+        is_private = hasattr(prepared_key, "public_key")
+        verifying_key = prepared_key.public_key() if is_private else prepared_key
+        is_symmetric = isinstance(prepared_key, bytes)
+        signing_key = prepared_key if is_symmetric or is_private else None
+
+        object.__setattr__(self, "kid", kid)
+        object.__setattr__(self, "algorithm", algorithm)
+        object.__setattr__(self, "signing_key", signing_key)
+        object.__setattr__(self, "verifying_key", verifying_key)
+        # Encoded JWT header of tokens signed by that key (same as JWT library encodes it).
+        header = {"alg": algorithm, "kid": kid, "typ": "JWT"}
+        object.__setattr__(
+            self,
+            "header",
+            base64url_encode(
+                json.dumps(header, separators=(",", ":"), sort_keys=True).encode()
+            ).decode(),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Signing key is immutable!")
+
+    def is_symmetric(self) -> bool:
+        """Returns true if key is shared secret (HMAC), and should never be exposed."""
+        return isinstance(self.verifying_key, bytes)
+
+    def get_public_jwk(self) -> dict:
+        """Returns public key as JWK (only for asymmetric keys)."""
+        if self.is_symmetric():
+            raise ValueError("Symmetric keys can not be exposed!")
+        jwk = json.loads(_ALGORITHMS[self.algorithm].to_jwk(self.verifying_key))
+        return jwk | {"kid": self.kid, "alg": self.algorithm, "use": "sig"}
+
+
+class KeyRing:
+    """
+    Signing keys by ID: current key signs new tokens,
+    any key verifies tokens (by `kid` header) signed with it.
+    Tokens without `kid` (issued before key ring) are verified with current key.
+    """
+
+    def __init__(self, current: SigningKey, previous: list[SigningKey] | None = None):
+        """
+        :param current: Key to sign new tokens with (and to verify).
+        :param previous: Keys to verify tokens only (rotated out, until their tokens expire).
+        """
+        if current.signing_key is None:
+            raise ValueError("Current key should be able to sign (private key)!")
+        self.current = current
+        self._keys = {key.kid: key for key in previous or []} | {current.kid: current}
+        self._keys_by_header = {key.header: key for key in self._keys.values()}
+
+    def get_verifying_key(self, token: str) -> SigningKey:
+        """Returns key that should verify given token (by it`s header)."""
+        key = self._keys_by_header.get(token.partition(".")[0])
+        if key is not None:
+            return key
+
+        # Header is not encoded as ours (token without `kid`, or not issued by us).
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.exceptions.PyJWTError as py_jwt_error:
+            raise exceptions.TokenInvalidError from py_jwt_error
+        kid = header.get("kid")
+        key = self.current if kid is None else self._keys.get(kid)
+        if key is None:
+            raise exceptions.TokenInvalidSignatureError(f"Unknown key {kid}!")
+        return key
+
+    def get_public_jwks(self) -> dict:
+        """Returns public (asymmetric) keys as JWK set, for other services to verify tokens."""
+        return {
+            "keys": [
+                key.get_public_jwk()
+                for key in self._keys.values()
+                if not key.is_symmetric()
+            ]
+        }
@@ -0,0 +1,32 @@
+"""
+    API tokens verified claims.
+    Compact result of the fast token verification (without building token object).
+"""
+
+from typing import Mapping
+
+
+class VerifiedClaims:
+    """
+    Immutable claims of the verified token (signature, type and expiration are checked).
+    Holds only fields required for authentication, and raw (read-only) payload for anything else.
+    """
+
+    __slots__ = ("subject", "issuer", "issued_at", "expires_at", "role_id", "token_id", "raw")
+
+    def __init__(self, payload: Mapping) -> None:
+        """
+        :param payload: Verified token payload, should not be modified after.
+        """
+        object.__setattr__(self, "subject", payload["sub"])
+        object.__setattr__(self, "issuer", payload["iss"])
+        object.__setattr__(self, "issued_at", float(payload["iat"]))
+        object.__setattr__(
+            self, "expires_at", float(payload["exp"]) if "exp" in payload else None
+        )
+        object.__setattr__(self, "role_id", payload.get("role_id"))
+        object.__setattr__(self, "token_id", payload.get("jti"))
+        object.__setattr__(self, "raw", payload)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Verified claims are immutable!")
@@ -0,0 +1,4 @@
+"""
+    Benchmarks of the hot API paths against local database.
+    Run from API root directory, e.g: `python -m benchmarks.bench_course_lectures`.
+"""
@@ -0,0 +1,68 @@
+"""
+    Benchmark utils.
+"""
+
+import asyncio
+import time
+from statistics import quantiles
+from typing import Awaitable, Callable
+
+
+async def measure_async(
+    func: Callable[[], Awaitable], iterations: int, warmup: int = 10
+) -> list[float]:
+    """Returns latencies (in seconds) of awaiting given function for each iteration."""
+    for _ in range(warmup):
+        await func()
+
+    latencies = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await func()
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+def measure(
+    func: Callable[[], object], iterations: int, warmup: int = 10
+) -> list[float]:
+    """Returns latencies (in seconds) of calling given function for each iteration."""
+    for _ in range(warmup):
+        func()
+
+    latencies = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+async def measure_concurrent_async(
+    func: Callable[[], Awaitable], clients: int, iterations: int, warmup: int = 10
+) -> tuple[list[float], float]:
+    """
+    Returns latencies (in seconds) of awaiting given function by concurrent clients
+    (each for given iterations), and total elapsed time.
+    """
+    await asyncio.gather(*[measure_async(func, 0, warmup) for _ in range(clients)])
+    started_at = time.perf_counter()
+    latencies = await asyncio.gather(
+        *[measure_async(func, iterations, warmup=0) for _ in range(clients)]
+    )
+    elapsed = time.perf_counter() - started_at
+    return [latency for client in latencies for latency in client], elapsed
+
+
+def report(name: str, latencies: list[float], elapsed: float | None = None) -> None:
+    """
+    Prints p50/p99 of latencies and throughput.
+    :param elapsed: Total time of concurrent run, throughput is sequential if not set.
+    """
+    percentiles = quantiles(latencies, n=100)
+    total = elapsed if elapsed is not None else sum(latencies)
+    print(
+        f"{name:<40} p50 {percentiles[49] * 1000:8.3f}ms "
+        f"p99 {percentiles[98] * 1000:8.3f}ms "
+        f"{len(latencies) / total:8.0f} ops/s (n={len(latencies)})"
+    )
@@ -0,0 +1,103 @@
+"""
+    Benchmarks course lectures listing with access check:
+    sequential course / lectures / purchase queries versus single combined query.
+"""
+
+import asyncio
+import sys
+
+from app.database import crud
+from app.database.core import AsyncSessionLocal, SessionLocal
+from app.database.models.course import Course, CourseDifficulty
+from app.database.models.course_lecture import CourseLecture
+from app.database.models.user import User
+from app.database.models.user_course import UserCourse
+from app.database.models.user_role import UserRole
+
+from ._utils import measure_async, report
+
+
+def _seed(lectures_count: int) -> tuple[int, str, str]:
+    """Seeds non-public course with lectures, purchased by user, returns IDs."""
+    with SessionLocal() as session:
+        role = UserRole(name="bench-course-lectures")
+        session.add(role)
+        session.flush()
+        user = User(sso_oauth_user_id=-1, email="bench@lectures.test", role_id=role.id)
+        session.add(user)
+        session.flush()
+        course = Course(
+            name="bench-course-lectures",
+            title="Benchmark",
+            difficulty=CourseDifficulty.easy.value,
+            owner_id=user.id,
+            is_public=False,
+        )
+        session.add(course)
+        session.flush()
+        session.add_all(
+            [
+                CourseLecture(course_id=course.id, title=f"Lecture {i}")
+                for i in range(lectures_count)
+            ]
+            + [UserCourse(user_id=user.id, course_id=course.id, purchased_for=0)]
+        )
+        session.commit()
+        return role.id, user.id, course.id
+
+
+def _cleanup(role_id: int, user_id: str, course_id: str) -> None:
+    """Removes seeded rows."""
+    with SessionLocal() as session:
+        for model, condition in (
+            (UserCourse, UserCourse.course_id == course_id),
+            (CourseLecture, CourseLecture.course_id == course_id),
+            (Course, Course.id == course_id),
+            (User, User.id == user_id),
+            (UserRole, UserRole.id == role_id),
+        ):
+            session.query(model).filter(condition).delete()
+        session.commit()
+
+
+async def _sequential(user_id: str, course_id: str) -> None:
+    """Previous path: course, lectures and purchase check as separate queries."""
+    async with AsyncSessionLocal() as db:
+        course = await crud.course.get_by_id_async(db, course_id)
+        await crud.course_lecture.get_by_course_id_async(db, course_id=course.id)
+        await crud.user_course.get_by_user_id_and_course_id_async(
+            db, user_id=user_id, course_id=course.id
+        )
+
+
+async def _combined(user_id: str, course_id: str) -> None:
+    """Current path: single combined query."""
+    async with AsyncSessionLocal() as db:
+        await crud.course_lecture.get_course_with_lectures_async(
+            db, user_id=user_id, course_id=course_id
+        )
+
+
+async def main(iterations: int, lectures_count: int) -> None:
+    """Runs benchmark."""
+    role_id, user_id, course_id = _seed(lectures_count)
+    try:
+        report(
+            "course lectures (sequential queries)",
+            await measure_async(lambda: _sequential(user_id, course_id), iterations),
+        )
+        report(
+            "course lectures (combined query)",
+            await measure_async(lambda: _combined(user_id, course_id), iterations),
+        )
+    finally:
+        _cleanup(role_id, user_id, course_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(
+            iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+            lectures_count=int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        )
+    )
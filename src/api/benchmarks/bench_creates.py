@@ -0,0 +1,87 @@
+"""
+    Benchmarks insert throughput of CRUD create:
+    commit and refresh (previous) versus commit with values returned by INSERT.
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy import delete
+
+from app.database import crud
+from app.database.core import AsyncSessionLocal, SessionLocal
+from app.database.models.course import Course, CourseDifficulty
+from app.database.models.course_lecture import CourseLecture
+from app.database.models.user import User
+from app.database.models.user_role import UserRole
+
+from ._utils import measure_async, report
+
+
+def _seed() -> tuple[int, str, str]:
+    """Seeds course to create lectures for, returns IDs."""
+    with SessionLocal() as session:
+        role = UserRole(name="bench-creates")
+        session.add(role)
+        session.flush()
+        user = User(sso_oauth_user_id=-3, email="bench@creates.test", role_id=role.id)
+        session.add(user)
+        session.flush()
+        course = Course(
+            name="bench-creates",
+            title="Benchmark",
+            difficulty=CourseDifficulty.easy.value,
+            owner_id=user.id,
+        )
+        session.add(course)
+        session.commit()
+        return role.id, user.id, course.id
+
+
+def _cleanup(role_id: int, user_id: str, course_id: str) -> None:
+    """Removes seeded and created rows."""
+    with SessionLocal() as session:
+        session.execute(
+            delete(CourseLecture).where(CourseLecture.course_id == course_id)
+        )
+        session.execute(delete(Course).where(Course.id == course_id))
+        session.execute(delete(User).where(User.id == user_id))
+        session.execute(delete(UserRole).where(UserRole.id == role_id))
+        session.commit()
+
+
+async def _create_with_refresh(course_id: str) -> None:
+    """Previous path: add, commit and refresh (extra SELECT)."""
+    async with AsyncSessionLocal() as db:
+        course_lecture = CourseLecture(course_id=course_id, title="Benchmark")
+        db.add(course_lecture)
+        await db.commit()
+        await db.refresh(course_lecture)
+
+
+async def _create(course_id: str) -> None:
+    """Current path: generated values are returned with INSERT."""
+    async with AsyncSessionLocal() as db:
+        await crud.course_lecture.create_async(
+            db, course_id=course_id, title="Benchmark"
+        )
+
+
+async def main(iterations: int) -> None:
+    """Runs benchmark."""
+    role_id, user_id, course_id = _seed()
+    try:
+        report(
+            "create (commit + refresh)",
+            await measure_async(lambda: _create_with_refresh(course_id), iterations),
+        )
+        report(
+            "create (INSERT ... RETURNING)",
+            await measure_async(lambda: _create(course_id), iterations),
+        )
+    finally:
+        _cleanup(role_id, user_id, course_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -0,0 +1,71 @@
+"""
+    Benchmarks requests limiter overhead per request, with growing count of application routes.
+    Uses in-process Redis stand-in (returns "not limited"), so only limiter itself is measured.
+"""
+
+import asyncio
+import sys
+
+from fastapi import Depends, FastAPI
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.services.limiter import FastAPILimiter, default_callback, default_identifier
+from app.services.limiter.depends import RateLimiter
+
+from ._utils import measure_async, report
+
+
+class _RedisStandIn:
+    """Redis client stand-in, that never limits."""
+
+    async def evalsha(self, *_) -> int:
+        return 0
+
+
+def _build_app(routes_count: int) -> tuple[FastAPI, RateLimiter, dict]:
+    """Returns application with given count of routes (last one is limited) and it`s scope."""
+    app = FastAPI()
+    for index in range(routes_count - 1):
+        app.add_api_route(f"/route-{index}", lambda: None)
+
+    limiter = RateLimiter(times=10, seconds=1)
+
+    async def limited_endpoint() -> None:
+        pass
+
+    app.add_api_route(
+        "/limited", limited_endpoint, dependencies=[Depends(limiter)]
+    )
+    scope = {
+        "type": "http",
+        "app": app,
+        "path": "/limited",
+        "endpoint": limited_endpoint,
+        "headers": [],
+        "client": ("127.0.0.1", 12345),
+    }
+    return app, limiter, scope
+
+
+async def main(iterations: int) -> None:
+    """Runs benchmark."""
+    FastAPILimiter.redis = _RedisStandIn()
+    FastAPILimiter.prefix = "bench-limiter"
+    FastAPILimiter.lua.sha = "bench"
+    FastAPILimiter.identifier = default_identifier
+    FastAPILimiter.callback = default_callback
+
+    for routes_count in (10, 100, 1000):
+        _, limiter, scope = _build_app(routes_count)
+        response = Response()
+        report(
+            f"RateLimiter ({routes_count} routes)",
+            await measure_async(
+                lambda: limiter(Request(scope), response), iterations
+            ),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
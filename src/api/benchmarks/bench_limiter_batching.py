@@ -0,0 +1,52 @@
+"""
+    Benchmarks requests limiter checks against Redis (`cache_dsn`) with concurrent clients:
+    each check sent separately versus checks batched into pipelines.
+"""
+
+import asyncio
+import sys
+
+import aioredis
+
+from app.config import get_settings
+from app.services.limiter import FastAPILimiter
+from app.services.limiter.batching import EvalshaBatcher
+
+from ._utils import measure_concurrent_async, report
+
+
+async def main(iterations: int) -> None:
+    """Runs benchmark."""
+    settings = get_settings()
+    redis = aioredis.from_url(
+        settings.cache_dsn, encoding=settings.cache_encoding, decode_responses=True
+    )
+    sha = await redis.script_load(FastAPILimiter.lua_script)
+    batcher = EvalshaBatcher(
+        redis,
+        window=settings.requests_limiter_batch_window / 1000,
+        max_size=settings.requests_limiter_batch_max_size,
+    )
+    # Limit is never reached, so each check does same work.
+    args = (sha, 1, "bench-limiter-batching", str(10**9), "60000")
+
+    for clients in (1, 10, 100):
+        report(
+            f"Limiter check, {clients} clients",
+            *await measure_concurrent_async(
+                lambda: redis.evalsha(*args), clients, iterations
+            ),
+        )
+        report(
+            f"Limiter check (batched), {clients} clients",
+            *await measure_concurrent_async(
+                lambda: batcher.evalsha(*args), clients, iterations
+            ),
+        )
+    print(f"Batching: {batcher.get_metrics()}")
+    await redis.delete("bench-limiter-batching")
+    await redis.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 1_000))
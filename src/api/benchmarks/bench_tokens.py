@@ -0,0 +1,44 @@
+"""
+    Benchmarks access token verification:
+    full `decode` (token object) versus `verify_fast` (verified claims), with and without cache.
+    Does not require database.
+"""
+
+import sys
+
+from app.tokens import AccessToken, KeyRing, SigningKey, VerifiedTokensCache
+
+from ._utils import measure, report
+
+KEY = "benchmark-secret-key"
+
+
+def main(iterations: int) -> None:
+    """Runs benchmark."""
+    token = AccessToken("localhost", 3600, "user-id", role_id=1).encode(key=KEY)
+    cache = VerifiedTokensCache()
+
+    report(
+        "AccessToken.decode",
+        measure(lambda: AccessToken.decode(token, key=KEY), iterations),
+    )
+    report(
+        "AccessToken.verify_fast",
+        measure(lambda: AccessToken.verify_fast(token, KEY), iterations),
+    )
+    key_ring = KeyRing(SigningKey("default", "HS256", KEY))
+    ring_token = AccessToken("localhost", 3600, "user-id", role_id=1).encode(
+        key=key_ring
+    )
+    report(
+        "AccessToken.verify_fast (key ring)",
+        measure(lambda: AccessToken.verify_fast(ring_token, key_ring), iterations),
+    )
+    report(
+        "AccessToken.verify_fast (cached)",
+        measure(lambda: AccessToken.verify_fast(token, KEY, cache=cache), iterations),
+    )
+
+
+if __name__ == "__main__":
+    main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -56,6 +56,7 @@ backlog = 2048  # Default, maximal, relates to high-load. (Limit for pending cli
 
 # Worker.
 # https://docs.gunicorn.org/en/latest/settings.html#worker-processes
+# Approximate requests limiter assumes that count (`REQUESTS_LIMITER_APPROXIMATE_WORKERS`).
 workers = 2 * cpu_count() + 1  # (Default: 1). Generally in range (2-4 x ${NUM_CORES}).
 worker_class = "uvicorn.workers.UvicornWorker"  # Not default, Uvicorn worker as we are using Uvicorn.
 worker_connections = 1000  # Not affects, due to worker type.